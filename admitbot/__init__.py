@@ -0,0 +1 @@
+"""Support modules for the Admit Bot Streamlit app."""
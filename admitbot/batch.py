@@ -0,0 +1,138 @@
+"""Batch Student Counseling: ranked recommendations for a whole applicant list.
+
+Reads an applicant CSV in chunks, scores each chunk in a worker process
+with the same engine as the Student Counseling page, and appends the
+ranked results to the output CSV as chunks finish (in input order). Only a
+few chunks per worker are in flight at once, so memory stays flat however
+long the input is.
+
+Input columns (header required; applicant_id is optional):
+    applicant_id,stream,percentage,interests,strengths,exam,exam_score
+where interests and strengths are ';'-separated, exam is one of
+None/JEE/NEET/CAT/Other, and exam_score may be blank.
+
+Output columns:
+    applicant_id,rank,stream,course,score
+
+Usage:
+    python -m admitbot.batch applicants.csv recommendations.csv [--workers N] [--top 3]
+"""
+import argparse
+import csv
+import io
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from admitbot.catalog import CATALOG_PATH, load_catalog
+from admitbot.recommend import STUDENT_STREAMS, Profile, Recommender
+
+CHUNK_ROWS = 2000
+OUTPUT_COLUMNS = ["applicant_id", "rank", "stream", "course", "score"]
+
+_recommender = None
+
+
+def _init_worker(catalog_path):
+    global _recommender
+    _recommender = Recommender(load_catalog(catalog_path))
+
+
+def _split(value):
+    return tuple(part.strip() for part in (value or "").split(";") if part.strip())
+
+
+def parse_profile(row):
+    stream = row["stream"].strip()
+    if stream not in STUDENT_STREAMS:
+        raise ValueError(f"unknown stream {stream!r}")
+    exam = (row.get("exam") or "None").strip()
+    return Profile(
+        stream=stream,
+        percentage=float(row["percentage"]),
+        interests=_split(row.get("interests")),
+        strengths=_split(row.get("strengths")),
+        exam=exam,
+        exam_score=float(row.get("exam_score") or 0) if exam != "None" else 0.0,
+    )
+
+
+def score_chunk(first_row, rows, top):
+    """Score one chunk; returns (CSV text of its results, number of rows skipped as invalid)."""
+    profiles, ids = [], []
+    skipped = 0
+    for offset, row in enumerate(rows):
+        try:
+            profiles.append(parse_profile(row))
+        except (KeyError, ValueError, AttributeError):
+            skipped += 1
+            continue
+        ids.append(row.get("applicant_id") or str(first_row + offset))
+
+    out = io.StringIO()
+    writer = csv.writer(out)
+    if profiles:
+        for applicant, (indices, scores) in zip(ids, _recommender.top_k(profiles, top)):
+            for rank, (index, score) in enumerate(zip(indices, scores), 1):
+                stream, course = _recommender.keys[index]
+                writer.writerow([applicant, rank, stream, course, f"{score:.4f}"])
+    return out.getvalue(), skipped
+
+
+def _chunks(reader, size):
+    first = 1
+    while True:
+        rows = list(islice(reader, size))
+        if not rows:
+            return
+        yield first, rows
+        first += len(rows)
+
+
+def run(source, destination, workers=None, top=3, chunk_rows=CHUNK_ROWS, catalog_path=CATALOG_PATH):
+    """Score every applicant in `source` into `destination`; returns (rows read, rows skipped)."""
+    workers = workers or os.cpu_count() or 1
+    rows = skipped = 0
+    with open(source, newline="") as src, open(destination, "w", newline="") as dst, \
+            ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(catalog_path,)) as pool:
+        csv.writer(dst).writerow(OUTPUT_COLUMNS)
+        pending = deque()
+
+        def drain_one():
+            text, bad = pending.popleft().result()
+            dst.write(text)
+            return bad
+
+        for first, chunk in _chunks(csv.DictReader(src), chunk_rows):
+            pending.append(pool.submit(score_chunk, first, chunk, top))
+            rows += len(chunk)
+            # Bound the work in flight so memory doesn't grow with the input
+            if len(pending) >= 2 * workers:
+                skipped += drain_one()
+        while pending:
+            skipped += drain_one()
+    return rows, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch Student Counseling recommendations for an applicant CSV.")
+    parser.add_argument("source", help="applicant CSV")
+    parser.add_argument("destination", help="where to write ranked recommendations")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--top", type=int, default=3, help="recommendations per applicant")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--catalog", default=str(CATALOG_PATH))
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    rows, skipped = run(args.source, args.destination, args.workers, args.top, args.chunk_rows, args.catalog)
+    elapsed = time.perf_counter() - start
+    print(f"{rows:,} applicants in {elapsed:.1f} s ({rows / elapsed:,.0f}/s), {skipped:,} invalid rows skipped",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
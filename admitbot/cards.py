@@ -0,0 +1,131 @@
+"""Pre-rendered HTML blocks for groups of cards.
+
+Each group of cards is joined into one HTML string and sent with a single
+`st.markdown` call, so a page emits one delta per group instead of one per
+card. Blocks built from catalog data are cached by the version of the
+catalog table they show (and course, where relevant) so an unchanged
+selection skips the templating.
+"""
+from html import escape
+
+import streamlit as st
+
+from admitbot.catalog import Catalog
+from admitbot.gallery import Gallery
+from admitbot.metrics import counted_cache
+from admitbot.store import Store
+
+# Fee components read from the store change with its catalog version
+_FEES_HASH = {
+    Catalog: lambda catalog: catalog.versions("fee_structures", "default_fees"),
+    Store: lambda db: db.catalog_version,
+}
+_PLANS_HASH = {Catalog: lambda catalog: catalog.versions("payment_plans")}
+_SCHOLARSHIPS_HASH = {Catalog: lambda catalog: catalog.versions("scholarships")}
+_GALLERY_HASH = {Gallery: lambda gallery: gallery.version}
+
+_FEE_CARD = (
+    "<div style='background-color: white; padding: 10px 15px; border-radius: 5px; margin: 8px 0; "
+    "border: 1px solid #dee2e6; display: flex; justify-content: space-between; align-items: center; "
+    "box-shadow: 0 1px 3px rgba(0,0,0,0.1);'>"
+    "<span style='color: #000000; font-size: 16px;'>{label}</span>"
+    "<span style='color: #000000; font-weight: 500; font-size: 16px;'>₹{amount:,}</span>"
+    "</div>"
+)
+
+_OPTIONAL_FEE_CARD = (
+    "<div style='background-color: #f8f9fa; padding: 10px 15px; border-radius: 5px; margin: 8px 0; "
+    "border: 1px solid #dee2e6; display: flex; justify-content: space-between; align-items: center;'>"
+    "<span style='color: #666666; font-size: 16px;'>{label}</span>"
+    "<span style='color: #666666; font-weight: 500; font-size: 16px;'>₹{amount:,}</span>"
+    "</div>"
+)
+
+_DETAIL_CARD = (
+    "<div style='background-color: white; padding: 10px 15px; border-radius: 5px; margin: 5px 0; "
+    "border: 1px solid #dee2e6;'>"
+    "<strong>{title}</strong><br>"
+    "<small style='color: #666666;'>{detail}</small>"
+    "</div>"
+)
+
+_TOUR_CARD = (
+    "<div style='padding: 15px; border: 1px solid #ddd; border-radius: 5px; margin: 10px 0; "
+    "background-color: white; box-shadow: 0 2px 4px rgba(0,0,0,0.05);'>"
+    "<strong style='color: #1f77b4; font-size: 18px;'>{title}</strong><br>"
+    "<p style='margin-top: 8px; color: #444;'>{detail}</p>"
+    "</div>"
+)
+
+# Three columns in the wide layout, one per row on phones; the browser picks
+# the variant from srcset, width/height reserve the space before it loads
+_GALLERY_IMAGE = (
+    "<figure style='flex: 1 1 280px; margin: 0; text-align: center;'>"
+    "<img src='{src}' srcset='{srcset}' sizes='(max-width: 640px) 100vw, 33vw' "
+    "width='{width}' height='{height}' alt='{caption}' loading='lazy' decoding='async' "
+    "style='width: 100%; height: auto; border-radius: 5px;'>"
+    "<figcaption style='color: #666666; font-size: 14px; margin-top: 4px;'>{caption}</figcaption>"
+    "</figure>"
+)
+
+
+def _block(cards):
+    return "<div>" + "".join(cards) + "</div>"
+
+
+def _detail_cards(template, items):
+    return _block(template.format(title=escape(title), detail=escape(detail)) for title, detail in items)
+
+
+def _details(entries):
+    return ((name, entry["detail"]) for name, entry in entries.items())
+
+
+@counted_cache(st.cache_data(show_spinner=False, hash_funcs=_FEES_HASH))
+def fee_components(catalog, course, db=None):
+    """HTML for the fee component cards of `course`, plus its mandatory and optional totals.
+
+    With a `Store`, the components are read from it rather than the catalog.
+    """
+    cards = []
+    mandatory_total = 0
+    optional_total = 0
+    fees = db.fee_components(course) if db is not None else catalog.fees_for(course)
+    for fee_type, amount in fees.items():
+        if "Optional" in fee_type:
+            optional_total += amount
+            cards.append(_OPTIONAL_FEE_CARD.format(label=escape(fee_type), amount=amount))
+        else:
+            mandatory_total += amount
+            cards.append(_FEE_CARD.format(label=escape(fee_type), amount=amount))
+    return _block(cards), mandatory_total, optional_total
+
+
+@counted_cache(st.cache_data(show_spinner=False, hash_funcs=_PLANS_HASH))
+def payment_plans(catalog):
+    return _detail_cards(_DETAIL_CARD, _details(catalog.payment_plans))
+
+
+@counted_cache(st.cache_data(show_spinner=False, hash_funcs=_SCHOLARSHIPS_HASH))
+def scholarships(catalog):
+    return _detail_cards(_DETAIL_CARD, _details(catalog.scholarships))
+
+
+def tour_points(points):
+    return _detail_cards(_TOUR_CARD, points.items())
+
+
+@counted_cache(st.cache_data(show_spinner=False, hash_funcs=_GALLERY_HASH))
+def gallery(built, entries):
+    """One lazy-loading block for the (file name, caption) `entries` of a built gallery."""
+    figures = (
+        _GALLERY_IMAGE.format(
+            src=built.src(name),
+            srcset=built.srcset(name),
+            width=built.images[name]["width"],
+            height=built.images[name]["height"],
+            caption=escape(caption),
+        )
+        for name, caption in entries
+    )
+    return "<div style='display: flex; flex-wrap: wrap; gap: 1rem;'>" + "".join(figures) + "</div>"
@@ -0,0 +1,77 @@
+"""Course catalog loaded from data/catalog.json.
+
+The catalog is parsed once and frozen so a single instance can be shared
+read-only by every session. `version` is a hash of the source file.
+Each table (streams, fee structures, ...) also has its own content hash in
+`table_versions`; caches derived from the catalog are keyed by the tables
+they read, so an edit to one table leaves the others' caches valid.
+"""
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+
+TABLES = (
+    "streams", "fee_courses", "fee_structures", "default_fees", "payment_plans", "scholarships", "loan_banks",
+)
+
+DATA_DIR = Path(os.environ.get("ADMITBOT_DATA_DIR", Path(__file__).resolve().parent.parent / "data"))
+CATALOG_PATH = Path(os.environ.get("ADMITBOT_CATALOG", DATA_DIR / "catalog.json"))
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True)
+class Catalog:
+    version: str
+    streams: MappingProxyType          # stream -> course name -> details
+    fee_courses: MappingProxyType      # stream -> courses offered on the Fee Structure page
+    fee_structures: MappingProxyType   # course -> fee component -> amount
+    default_fees: MappingProxyType
+    payment_plans: MappingProxyType    # plan -> detail, adjustment (fraction added to the fee)
+    scholarships: MappingProxyType     # scheme -> detail, waiver (fraction of tuition waived)
+    loan_banks: MappingProxyType       # partner bank -> education loan rate (% p.a.)
+    table_versions: MappingProxyType   # table -> hash of its contents
+
+    def versions(self, *tables):
+        """Cache key for something derived from `tables` only."""
+        return tuple(self.table_versions[table] for table in tables)
+
+    def changed_tables(self, other):
+        return {table for table in TABLES if self.table_versions[table] != other.table_versions[table]}
+
+    def courses(self, stream):
+        return self.streams.get(stream, MappingProxyType({}))
+
+    def fees_for(self, course):
+        return self.fee_structures.get(course, self.default_fees)
+
+
+def load_catalog(path=CATALOG_PATH, previous=None):
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    return catalog_from_dict(json.loads(raw), hashlib.sha256(raw).hexdigest()[:12], previous)
+
+
+def _table_version(table):
+    return hashlib.sha256(json.dumps(table, separators=(",", ":")).encode()).hexdigest()[:12]
+
+
+def catalog_from_dict(data, version, previous=None):
+    """Frozen catalog from `data`, reusing `previous`'s frozen tables where they are unchanged."""
+    table_versions = {table: _table_version(data[table]) for table in TABLES}
+    tables = {
+        table: getattr(previous, table)
+        if previous is not None and previous.table_versions[table] == table_versions[table]
+        else _freeze(data[table])
+        for table in TABLES
+    }
+    return Catalog(version=version, table_versions=MappingProxyType(table_versions), **tables)
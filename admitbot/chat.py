@@ -0,0 +1,309 @@
+"""Answers for the Home page chat box.
+
+A question is routed by the intent classifier to one of the app's sections
+and answered from that section's data (catalog fees and eligibility, FAQ
+documents, admissions calendar, placement summary), with a pointer to the page
+that has the details. Questions the classifier is unsure about fall back to
+FAQ search.
+
+Answers depend only on the words of a question, so `normalize` maps
+"What is the fee for B.Tech CSE?" and "what is the fee for b tech cse" to
+the same `AnswerCache` key. `stream` yields an answer a sentence or line
+at a time for `st.write_stream`.
+"""
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from admitbot import metrics
+from admitbot.deadlines import countdown, format_day, format_days
+from admitbot.faq import tokenize
+
+MIN_CONFIDENCE = 0.35
+CACHE_SIZE = 4096    # distinct normalized questions kept
+CACHE_TTL = 15 * 60  # seconds; bounds how stale a date-dependent answer can get
+
+_WORD = re.compile(r"[a-z0-9]+")
+# A sentence (up to ". ", "? " or "! ") or the rest of a line, with its trailing whitespace
+_CHUNK = re.compile(r"(?:[^.!?\n]|[.!?](?=\S))*[.!?]*\s*")
+
+PAGE_FOR_INTENT = {
+    "fees": "Fee Structure",
+    "eligibility": "Admissions FAQ",
+    "deadlines": "Admissions FAQ",
+    "documents": "Admissions FAQ",
+    "placements": "Placement Statistics",
+    "roi": "Parent Support",
+    "tour": "Virtual Campus Tour",
+}
+
+# Short forms visitors type for catalog course names
+_ALIASES = {
+    "Computer Science and Engineering": ("cse",),
+    "CSE with AI/ML": ("aiml", "ai ml"),
+    "Electronics and Communication": ("ece",),
+    "Electrical Engineering": ("eee",),
+}
+
+
+@dataclass(frozen=True)
+class Reply:
+    intent: str       # "" when no section matched
+    confidence: float
+    text: str         # markdown
+
+
+def normalize(question):
+    """Lowercase words only, single-spaced: the part of a question the answer depends on."""
+    return " ".join(_WORD.findall(question.lower()))
+
+
+def stream(text):
+    """Sentences and lines of `text` with their trailing whitespace, so joining them restores the markdown.
+
+    Answers are ready in full, so streaming only paces their display;
+    sentence-sized chunks keep that to a few deltas per answer rather than
+    one per word.
+    """
+    for match in _CHUNK.finditer(text):
+        if match.group():
+            yield match.group()
+
+
+def _lakh(amount):
+    return f"₹{amount / 1e5:.2f} lakh"
+
+
+def match_course(catalog, question):
+    """(stream, course, details) whose name best matches `question`, or None if nothing or a tie.
+
+    Courses are ranked by the share of their name (or a short form such as
+    "cse") that the question contains, then by words matched, so "bba"
+    picks BBA over BBA with Digital Marketing. Matching only the stream's
+    own name doesn't count: "engineering fees" is about the stream, not
+    Electrical Engineering.
+    """
+    terms = set(tokenize(question))
+    scored = []
+    for stream, courses in catalog.streams.items():
+        generic = set(tokenize(stream))
+        for course in courses:
+            for name in (course, *_ALIASES.get(course, ())):
+                words = set(tokenize(name))
+                if terms & (words - generic):
+                    matched = len(terms & words)
+                    scored.append((matched / len(words), matched, stream, course))
+    scored.sort(reverse=True)
+    if not scored:
+        return None
+    best = scored[0]
+    if any(other[:2] == best[:2] and other[3] != best[3] for other in scored[1:]):
+        return None
+    return best[2], best[3], catalog.streams[best[2]][best[3]]
+
+
+def _match_stream(catalog, question):
+    terms = set(tokenize(question))
+    for stream in catalog.streams:
+        if set(tokenize(stream)) <= terms:
+            return stream
+    return None
+
+
+def _fees(catalog, question):
+    match = match_course(catalog, question)
+    if match:
+        stream, course, details = match
+        return f"**{course}** ({stream}) costs **{_lakh(details['annual_fee'])} a year** over {details['duration']}."
+    stream = _match_stream(catalog, question)
+    # A stream without courses gets the range across every program instead
+    return _fee_range(catalog, stream) or _fee_range(catalog, None) or (
+        "Fee Structure lists every program's fees, payment plans and scholarships."
+    )
+
+
+def _fee_range(catalog, stream):
+    streams = [stream] if stream else list(catalog.streams)
+    fees = sorted(
+        (details["annual_fee"], course)
+        for name in streams for course, details in catalog.courses(name).items()
+    )
+    if not fees:
+        return None
+    scope = f"{stream} programs" if stream else "Programs"
+    return (
+        f"{scope} cost from **{_lakh(fees[0][0])}** a year ({fees[0][1]}) "
+        f"to **{_lakh(fees[-1][0])}** ({fees[-1][1]}). Name a course for its exact fee."
+    )
+
+
+def _faq_answer(faq_index, question, topic, k=2):
+    hits = faq_index.search(question, topic=topic) or faq_index.search(topic, topic=topic)
+    return "\n\n".join(f"**{hit.title}**\n\n{hit.body}" for hit in hits[:k])
+
+
+def _eligibility(catalog, faq, faq_index, question):
+    match = match_course(catalog, question)
+    if not match:
+        return _faq_answer(faq_index, question, "Eligibility", k=1)
+    stream, course, details = match
+    answer = f"**{course}** needs {details['eligibility']}."
+    general = faq.topics["Eligibility"].get(f"{stream} Programs")
+    return f"{answer}\n\n**{stream} Programs**\n\n{general}" if general else answer
+
+
+def _last_cycle(calendar, stream=None, course=None):
+    """When the last cycle closed and its dates, for one program or for every one."""
+    rounds = {
+        round_: [event for event in events if course is None or event.applies_to(stream, course)]
+        for round_, events in calendar.rounds().items()
+    }
+    rounds = {round_: events for round_, events in rounds.items() if events}
+    if not rounds:
+        return ""
+    closed = max(event.end for events in rounds.values() for event in events)
+    dates = "\n".join(
+        f"- **{round_}**: " + "; ".join(f"{event.name} {format_days(event)}" for event in events)
+        for round_, events in rounds.items()
+    )
+    return f" The last cycle closed on {format_day(closed)}. Its dates were:\n\n{dates}"
+
+
+def _deadlines(catalog, calendar, today, question):
+    match = match_course(catalog, question)
+    stream = course = None
+    if match:
+        stream, course, _ = match
+        event = calendar.next_deadline(today, stream, course)
+        scope = f" for **{course}**"
+    else:
+        event = calendar.next_deadline(today)
+        scope = ""
+    if event is None:
+        return (
+            f"There are no upcoming admission deadlines{scope}; dates for the next cycle will be announced."
+            + _last_cycle(calendar, stream, course)
+        )
+    answer = (
+        f"The next deadline{scope} is **{event.round}: {event.name}** on "
+        f"{format_day(event.end)} ({countdown(event, today)})."
+    )
+    if not match:
+        others = [other for other in calendar.closing(today) if other != event]
+        if others:
+            answer += " Also closing this week: " + "; ".join(
+                f"{other.round} {other.name} ({countdown(other, today)})" for other in others
+            ) + "."
+    return answer
+
+
+def _placements(catalog, placements, question):
+    if not placements.years:
+        return "Placement Statistics shows placement rates, packages and recruiters by year."
+    latest = -1
+    # The comparison needs a previous year; a one-year summary just states the figures
+    change = (
+        f" (up from {placements.avg_salary[-2]} LPA in {placements.years[-2]})" if len(placements.years) > 1 else ""
+    )
+    answer = (
+        f"In {placements.years[latest]}, **{placements.placement_rate[latest]}%** of students were placed "
+        f"by {placements.companies[latest]} recruiters, at an average package of "
+        f"**{placements.avg_salary[latest]} LPA**{change}."
+    )
+    match = match_course(catalog, question)
+    if match:
+        _, course, details = match
+        answer += f" {course} graduates average {details['avg_package']}."
+    return answer
+
+
+def _roi(catalog, question):
+    match = match_course(catalog, question)
+    if not match:
+        return "Parent Support compares a course's total cost with expected salaries. Name a course for a quick estimate."
+    _, course, details = match
+    years = float(details["duration"].split()[0])
+    cost = details["annual_fee"] * years
+    package = float(details["avg_package"].split()[0]) * 1e5
+    return (
+        f"**{course}**: about {_lakh(cost)} in fees over {years:g} years against an average starting "
+        f"package of {details['avg_package']}, so roughly **{cost / package:.1f} years of salary** "
+        "pays the fees back."
+    )
+
+
+def answer(question, model, catalog, faq, faq_index, placements, calendar, today):
+    """Reply to `question`; `calendar` is a `CalendarIndex` and `today` the date deadlines count from."""
+    intent = model.classify(question)
+    if intent.confidence < MIN_CONFIDENCE:
+        hits = faq_index.search(question)
+        if hits:
+            return Reply("", intent.confidence, f"**{hits[0].title}** · {hits[0].topic}\n\n{hits[0].body}")
+        return Reply(
+            "", intent.confidence,
+            "I can help with fees, eligibility, deadlines, documents, placements, ROI and the campus tour. "
+            "Could you rephrase your question?",
+        )
+
+    if intent.name == "fees":
+        text = _fees(catalog, question)
+    elif intent.name == "eligibility":
+        text = _eligibility(catalog, faq, faq_index, question)
+    elif intent.name == "deadlines":
+        text = _deadlines(catalog, calendar, today, question)
+    elif intent.name == "documents":
+        text = _faq_answer(faq_index, question, "Documents")
+    elif intent.name == "placements":
+        text = _placements(catalog, placements, question)
+    elif intent.name == "roi":
+        text = _roi(catalog, question)
+    else:
+        text = "Walk through the Main Building, library, labs, hostels and sports complex on a 360° map."
+    page = PAGE_FOR_INTENT[intent.name]
+    return Reply(intent.name, intent.confidence, f"{text}\n\nMore on the **{page}** page in the sidebar.")
+
+
+class AnswerCache:
+    """Process-wide LRU cache of replies by normalized question, with a TTL.
+
+    Entries belong to one `version` (the data and model versions the
+    replies were computed from); a lookup with a new version drops them
+    all. This is lighter than an `st.cache_resource` lookup, which hashes
+    every argument and costs more than computing most answers.
+    """
+
+    def __init__(self, size=CACHE_SIZE, ttl=CACHE_TTL, clock=time.monotonic):
+        self.size = size
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # question -> (expires at, reply)
+        self._version = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, question, version, compute):
+        """The cached reply to `question`, or `compute()`'s, which is then cached."""
+        metrics.inc("admitbot_cache_requests_total", cache="chat_answer")
+        now = self._clock()
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            entry = self._entries.get(question)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(question)
+                return entry[1]
+
+        metrics.inc("admitbot_cache_misses_total", cache="chat_answer")
+        reply = compute()
+        with self._lock:
+            if version == self._version:
+                self._entries[question] = (now + self.ttl, reply)
+                self._entries.move_to_end(question)
+                while len(self._entries) > self.size:
+                    self._entries.popitem(last=False)
+        return reply
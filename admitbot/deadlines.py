@@ -0,0 +1,187 @@
+"""Admissions calendar loaded from data/deadlines.json, and its day index.
+
+The calendar is a list of admission rounds (early and regular admissions,
+NEET counseling, ...). Each round has dated events: application windows,
+entrance exams, counseling. An event is an interval of days given as
+[start, end], or [day] for a one-day event such as an exam. Its end is
+its deadline. A round applies to every program unless it names `streams`
+or `programs` (catalog course names).
+
+`CalendarIndex` answers the Deadlines tab's questions without scanning
+every event:
+
+- `open_on(day)`: events running on `day`. The days between consecutive
+  event boundaries each have a fixed set of open events, precomputed, so
+  this is one binary search
+- `closing(day, days)`: events whose deadline falls in the next `days`
+  days, a slice of the events sorted by deadline
+- `next_deadline(day, stream, course)`: the first deadline on or after
+  `day` for one program. This is the earliest of three binary searches:
+  over rounds for every program, for its stream, and for the program itself
+
+Each costs O(log n) plus the size of the answer. `CalendarIndex.day`
+bundles what the page shows for one date. admitbot.resources caches one
+of those per day.
+"""
+import hashlib
+import json
+import os
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+
+from admitbot.catalog import DATA_DIR
+
+DEADLINES_PATH = Path(os.environ.get("ADMITBOT_DEADLINES", DATA_DIR / "deadlines.json"))
+WEEK = 7
+
+_ALL = ("all",)
+_ONE_DAY = timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class Event:
+    round: str
+    name: str
+    start: date
+    end: date            # the deadline; equal to start for one-day events
+    streams: tuple = ()  # empty: every stream
+    programs: tuple = ()  # empty: every program (in `streams`, if given)
+
+    def scopes(self):
+        if self.programs:
+            return [("program", course) for course in self.programs]
+        if self.streams:
+            return [("stream", stream) for stream in self.streams]
+        return [_ALL]
+
+    def applies_to(self, stream, course):
+        return any(scope in (_ALL, ("stream", stream), ("program", course)) for scope in self.scopes())
+
+
+@dataclass(frozen=True)
+class Calendar:
+    version: str
+    events: tuple   # Event, in file order
+
+    def rounds(self):
+        """Round -> its events, in file order."""
+        rounds = {}
+        for event in self.events:
+            rounds.setdefault(event.round, []).append(event)
+        return rounds
+
+
+@dataclass(frozen=True)
+class Day:
+    day: date
+    open: tuple      # events running today, soonest deadline first
+    closing: tuple   # events whose deadline is within the week, soonest first
+    next: Event      # the next deadline for any program, or None
+
+
+def format_day(day):
+    return f"{day:%B} {day.day}, {day.year}"
+
+
+def format_days(event):
+    """"June 15, 2024" or "March 1, 2024 – May 31, 2024"."""
+    if event.start == event.end:
+        return format_day(event.end)
+    return f"{format_day(event.start)} – {format_day(event.end)}"
+
+
+def days_left(event, day):
+    return (event.end - day).days
+
+
+def countdown(event, day):
+    days = days_left(event, day)
+    return "today" if days == 0 else "tomorrow" if days == 1 else f"in {days} days"
+
+
+def load_calendar(path=DEADLINES_PATH):
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    return calendar_from_dict(json.loads(raw), hashlib.sha256(raw).hexdigest()[:12])
+
+
+def calendar_from_dict(data, version):
+    events = []
+    for entry in data:
+        for name, days in entry["events"].items():
+            start = date.fromisoformat(days[0])
+            end = date.fromisoformat(days[-1])
+            if end < start:
+                raise ValueError(f"{entry['round']} {name} ends before it starts")
+            events.append(Event(
+                entry["round"], name, start, end,
+                tuple(entry.get("streams", ())), tuple(entry.get("programs", ())),
+            ))
+    return Calendar(version=version, events=tuple(events))
+
+
+def _by_deadline(event):
+    return event.end, event.start, event.round, event.name, event.streams, event.programs
+
+
+class CalendarIndex:
+    def __init__(self, calendar):
+        self.version = calendar.version
+        self._rounds = calendar.rounds()
+        events = sorted(calendar.events, key=_by_deadline)
+        self._by_end = tuple(events)
+        self._ends = [event.end for event in events]
+
+        # Deadlines by scope, for next_deadline
+        scopes = {}
+        for event in events:
+            for scope in event.scopes():
+                scopes.setdefault(scope, []).append(event)
+        self._scopes = {scope: ([event.end for event in group], group) for scope, group in scopes.items()}
+
+        # Sweep the day boundaries once: between two consecutive ones the open set is fixed.
+        # Events are tracked by rank in deadline order, so each snapshot is a sort of ints.
+        opening, closing = {}, {}
+        for rank, event in enumerate(events):
+            opening.setdefault(event.start, []).append(rank)
+            closing.setdefault(event.end + _ONE_DAY, []).append(rank)
+        self._bounds = sorted(opening.keys() | closing.keys())
+        self._open = []
+        active = set()
+        for bound in self._bounds:
+            active.difference_update(closing.get(bound, ()))
+            active.update(opening.get(bound, ()))
+            self._open.append(tuple(events[rank] for rank in sorted(active)))
+
+    def __len__(self):
+        return len(self._by_end)
+
+    def rounds(self):
+        """Round -> its events, in file order (as `Calendar.rounds`)."""
+        return self._rounds
+
+    def open_on(self, day):
+        i = bisect_right(self._bounds, day) - 1
+        return self._open[i] if i >= 0 else ()
+
+    def closing(self, day, days=WEEK):
+        """Events with a deadline from `day` up to, not including, `day + days`."""
+        return self._by_end[bisect_left(self._ends, day):bisect_left(self._ends, day + timedelta(days=days))]
+
+    def next_deadline(self, day, stream=None, course=None):
+        """The first event ending on or after `day` for the program, or for any program; None if none is left."""
+        if stream is None and course is None:
+            i = bisect_left(self._ends, day)
+            return self._by_end[i] if i < len(self._by_end) else None
+        candidates = []
+        for scope in (_ALL, ("stream", stream), ("program", course)):
+            ends, group = self._scopes.get(scope, ((), ()))
+            i = bisect_left(ends, day)
+            if i < len(group):
+                candidates.append(group[i])
+        return min(candidates, key=_by_deadline, default=None)
+
+    def day(self, day, days=WEEK):
+        return Day(day, self.open_on(day), self.closing(day, days), self.next_deadline(day))
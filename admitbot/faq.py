@@ -0,0 +1,144 @@
+"""Admissions FAQ content loaded from data/faq.json, and its search index.
+
+The content is topic -> snippet title -> markdown body; the Admissions FAQ
+tabs render it and `FaqIndex` makes every snippet searchable.
+
+`FaqIndex` is an inverted index with BM25 ranking. Each term's posting
+list holds (snippet, weight) pairs with the full BM25 term weight
+precomputed at build time, so a query only sums a few short lists and
+takes a top-k. Titles count double. The last query word also matches as a
+prefix ("elig" finds eligibility).
+"""
+import hashlib
+import heapq
+import json
+import os
+import re
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from math import log
+from operator import itemgetter
+from pathlib import Path
+from types import MappingProxyType
+
+from admitbot.catalog import DATA_DIR
+
+FAQ_PATH = Path(os.environ.get("ADMITBOT_FAQ", DATA_DIR / "faq.json"))
+
+K1 = 1.2
+B = 0.75
+TITLE_WEIGHT = 2
+MAX_EXPANSIONS = 8   # vocabulary terms a prefix may expand to
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from how i in is it me my of on or "
+    "the to what when where which who why will with you your".split()
+)
+
+
+@dataclass(frozen=True)
+class Faq:
+    version: str
+    topics: MappingProxyType   # topic -> snippet title -> markdown body
+
+    def snippets(self):
+        for topic, entries in self.topics.items():
+            for title, body in entries.items():
+                yield topic, title, body
+
+
+@dataclass(frozen=True)
+class Hit:
+    topic: str
+    title: str
+    body: str
+    score: float
+
+
+def load_faq(path=FAQ_PATH):
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    return faq_from_dict(json.loads(raw), hashlib.sha256(raw).hexdigest()[:12])
+
+
+def faq_from_dict(data, version):
+    topics = {topic: MappingProxyType(dict(entries)) for topic, entries in data.items()}
+    return Faq(version=version, topics=MappingProxyType(topics))
+
+
+def _stem(token):
+    # Just enough to fold plurals: documents/document, fees/fee, categories/category
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    return [_stem(token) for token in _TOKEN.findall(text.lower()) if token not in _STOPWORDS]
+
+
+class FaqIndex:
+    def __init__(self, faq, k1=K1, b=B):
+        self.version = faq.version
+        self._snippets = tuple(faq.snippets())
+        counts = []
+        for topic, title, body in self._snippets:
+            terms = Counter(tokenize(f"{topic} {body}"))
+            for term in tokenize(title):
+                terms[term] += TITLE_WEIGHT
+            counts.append(terms)
+        lengths = [sum(terms.values()) for terms in counts]
+        average = sum(lengths) / len(lengths) if lengths else 1.0
+
+        postings = defaultdict(list)
+        for doc, terms in enumerate(counts):
+            norm = k1 * (1 - b + b * lengths[doc] / average)
+            for term, tf in terms.items():
+                postings[term].append((doc, tf * (k1 + 1) / (tf + norm)))
+        n = len(self._snippets)
+        self._postings = {}
+        for term, docs in postings.items():
+            idf = log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+            self._postings[term] = {doc: idf * weight for doc, weight in docs}
+        self._vocabulary = tuple(sorted(self._postings))
+
+    def __len__(self):
+        return len(self._snippets)
+
+    def _prefixed(self, prefix):
+        start = bisect_left(self._vocabulary, prefix)
+        terms = []
+        for term in self._vocabulary[start:start + MAX_EXPANSIONS]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def search(self, query, k=3, topic=None):
+        """The `k` best snippets for `query`, best first, optionally from one topic only."""
+        terms = tokenize(query)
+        if not terms:
+            return []
+        scores = defaultdict(float)
+        for term in set(terms[:-1]) - {terms[-1]}:
+            for doc, weight in self._postings.get(term, {}).items():
+                scores[doc] += weight
+
+        # The last word may be unfinished: score it by its best-matching completion
+        last = terms[-1]
+        best = {}
+        for term in self._prefixed(last) if len(last) >= 3 else [last]:
+            for doc, weight in self._postings.get(term, {}).items():
+                if weight > best.get(doc, 0.0):
+                    best[doc] = weight
+        for doc, weight in best.items():
+            scores[doc] += weight
+
+        if topic is not None:
+            scores = {doc: score for doc, score in scores.items() if self._snippets[doc][0] == topic}
+        top = heapq.nlargest(k, scores.items(), key=itemgetter(1))
+        return [Hit(*self._snippets[doc], score) for doc, score in top]
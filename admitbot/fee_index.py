@@ -0,0 +1,40 @@
+"""Sorted annual-fee index over the course catalog.
+
+Each stream keeps its fees in a sorted `array` column with a parallel tuple
+of course names, plus one merged column spanning every stream. A budget
+range is answered with two bisects and a slice, so a slider drag costs
+O(log n + k) instead of a scan over the whole catalog.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+
+ALL_STREAMS = None
+
+
+class FeeIndex:
+    def __init__(self, catalog):
+        self.version = catalog.version
+        self._columns = {}
+        merged = []
+        for stream, courses in catalog.streams.items():
+            rows = sorted((details["annual_fee"], stream, course) for course, details in courses.items())
+            self._columns[stream] = self._column(rows)
+            merged.extend(rows)
+        merged.sort()
+        self._columns[ALL_STREAMS] = self._column(merged)
+
+    @staticmethod
+    def _column(rows):
+        fees = array("q", (fee for fee, _, _ in rows))
+        keys = tuple((stream, course) for _, stream, course in rows)
+        return fees, keys
+
+    def range(self, low, high, stream=ALL_STREAMS):
+        """(stream, course) pairs with low <= annual_fee <= high, cheapest first."""
+        if stream not in self._columns:
+            return ()
+        fees, keys = self._columns[stream]
+        return keys[bisect_left(fees, low):bisect_right(fees, high)]
+
+    def __len__(self):
+        return len(self._columns[ALL_STREAMS][0])
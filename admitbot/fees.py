@@ -0,0 +1,88 @@
+"""Net annual cost for every course, payment plan and scholarship combination.
+
+The matrix is computed once per catalog version as a single array of shape
+(courses, payment plans, scholarship combinations, hostel), so any
+selection on the Fee Structure page is an index lookup. Scholarship
+combinations are bitmasks over the catalog's schemes.
+
+Rules:
+- scholarship waivers apply to the tuition fee; combined waivers add up
+  and are capped at 100%
+- optional fees (hostel, mess) are included only on the hostel axis
+- the payment plan adjustment (e.g. -5% one-time, +3% monthly) applies to
+  the whole annual amount after waivers
+
+Usage:
+    python -m admitbot.fees fee_matrix.csv
+"""
+import csv
+import io
+import sys
+
+import numpy as np
+
+from admitbot.catalog import load_catalog
+
+WAIVED_COMPONENT = "Tuition Fee"
+
+
+class FeeMatrix:
+    def __init__(self, catalog):
+        self.version = catalog.version
+        self.courses = tuple(course for courses in catalog.fee_courses.values() for course in courses)
+        self.plans = tuple(catalog.payment_plans)
+        self.schemes = tuple(catalog.scholarships)
+        self._course_index = {course: i for i, course in enumerate(self.courses)}
+
+        tuition, other, optional = np.zeros((3, len(self.courses)))
+        for i, course in enumerate(self.courses):
+            for component, amount in catalog.fees_for(course).items():
+                if "Optional" in component:
+                    optional[i] += amount
+                elif component == WAIVED_COMPONENT:
+                    tuition[i] += amount
+                else:
+                    other[i] += amount
+
+        adjustments = np.array([catalog.payment_plans[plan]["adjustment"] for plan in self.plans])
+        waivers = np.array([catalog.scholarships[scheme]["waiver"] for scheme in self.schemes])
+        combos = np.arange(2 ** len(self.schemes))
+        selected = (combos[:, None] >> np.arange(len(self.schemes))) & 1
+        waiver = np.minimum(selected @ waivers, 1.0)
+        hostel = np.array([0.0, 1.0])
+
+        annual = (
+            tuition[:, None, None] * (1 - waiver)[None, :, None]
+            + other[:, None, None]
+            + optional[:, None, None] * hostel[None, None, :]
+        )  # (courses, combos, hostel)
+        self.net = np.round(annual[:, None, :, :] * (1 + adjustments)[None, :, None, None])
+
+    def combo(self, schemes):
+        return sum(1 << self.schemes.index(scheme) for scheme in schemes)
+
+    def lookup(self, course, plan, schemes=(), hostel=False):
+        """Net annual payable for one selection; unknown courses raise KeyError."""
+        return float(self.net[self._course_index[course], self.plans.index(plan), self.combo(schemes), int(hostel)])
+
+    def to_csv(self):
+        """Long-format export: one row per course, plan, scholarship combination and hostel choice."""
+        out = io.StringIO()
+        writer = csv.writer(out)
+        writer.writerow(["course", "payment_plan", "scholarships", "hostel", "net_annual_fee"])
+        names = [
+            " + ".join(scheme for bit, scheme in enumerate(self.schemes) if combo >> bit & 1) or "None"
+            for combo in range(2 ** len(self.schemes))
+        ]
+        for (c, p, s, h), value in np.ndenumerate(self.net):
+            writer.writerow([self.courses[c], self.plans[p], names[s], "Yes" if h else "No", int(value)])
+        return out.getvalue()
+
+
+if __name__ == "__main__":
+    text = FeeMatrix(load_catalog()).to_csv()
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "w", newline="") as fh:
+            fh.write(text)
+    else:
+        sys.stdout.write(text)
@@ -0,0 +1,170 @@
+"""Campus Gallery asset pipeline.
+
+Ingests the original gallery photos from a local directory once and writes
+resized WebP variants for each column width into static/gallery/, which
+Streamlit serves at app/static/gallery/ (server.enableStaticServing). File
+names carry a hash of the source image and encoding settings, and URLs add
+it as ?v=, for which the static handler sends a ten-year Cache-Control. A
+new photo gets a new name, so browsers never see a stale one.
+
+Only new or changed sources are decoded on a rerun; variants nobody
+references any more are deleted. manifest.json maps each source file name
+to its variants and is what the Campus Tour page reads.
+
+Usage:
+    python -m admitbot.gallery [SOURCE_DIR] [--quality 80]
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+
+ROOT = Path(__file__).resolve().parent.parent
+GALLERY_DIR = Path(os.environ.get("ADMITBOT_GALLERY_DIR", ROOT / "assets" / "gallery"))
+OUTPUT_DIR = ROOT / "static" / "gallery"
+MANIFEST = "manifest.json"
+STATIC_URL = "app/static/gallery"
+WIDTHS = (360, 540, 720, 1080)   # a third of the wide layout and full mobile width, at 1x and 2x
+DEFAULT_WIDTH = 540             # src for browsers without srcset support
+QUALITY = 80
+SOURCE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp"}
+
+
+@dataclass(frozen=True)
+class Gallery:
+    version: str
+    images: MappingProxyType   # source file name -> width, height, variants (width -> file name)
+
+    def srcset(self, name):
+        image = self.images[name]
+        return ", ".join(
+            f"{STATIC_URL}/{file}?v={image['hash']} {width}w" for width, file in image["variants"].items()
+        )
+
+    def src(self, name, width=DEFAULT_WIDTH):
+        image = self.images[name]
+        return f"{STATIC_URL}/{_pick(image, width)}?v={image['hash']}"
+
+
+def _pick(image, width):
+    """File of the smallest variant at least `width` wide (or the largest there is)."""
+    widths = sorted(image["variants"], key=int)
+    return image["variants"][next((w for w in widths if int(w) >= width), widths[-1])]
+
+
+def load_gallery(output=OUTPUT_DIR):
+    """The built gallery, or None if the pipeline hasn't been run."""
+    try:
+        with open(Path(output) / MANIFEST, "rb") as fh:
+            raw = fh.read()
+    except FileNotFoundError:
+        return None
+    images = json.loads(raw)["images"]
+    return Gallery(
+        version=hashlib.sha256(raw).hexdigest()[:12],
+        images=MappingProxyType({name: MappingProxyType(image) for name, image in images.items()}),
+    )
+
+
+def _variants(source, digest, widths, quality, output):
+    from PIL import Image, ImageOps
+
+    with Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+    width, height = image.size
+    # No upscaling: widths beyond the original collapse into one full-size variant
+    targets = sorted({min(w, width) for w in widths}, reverse=True)
+    variants = {}
+    current = image
+    for target in targets:
+        # Each variant is resized from the next larger one, which is much cheaper than the original
+        if target != current.width:
+            current = current.resize((target, round(height * target / width)), Image.Resampling.LANCZOS)
+        file = f"{source.stem}-{digest}-{target}w.webp"
+        current.save(output / file, "WEBP", quality=quality, method=4)
+        variants[str(target)] = file
+    variants = dict(sorted(variants.items(), key=lambda item: int(item[0])))
+    return {"hash": digest, "width": width, "height": height, "variants": variants}
+
+
+def build(source=GALLERY_DIR, output=OUTPUT_DIR, widths=WIDTHS, quality=QUALITY):
+    """Bring the variants and manifest up to date; returns a report dict."""
+    source, output = Path(source), Path(output)
+    if not source.is_dir():
+        raise FileNotFoundError(f"no photo directory at {source}")
+    sources = sorted(p for p in source.iterdir() if p.suffix.lower() in SOURCE_SUFFIXES)
+    if not sources:
+        # An empty manifest would replace the hotlinked photos with nothing
+        raise FileNotFoundError(f"no {'/'.join(sorted(SOURCE_SUFFIXES))} photos in {source}")
+    output.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    previous = {}
+    if (output / MANIFEST).exists():
+        previous = json.loads((output / MANIFEST).read_text())
+    settings = {"widths": list(widths), "quality": quality}
+    # The settings are part of the hash so re-encoded variants get new URLs too
+    salt = json.dumps(settings, sort_keys=True).encode()
+    old_images = previous.get("images", {})
+
+    images, built, input_bytes = {}, 0, 0
+    for path in sources:
+        data = path.read_bytes()
+        input_bytes += len(data)
+        digest = hashlib.sha256(salt + data).hexdigest()[:12]
+        old = old_images.get(path.name)
+        if old and old["hash"] == digest and all((output / f).exists() for f in old["variants"].values()):
+            images[path.name] = old
+        else:
+            images[path.name] = _variants(path, digest, widths, quality, output)
+            built += 1
+
+    manifest = {"settings": settings, "images": images}
+    (output / MANIFEST).write_text(json.dumps(manifest, indent=2) + "\n")
+    referenced = {f for image in images.values() for f in image["variants"].values()}
+    removed = 0
+    for stale in output.glob("*.webp"):
+        if stale.name not in referenced:
+            stale.unlink()
+            removed += 1
+
+    return {
+        "images": len(images),
+        "built": built,
+        "removed": removed,
+        "input_bytes": input_bytes,
+        "output_bytes": sum((output / f).stat().st_size for f in referenced),
+        # What a desktop visitor downloads: one column-width variant per photo
+        "served_bytes": sum((output / _pick(image, DEFAULT_WIDTH)).stat().st_size for image in images.values()),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the Campus Gallery WebP variants.")
+    parser.add_argument("source", nargs="?", default=str(GALLERY_DIR), help="directory of original photos")
+    parser.add_argument("--output", default=str(OUTPUT_DIR))
+    parser.add_argument("--quality", type=int, default=QUALITY)
+    args = parser.parse_args(argv)
+
+    try:
+        report = build(args.source, args.output, quality=args.quality)
+    except FileNotFoundError as error:
+        sys.exit(f"{error}. Put the original Campus Tour photos there or pass their directory "
+                 "(or set ADMITBOT_GALLERY_DIR); the page keeps hotlinking them until then.")
+    print(
+        f"{report['images']} images ({report['built']} rebuilt, {report['removed']} stale variants removed) "
+        f"in {report['seconds'] * 1000:.0f} ms\n"
+        f"originals {report['input_bytes'] / 1024:,.0f} KiB -> variants {report['output_bytes'] / 1024:,.0f} KiB "
+        f"on disk, {report['served_bytes'] / 1024:,.0f} KiB per desktop visit",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
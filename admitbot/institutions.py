@@ -0,0 +1,165 @@
+"""Directory of other institutions for College Search, with a grid index for distance filters.
+
+ADMITBOT_INSTITUTIONS points at a CSV with one row per program offered:
+
+    institution,city,latitude,longitude,stream,program,annual_fee
+
+Streams use the catalog's names (Engineering, Medical, ...). Without the
+variable College Search covers only this institute, as before.
+
+`GeoGrid` buckets institutions into square cells of CELL_KM (in degrees of
+latitude) and stores their ids sorted by cell. Cells in one grid row are
+contiguous, so a "within N km" query takes two `searchsorted` calls per
+row of cells its bounding box touches. Exact great-circle distances are
+computed only for the candidates in those cells. `Directory.search` then
+expands the nearby institutions into their programs, which are stored
+grouped by institution and cheapest first, and applies the budget and
+stream filters to those programs only.
+"""
+import hashlib
+import io
+import os
+from dataclasses import dataclass
+from math import ceil, cos, radians
+
+import numpy as np
+
+INSTITUTIONS_PATH = os.environ.get("ADMITBOT_INSTITUTIONS")
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = EARTH_RADIUS_KM * np.pi / 180
+CELL_KM = 25.0
+COLUMNS = ("institution", "city", "latitude", "longitude", "stream", "program", "annual_fee")
+
+
+@dataclass(frozen=True)
+class Match:
+    institution: str
+    city: str
+    distance_km: float
+    stream: str
+    program: str
+    annual_fee: int
+
+
+def haversine_km(lat, lon, lats, lons):
+    """Great-circle distances from (lat, lon) to each of `lats`/`lons`, in km."""
+    lat, lon, lats, lons = np.radians(lat), np.radians(lon), np.radians(lats), np.radians(lons)
+    a = np.sin((lats - lat) / 2) ** 2 + np.cos(lat) * np.cos(lats) * np.sin((lons - lon) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class GeoGrid:
+    def __init__(self, lats, lons, cell_km=CELL_KM):
+        self.lats = np.asarray(lats, dtype=np.float64)
+        self.lons = np.asarray(lons, dtype=np.float64)
+        self._cell = cell_km / KM_PER_DEGREE   # degrees
+        self._columns = ceil(360 / self._cell) + 1
+        keys = self._row(self.lats) * self._columns + self._column(self.lons)
+        self._order = np.argsort(keys, kind="stable")
+        self._keys = keys[self._order]
+
+    def _row(self, lat):
+        return np.floor((np.asarray(lat) + 90) / self._cell).astype(np.int64)
+
+    def _column(self, lon):
+        return np.floor((np.asarray(lon) + 180) / self._cell).astype(np.int64)
+
+    def __len__(self):
+        return len(self._order)
+
+    def within(self, lat, lon, radius_km):
+        """(ids, distances in km) of the points within `radius_km` of (lat, lon), nearest first."""
+        dlat = radius_km / KM_PER_DEGREE
+        # A degree of longitude shrinks towards the poles; size the box for the widest point
+        widest = min(abs(lat) + dlat, 89.9)
+        dlon = min(radius_km / (KM_PER_DEGREE * cos(radians(widest))), 180.0)
+        rows = np.arange(self._row(max(lat - dlat, -90.0)), self._row(min(lat + dlat, 90.0)) + 1)
+        west, east = lon - dlon, lon + dlon
+        if dlon >= 180:
+            spans = [(-180.0, 180.0)]
+        elif west < -180:   # the box crosses the antimeridian
+            spans = [(west + 360, 180.0), (-180.0, east)]
+        elif east > 180:
+            spans = [(west, 180.0), (-180.0, east - 360)]
+        else:
+            spans = [(west, east)]
+        slices = []
+        for west, east in spans:
+            starts = np.searchsorted(self._keys, rows * self._columns + self._column(west), side="left")
+            ends = np.searchsorted(self._keys, rows * self._columns + self._column(east), side="right")
+            slices += [self._order[start:end] for start, end in zip(starts, ends) if end > start]
+        if not slices:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        candidates = np.concatenate(slices)
+        distances = haversine_km(lat, lon, self.lats[candidates], self.lons[candidates])
+        inside = distances <= radius_km
+        candidates, distances = candidates[inside], distances[inside]
+        nearest = np.argsort(distances, kind="stable")
+        return candidates[nearest], distances[nearest]
+
+
+class Directory:
+    """Institutions and their programs, searchable by distance, budget and stream."""
+
+    def __init__(self, frame, version=""):
+        self.version = version
+        # Names repeat across cities ("Government Engineering College"), so an institution is a
+        # name at a place. Programs are grouped by institution (CSR offsets), cheapest first.
+        ids = frame.groupby(["institution", "city", "latitude", "longitude"], sort=True).ngroup()
+        frame = frame.assign(_id=ids).sort_values(["_id", "annual_fee", "program"], kind="stable")
+        institutions = frame.drop_duplicates("_id")
+        self.names = institutions["institution"].to_numpy(dtype=object)
+        self.cities = institutions["city"].to_numpy(dtype=object)
+        self.grid = GeoGrid(institutions["latitude"].to_numpy(), institutions["longitude"].to_numpy())
+        self._offsets = np.searchsorted(frame["_id"].to_numpy(), np.arange(len(self.names) + 1))
+        self.streams = tuple(sorted(frame["stream"].unique()))
+        self._stream_codes = np.searchsorted(np.array(self.streams, dtype=object),
+                                             frame["stream"].to_numpy(dtype=object)).astype(np.int16)
+        self._programs = frame["program"].to_numpy(dtype=object)
+        self._fees = frame["annual_fee"].to_numpy(dtype=np.int64)
+        # City -> mean (latitude, longitude) of its institutions, for picking a location
+        centres = institutions.groupby("city", sort=True)[["latitude", "longitude"]].mean()
+        self.city_centres = {city: (float(lat), float(lon)) for city, lat, lon in centres.itertuples()}
+
+    def __len__(self):
+        return len(self.names)
+
+    def _programs_of(self, institutions):
+        starts = self._offsets[institutions]
+        counts = self._offsets[institutions + 1] - starts
+        owners = np.repeat(np.arange(len(institutions)), counts)
+        programs = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + starts[owners]
+        return programs, owners
+
+    def search(self, lat, lon, radius_km, low, high, stream=None, limit=100):
+        """Programs within `radius_km` with low <= annual_fee <= high, nearest institution first.
+
+        Returns up to `limit` `Match`es and the number of programs and of
+        institutions that qualify.
+        """
+        institutions, distances = self.grid.within(lat, lon, radius_km)
+        programs, owners = self._programs_of(institutions)
+        keep = (self._fees[programs] >= low) & (self._fees[programs] <= high)
+        if stream is not None:
+            if stream not in self.streams:
+                return [], 0, 0
+            keep &= self._stream_codes[programs] == self.streams.index(stream)
+        programs, owners = programs[keep], owners[keep]
+        matches = [
+            Match(
+                self.names[institutions[owner]], self.cities[institutions[owner]], round(float(distances[owner]), 1),
+                self.streams[self._stream_codes[program]], self._programs[program], int(self._fees[program]),
+            )
+            for program, owner in zip(programs[:limit], owners[:limit])
+        ]
+        return matches, len(programs), len(np.unique(owners))
+
+
+def load_directory(path=INSTITUTIONS_PATH):
+    import pandas as pd
+
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    frame = pd.read_csv(io.BytesIO(raw), usecols=list(COLUMNS))
+    return Directory(frame, hashlib.sha256(raw).hexdigest()[:12])
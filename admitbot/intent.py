@@ -0,0 +1,160 @@
+"""Intent classifier for the Home page chat box.
+
+A multinomial logistic regression over hashed features, in plain NumPy:
+
+- features are words, word bigrams and character 3-grams of each word
+  (which keeps misspellings like "eligiblity" close to the original),
+  hashed with CRC32 into DIM buckets and L2-normalized
+- the model is a (DIM, intents) weight matrix plus a bias, so a question
+  costs one CRC32 per feature and a sum over a few dozen weight rows
+
+Training happens offline on data/intents/train.tsv (intent<TAB>question)
+and writes data/intent_model.npz, which the app loads once per process.
+data/intents/test.tsv is held out; benchmarks/intent.py reports accuracy on
+it along with latency and throughput.
+
+Usage:
+    python -m admitbot.intent [--epochs 1000]
+"""
+import argparse
+import hashlib
+import re
+import sys
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from admitbot.catalog import DATA_DIR
+
+MODEL_PATH = DATA_DIR / "intent_model.npz"
+TRAIN_PATH = DATA_DIR / "intents" / "train.tsv"
+TEST_PATH = DATA_DIR / "intents" / "test.tsv"
+
+DIM = 2 ** 12
+L2 = 1e-4
+LEARNING_RATE = 2.0
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def features(text):
+    words = _WORD.findall(text.lower())
+    grams = [f"w:{word}" for word in words]
+    grams += [f"b:{first} {second}" for first, second in zip(words, words[1:])]
+    for word in words:
+        padded = f"<{word}>"
+        grams += [f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2)]
+    return grams
+
+
+def hashed(text, dim=DIM):
+    """Sorted unique feature buckets of `text`."""
+    return np.unique(np.fromiter((zlib.crc32(gram.encode()) % dim for gram in features(text)), dtype=np.int64))
+
+
+def encode(texts, dim=DIM):
+    """Dense L2-normalized feature matrix, for training."""
+    matrix = np.zeros((len(texts), dim), dtype=np.float32)
+    for row, text in enumerate(texts):
+        buckets = hashed(text, dim)
+        if len(buckets):
+            matrix[row, buckets] = 1 / np.sqrt(len(buckets))
+    return matrix
+
+
+def read_examples(path):
+    labels, texts = [], []
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                label, text = line.rstrip("\n").split("\t", 1)
+                labels.append(label)
+                texts.append(text)
+    return labels, texts
+
+
+@dataclass(frozen=True)
+class Intent:
+    name: str
+    confidence: float
+
+
+class IntentModel:
+    def __init__(self, weights, bias, intents, version=""):
+        self.weights = weights
+        self.bias = bias
+        self.intents = tuple(intents)
+        self.version = version
+        self.dim = weights.shape[0]
+
+    @classmethod
+    def load(cls, path=MODEL_PATH):
+        version = hashlib.sha256(Path(path).read_bytes()).hexdigest()[:12]
+        with np.load(path) as data:
+            return cls(data["weights"], data["bias"], data["intents"].tolist(), version)
+
+    def save(self, path=MODEL_PATH):
+        np.savez_compressed(path, weights=self.weights, bias=self.bias, intents=np.array(self.intents))
+
+    def logits(self, text):
+        buckets = hashed(text, self.dim)
+        if not len(buckets):
+            return self.bias.copy()
+        return self.weights[buckets].sum(axis=0) / np.sqrt(len(buckets)) + self.bias
+
+    def classify(self, text):
+        logits = self.logits(text)
+        probabilities = np.exp(logits - logits.max())
+        probabilities /= probabilities.sum()
+        best = int(probabilities.argmax())
+        return Intent(self.intents[best], float(probabilities[best]))
+
+    def predict(self, texts):
+        """Most likely intent for each of `texts`."""
+        scores = np.stack([self.logits(text) for text in texts]) if texts else np.empty((0, len(self.intents)))
+        return [self.intents[i] for i in scores.argmax(axis=1)]
+
+
+def train(labels, texts, epochs=1000, dim=DIM):
+    """Full-batch gradient descent on the softmax cross-entropy; deterministic."""
+    intents = sorted(set(labels))
+    x = encode(texts, dim)
+    y = np.zeros((len(labels), len(intents)), dtype=np.float32)
+    y[np.arange(len(labels)), [intents.index(label) for label in labels]] = 1
+    weights = np.zeros((dim, len(intents)), dtype=np.float32)
+    bias = np.zeros(len(intents), dtype=np.float32)
+    for _ in range(epochs):
+        logits = x @ weights + bias
+        logits -= logits.max(axis=1, keepdims=True)
+        probabilities = np.exp(logits)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        error = (probabilities - y) / len(labels)
+        weights -= LEARNING_RATE * (x.T @ error + L2 * weights)
+        bias -= LEARNING_RATE * error.sum(axis=0)
+    return IntentModel(weights, bias, intents)
+
+
+def accuracy(model, labels, texts):
+    return float(np.mean([predicted == label for predicted, label in zip(model.predict(texts), labels)]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train the chat intent classifier.")
+    parser.add_argument("--epochs", type=int, default=1000)
+    parser.add_argument("--output", default=str(MODEL_PATH))
+    args = parser.parse_args(argv)
+
+    labels, texts = read_examples(TRAIN_PATH)
+    model = train(labels, texts, args.epochs)
+    model.save(args.output)
+    print(
+        f"{len(texts)} examples, {len(model.intents)} intents; accuracy "
+        f"train {accuracy(model, labels, texts):.1%}, test {accuracy(model, *read_examples(TEST_PATH)):.1%}",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Amortization schedules for the partner-bank education loans.
+
+An amortization schedule is linear in the principal, so each bank x tenure
+pair is computed once as a schedule for a ₹1 loan. The EMI, interest and
+full schedule for any principal are then a multiply. The bank comparison
+for a Fee Structure selection is that selection's net fee, one cell of
+the fee matrix, times the (banks, tenures) EMI factors.
+
+Schedules assume monthly instalments starting straight away, with no
+moratorium.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+TENURES = (3, 5, 7, 10)   # years
+MONTHS = max(TENURES) * 12
+
+
+@dataclass(frozen=True)
+class LoanQuote:
+    bank: str
+    rate: float            # % p.a.
+    emi: float
+    total_interest: float
+    total_repayment: float
+
+
+class LoanBook:
+    def __init__(self, catalog, fee_matrix, tenures=TENURES):
+        self.version = fee_matrix.version
+        self.fee_matrix = fee_matrix
+        self.banks = tuple(catalog.loan_banks)
+        self.rates = np.array([catalog.loan_banks[bank] for bank in self.banks], dtype=float)
+        self.tenures = tuple(tenures)
+
+        monthly = (self.rates / 1200)[:, None]                  # (banks, 1)
+        months = np.array(self.tenures)[None, :] * 12           # (1, tenures)
+        growth = (1 + monthly) ** months
+        interest_free = monthly == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # EMI per ₹1 borrowed; an interest-free loan just repays 1/months a month
+            self.emi_factor = np.where(interest_free, 1 / months, monthly * growth / (growth - 1))
+
+            # Unit schedules, zero-padded past each tenure: balance after month m and
+            # the interest part of instalment m, per bank and tenure
+            m = np.arange(1, MONTHS + 1)[None, None, :]
+            r = monthly[:, :, None]
+            n = months[:, :, None]
+            balance = np.where(
+                interest_free[:, :, None], (n - m) / n, ((1 + r) ** n - (1 + r) ** m) / ((1 + r) ** n - 1),
+            )
+            previous = np.where(
+                interest_free[:, :, None], 1.0, ((1 + r) ** n - (1 + r) ** (m - 1)) / ((1 + r) ** n - 1),
+            )
+        active = m <= n
+        self.unit_balance = np.where(active, balance, 0.0)
+        self.unit_interest = np.where(active, previous * r, 0.0)
+
+    def quotes(self, principal, tenure):
+        """Side-by-side quotes from every bank for one principal and tenure, cheapest first."""
+        t = self.tenures.index(tenure)
+        emi = principal * self.emi_factor[:, t]
+        total = emi * tenure * 12
+        order = np.argsort(emi, kind="stable")
+        return [
+            LoanQuote(self.banks[b], float(self.rates[b]), float(emi[b]), float(total[b] - principal), float(total[b]))
+            for b in order
+        ]
+
+    def annual_emi(self, course, plan, schemes=(), hostel=False):
+        """(banks, tenures) EMI to finance one year of the selection's net fee."""
+        return self.fee_matrix.lookup(course, plan, schemes, hostel) * self.emi_factor
+
+    def schedule(self, principal, bank, tenure):
+        """Yearly rows of (year, instalments paid, interest, principal repaid, closing balance)."""
+        b = self.banks.index(bank)
+        t = self.tenures.index(tenure)
+        months = tenure * 12
+        emi = principal * self.emi_factor[b, t]
+        interest = (principal * self.unit_interest[b, t, :months]).reshape(tenure, 12).sum(axis=1)
+        balance = principal * self.unit_balance[b, t, 11:months:12]
+        return [
+            (year + 1, emi * 12, interest[year], emi * 12 - interest[year], max(balance[year], 0.0))
+            for year in range(tenure)
+        ]
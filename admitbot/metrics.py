@@ -0,0 +1,213 @@
+"""In-process metrics, exported in Prometheus text format.
+
+One registry per server process aggregates across all sessions:
+
+- `timer(name, **labels)` times a block into a histogram; `section(name)`
+  is shorthand for the expensive parts of a page
+- `inc(name, **labels)` bumps a counter
+- `counted_cache(cache)` wraps an `st.cache_*` decorator and counts hits
+  and misses per function: a miss is a call that actually runs its body
+
+Exposition is opt-in:
+
+- ADMITBOT_METRICS_PORT=9464 serves http://127.0.0.1:9464/metrics
+- ADMITBOT_METRICS_FILE=/path/admitbot.prom rewrites the file every
+  METRICS_INTERVAL seconds (node_exporter textfile collector format)
+
+ADMITBOT_METRICS=0 turns recording off entirely (timers become no-ops);
+benchmarks/metrics_overhead.py measures what recording costs.
+"""
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from streamlit.logger import get_logger
+
+ENABLED = os.environ.get("ADMITBOT_METRICS", "1") != "0"
+METRICS_INTERVAL = 15  # seconds between textfile rewrites
+log = get_logger(__name__)
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_HELP = {
+    "admitbot_page_render_seconds": "Time to render one sidebar page.",
+    "admitbot_section_seconds": "Time spent in an expensive section of a page.",
+    "admitbot_fragment_seconds": "Time to run an interactive fragment, in full or partial reruns.",
+    "admitbot_cache_requests_total": "Calls to a cached accessor.",
+    "admitbot_cache_misses_total": "Calls to a cached accessor that had to compute the value.",
+    "admitbot_cache_hits_total": "Calls to a cached accessor served from the cache.",
+    "admitbot_chat_questions_total": "Home page chat questions, by the intent they were routed to.",
+    "admitbot_chat_first_token_seconds": "Time from a chat question to the first chunk of its streamed answer.",
+    "admitbot_data_reload_seconds": "Time to reload a changed data file and clear the caches built from it.",
+}
+
+
+class Registry:
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters = {}     # (name, labels) -> value
+        self._histograms = {}   # (name, labels) -> [bucket counts..., +Inf count, sum]
+
+    def inc(self, name, value=1, **labels):
+        if not ENABLED:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        if not ENABLED:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            cells = self._histograms.get(key)
+            if cells is None:
+                cells = self._histograms[key] = [0] * (len(self.buckets) + 2)
+            cells[bisect_left(self.buckets, seconds)] += 1
+            cells[-1] += seconds
+
+    @contextmanager
+    def _timer(self, name, labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def timer(self, name, **labels):
+        return self._timer(name, labels) if ENABLED else nullcontext()
+
+    def counter(self, name, **labels):
+        return self._counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._counters), {key: list(cells) for key, cells in self._histograms.items()}
+
+    def render(self):
+        """Everything recorded so far, in Prometheus text exposition format."""
+        counters, histograms = self.snapshot()
+        # Hits are derived so the two cache counters can't drift apart
+        for (name, labels), value in list(counters.items()):
+            if name == "admitbot_cache_requests_total":
+                misses = counters.get(("admitbot_cache_misses_total", labels), 0)
+                counters[("admitbot_cache_hits_total", labels)] = value - misses
+
+        lines = []
+        for name in sorted({name for name, _ in counters}):
+            lines += [f"# HELP {name} {_HELP.get(name, name)}", f"# TYPE {name} counter"]
+            lines += [f"{name}{_labels(labels)} {value}" for (n, labels), value in sorted(counters.items()) if n == name]
+        for name in sorted({name for name, _ in histograms}):
+            lines += [f"# HELP {name} {_HELP.get(name, name)}", f"# TYPE {name} histogram"]
+            for (n, labels), cells in sorted(histograms.items()):
+                if n != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip(self.buckets + ("+Inf",), cells):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_labels(labels + (('le', str(bound)),))} {cumulative}")
+                lines.append(f"{name}_sum{_labels(labels)} {cells[-1]:.6f}")
+                lines.append(f"{name}_count{_labels(labels)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"') for _, value in labels)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped)) + "}"
+
+
+REGISTRY = Registry()
+timer = REGISTRY.timer
+inc = REGISTRY.inc
+
+
+def section(name):
+    return REGISTRY.timer("admitbot_section_seconds", section=name)
+
+
+def counted_cache(cache, name=None):
+    """Apply `cache` (e.g. `st.cache_resource(...)`) to a function, counting hits and misses."""
+    def decorate(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def compute(*args, **kwargs):
+            if ENABLED:
+                REGISTRY.inc("admitbot_cache_misses_total", cache=label)
+            return func(*args, **kwargs)
+
+        cached = cache(compute)
+
+        @functools.wraps(func)
+        def lookup(*args, **kwargs):
+            if ENABLED:
+                REGISTRY.inc("admitbot_cache_requests_total", cache=label)
+            return cached(*args, **kwargs)
+
+        lookup.clear = cached.clear
+        return lookup
+    return decorate
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = REGISTRY.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _write_file(path):
+    failing = None
+    while True:
+        tmp = f"{path}.tmp"
+        try:
+            with open(tmp, "w") as fh:
+                fh.write(REGISTRY.render())
+            os.replace(tmp, path)
+        except OSError as error:
+            # Disk full, a missing directory, permissions: keep trying, but log each new error once
+            if str(error) != failing:
+                log.warning("writing metrics to %s failed: %s; retrying every %s s", path, error, METRICS_INTERVAL)
+            failing = str(error)
+        else:
+            if failing is not None:
+                log.info("writing metrics to %s works again", path)
+            failing = None
+        time.sleep(METRICS_INTERVAL)
+
+
+def start_exporters(port=None, path=None):
+    """Start the HTTP endpoint and/or textfile writer configured by the environment."""
+    port = port or os.environ.get("ADMITBOT_METRICS_PORT")
+    path = path or os.environ.get("ADMITBOT_METRICS_FILE")
+    started = []
+    if port:
+        try:
+            server = ThreadingHTTPServer(("127.0.0.1", int(port)), _Handler)
+        except OSError as error:
+            # Port taken (another server process, or a restart racing the old socket): serve the app without it
+            log.warning("metrics endpoint not started on port %s: %s", port, error)
+        else:
+            threading.Thread(target=server.serve_forever, name="admitbot-metrics-http", daemon=True).start()
+            started.append(server)
+    if path:
+        thread = threading.Thread(target=_write_file, args=(path,), name="admitbot-metrics-file", daemon=True)
+        thread.start()
+        started.append(thread)
+    return started
@@ -0,0 +1,304 @@
+"""Streaming ingestion of per-offer placement records.
+
+The placement office exports one row per offer (year, branch, company,
+package in LPA) as CSV or Parquet files under data/offers/. Files are read
+in fixed-size chunks and folded into per-(year, branch, company) cells, so
+memory stays bounded no matter how many rows there are. Each cell keeps
+exact count/sum/min/max plus a t-digest for quantiles. Per-year,
+per-branch and per-recruiter figures, medians included, are rollups over
+those cells.
+
+A manifest records how far each file has been consumed (byte offset for
+CSV, row count for Parquet), so dropping in a new year's file, or appending
+rows to an existing CSV, only processes the new rows. It also keeps each
+file's size, mtime and a hash of the bytes already read. A file whose size
+or mtime moved is only resumed if it still starts with those bytes;
+anything else (an edit in place, a rewritten Parquet file) rebuilds the
+aggregates from every file. The aggregates and manifest are saved next to
+the data and reloaded on startup. The running app watches the directory
+(`signature`) and swaps in refreshed aggregates when files change (see
+admitbot/reload.py).
+
+Usage:
+    python -m admitbot.offers [directory]
+"""
+import copy
+import hashlib
+import json
+import math
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from admitbot.catalog import DATA_DIR
+from admitbot.sketch import TDigest
+
+OFFERS_DIR = DATA_DIR / "offers"
+STATE_FILE = "aggregates.json"
+STATE_FORMAT = 3
+COLUMNS = ["year", "branch", "company", "package_lpa"]
+CHUNK_ROWS = 100_000
+HASH_BLOCK = 1 << 20
+DIMENSIONS = ("year", "branch", "company")
+
+
+def _prefix_digest(path, length):
+    """sha256 of the first `length` bytes of `path`."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while length > 0:
+            block = fh.read(min(length, HASH_BLOCK))
+            if not block:
+                break
+            digest.update(block)
+            length -= len(block)
+    return digest.hexdigest()
+
+
+class Cell:
+    """Running count, sum, min, max and quantile sketch of packages for one aggregation cell."""
+
+    __slots__ = ("count", "total", "low", "high", "digest")
+
+    def __init__(self, count=0, total=0.0, low=math.inf, high=-math.inf, digest=None):
+        self.count = count
+        self.total = total
+        self.low = low
+        self.high = high
+        self.digest = digest if digest is not None else TDigest()
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        self.low = min(self.low, other.low)
+        self.high = max(self.high, other.high)
+        self.digest.merge(other.digest)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q):
+        return self.digest.quantile(q)
+
+
+class OfferAggregates:
+    def __init__(self):
+        self.cells = {}     # (year, branch, company) -> Cell
+        self.manifest = {}  # file name -> {"size", "mtime", "consumed", "hashed", "digest"}
+        self._distributions = {}
+
+    @property
+    def version(self):
+        digest = hashlib.sha256(json.dumps(self.manifest, sort_keys=True).encode())
+        return digest.hexdigest()[:12]
+
+    @property
+    def rows(self):
+        return sum(cell.count for cell in self.cells.values())
+
+    def ingest_frame(self, frame):
+        if frame.empty:   # a header-only file, or a touched one with nothing new
+            return 0
+        # Sort packages within each group once, then every per-group statistic
+        # (and the group's digest) comes from a contiguous slice.
+        groups = frame.groupby(list(DIMENSIONS), sort=False, observed=True).ngroup().to_numpy()
+        packages = frame["package_lpa"].to_numpy(dtype=float)
+        order = np.lexsort((packages, groups))
+        packages = packages[order]
+        starts = np.flatnonzero(np.r_[True, groups[order][1:] != groups[order][:-1]])
+        ends = np.r_[starts[1:], len(packages)]
+        totals = np.add.reduceat(packages, starts)
+        keys = frame[list(DIMENSIONS)].to_numpy()[order[starts]]
+        self._distributions.clear()
+        for (year, branch, company), start, end, total in zip(keys, starts, ends, totals):
+            values = packages[start:end]
+            key = (int(year), branch, company)
+            cell = self.cells.get(key)
+            if cell is None:
+                cell = self.cells[key] = Cell()
+            cell.merge(Cell(len(values), float(total), values[0], values[-1], TDigest.from_sorted(values)))
+        return len(frame)
+
+    def _ingest_csv(self, path, consumed, chunk_rows):
+        import pandas as pd
+
+        with open(path, "rb") as fh:
+            header = fh.readline().decode().strip().split(",")
+            fh.seek(max(consumed, fh.tell()))
+            rows = 0
+            reader = pd.read_csv(
+                fh, names=header, header=None, usecols=COLUMNS, chunksize=chunk_rows,
+                dtype={"year": "int32", "branch": "category", "company": "category", "package_lpa": "float64"},
+            )
+            for chunk in reader:
+                rows += self.ingest_frame(chunk)
+            return rows, fh.tell()
+
+    def _ingest_parquet(self, path, consumed, chunk_rows):
+        import pyarrow.parquet as pq
+
+        rows = 0
+        seen = 0
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows, columns=COLUMNS):
+            skip = min(max(consumed - seen, 0), batch.num_rows)
+            seen += batch.num_rows
+            if skip < batch.num_rows:
+                rows += self.ingest_frame(batch.slice(skip).to_pandas())
+        return rows, seen
+
+    def status(self, path):
+        """"new", "unchanged", "appended" or "rewritten": how `path` compares with what was ingested."""
+        path = Path(path)
+        entry = self.manifest.get(path.name)
+        if entry is None:
+            return "new"
+        stat = path.stat()
+        if (stat.st_size, stat.st_mtime_ns) == (entry["size"], entry["mtime"]):
+            return "unchanged"
+        if stat.st_size < entry["hashed"] or _prefix_digest(path, entry["hashed"]) != entry["digest"]:
+            return "rewritten"
+        # Touched, or rewritten with the same bytes: nothing new to read
+        return "appended" if stat.st_size > entry["size"] else "unchanged"
+
+    def ingest_file(self, path, chunk_rows=CHUNK_ROWS):
+        """Fold the unread part of `path` into the aggregates; returns rows read.
+
+        Assumes the part already read is unchanged, which `refresh` checks.
+        """
+        path = Path(path)
+        entry = self.manifest.get(path.name, {"consumed": 0})
+        stat = path.stat()
+        if path.suffix == ".parquet":
+            # Row offsets only hold while the whole file is unchanged, so hash all of it
+            rows, consumed = self._ingest_parquet(path, entry["consumed"], chunk_rows)
+            hashed = stat.st_size
+        else:
+            rows, consumed = self._ingest_csv(path, entry["consumed"], chunk_rows)
+            hashed = consumed
+        self.manifest[path.name] = {
+            "size": stat.st_size, "mtime": stat.st_mtime_ns, "consumed": consumed,
+            "hashed": hashed, "digest": _prefix_digest(path, hashed),
+        }
+        return rows
+
+    def refresh(self, directory=OFFERS_DIR, chunk_rows=CHUNK_ROWS):
+        """Ingest new files and new rows under `directory`; returns rows read.
+
+        If a file was edited or rewritten rather than appended to, or was
+        removed, the aggregates are rebuilt from scratch.
+        """
+        paths = _offer_files(directory)
+        statuses = {path: self.status(path) for path in paths}
+        removed = self.manifest.keys() - {path.name for path in paths}
+        if removed or "rewritten" in statuses.values():
+            self.cells.clear()
+            self.manifest.clear()
+            self._distributions.clear()
+            statuses = dict.fromkeys(paths, "new")
+        rows = sum(self.ingest_file(path, chunk_rows) for path, status in statuses.items() if status != "unchanged")
+        # Leave every digest compressed so concurrent readers only ever read them
+        for cell in self.cells.values():
+            cell.digest.compress()
+        return rows
+
+    def rollup(self, by, **filters):
+        """Merge cells into one Cell per value of dimension `by`.
+
+        Filters select on the other dimensions, e.g. rollup("company", year=2023).
+        `by=None` collapses everything that matches into a single Cell.
+        """
+        positions = {name: DIMENSIONS.index(name) for name in filters}
+        out = {}
+        for key, cell in self.cells.items():
+            if any(key[positions[name]] != value for name, value in filters.items()):
+                continue
+            group = key[DIMENSIONS.index(by)] if by else None
+            out.setdefault(group, Cell()).merge(cell)
+        return out if by else out.get(None, Cell())
+
+    def distribution(self, **filters):
+        """Rolled-up Cell for one filter combination, e.g. distribution(year=2023, branch="ECE").
+
+        Merged results are memoized until the next ingest, so repeated
+        quantile lookups for the same filters skip the digest merge.
+        """
+        key = tuple(sorted(filters.items()))
+        cell = self._distributions.get(key)
+        if cell is None:
+            cell = self.rollup(None, **filters)
+            cell.digest.compress()
+            self._distributions[key] = cell
+        return cell
+
+    def values(self, dimension, **filters):
+        position = DIMENSIONS.index(dimension)
+        return sorted({key[position] for key in self.cells if all(
+            key[DIMENSIONS.index(name)] == value for name, value in filters.items()
+        )})
+
+    def years(self):
+        return self.values("year")
+
+    def save(self, path):
+        state = {
+            "format": STATE_FORMAT,
+            "manifest": self.manifest,
+            "cells": [
+                [*key, cell.count, cell.total, cell.low, cell.high, *cell.digest.state()]
+                for key, cell in self.cells.items()
+            ],
+        }
+        tmp = Path(path).with_suffix(".tmp")
+        tmp.write_text(json.dumps(state))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        aggregates = cls()
+        state = json.loads(Path(path).read_text()) if Path(path).exists() else {}
+        # Older or unknown state files are ignored, which re-ingests everything
+        if state.get("format") == STATE_FORMAT:
+            aggregates.manifest = state["manifest"]
+            for year, branch, company, count, total, low, high, means, weights in state["cells"]:
+                digest = TDigest.from_centroids(means, weights, low, high)
+                aggregates.cells[(year, branch, company)] = Cell(count, total, low, high, digest)
+        return aggregates
+
+
+def _offer_files(directory):
+    return sorted(Path(directory).glob("*.csv")) + sorted(Path(directory).glob("*.parquet"))
+
+
+def signature(directory=OFFERS_DIR):
+    """Name, size and mtime of every offer file; changes when one is added, removed or written to."""
+    files = []
+    for path in _offer_files(directory):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        files.append((path.name, stat.st_size, stat.st_mtime_ns))
+    return tuple(files)
+
+
+def load_offers(directory=OFFERS_DIR, previous=None):
+    """Saved aggregates for `directory`, brought up to date with any new rows.
+
+    Given `previous`, the aggregates in use, a copy of them is refreshed
+    instead, so sessions reading `previous` never see a half-applied ingest.
+    """
+    state_path = Path(directory) / STATE_FILE
+    aggregates = copy.deepcopy(previous) if previous is not None else OfferAggregates.load(state_path)
+    if aggregates.refresh(directory) and os.access(directory, os.W_OK):
+        aggregates.save(state_path)
+    return aggregates
+
+
+if __name__ == "__main__":
+    directory = Path(sys.argv[1]) if len(sys.argv) > 1 else OFFERS_DIR
+    before = OfferAggregates.load(directory / STATE_FILE).rows
+    offers = load_offers(directory)
+    print(f"{offers.rows - before:,} new rows, {offers.rows:,} total across {len(offers.manifest)} files")
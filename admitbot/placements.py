@@ -0,0 +1,60 @@
+"""Yearly placement summary and the Placement Statistics charts.
+
+plotly is imported inside `figure_specs` so importing this module stays
+cheap; the charts are built once per dataset version and cached as plotly
+JSON by `admitbot.resources`.
+"""
+import hashlib
+import json
+from dataclasses import dataclass
+
+from admitbot.catalog import DATA_DIR
+
+PLACEMENTS_PATH = DATA_DIR / "placements.json"
+
+
+@dataclass(frozen=True)
+class PlacementSummary:
+    version: str
+    years: tuple
+    avg_salary: tuple      # LPA
+    placement_rate: tuple  # percent
+    companies: tuple
+
+
+def load_placements(path=PLACEMENTS_PATH):
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    return placements_from_dict(json.loads(raw), hashlib.sha256(raw).hexdigest()[:12])
+
+
+def placements_from_dict(data, version):
+    return PlacementSummary(
+        version=version,
+        years=tuple(data["years"]),
+        avg_salary=tuple(data["avg_salary"]),
+        placement_rate=tuple(data["placement_rate"]),
+        companies=tuple(data["companies"]),
+    )
+
+
+def figure_specs(summary):
+    """Serialized plotly JSON for each chart on the page."""
+    import plotly.express as px
+    import plotly.io as pio
+
+    years = list(summary.years)
+    salary_trend = px.line(
+        x=years, y=list(summary.avg_salary),
+        title="Average Package Trends (LPA)",
+        labels={'x': 'Year', 'y': 'Average Package (LPA)'}
+    )
+    placement_rate = px.bar(
+        x=years, y=list(summary.placement_rate),
+        title="Placement Rate (%)",
+        labels={'x': 'Year', 'y': 'Placement Rate (%)'}
+    )
+    return {
+        "salary_trend": pio.to_json(salary_trend, validate=False),
+        "placement_rate": pio.to_json(placement_rate, validate=False),
+    }
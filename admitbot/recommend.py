@@ -0,0 +1,143 @@
+"""Vectorized course recommendations for Student Counseling.
+
+Every program in the catalog is encoded once per catalog version as a row
+of multi-hot features (interests | strengths | accepted exams) plus an
+eligibility table (12th stream, minimum percentage). A student profile is
+encoded as a weight vector over the same columns, so scoring every program
+is one matrix product, and the best k come out of `np.argpartition`
+without sorting the whole catalog. Batches of profiles score together as a
+matrix-matrix product.
+
+Score, between 0 and 1 for eligible programs:
+
+    0.4 * share of the student's interests the program covers
+  + 0.3 * share of the student's strengths the program uses
+  + 0.2 * exam score / 100, if the program accepts the student's exam
+  + 0.1 * how far the 12th percentage clears the program's minimum (capped at 25 points)
+
+Programs the student is not eligible for score -inf and are never returned.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+STUDENT_STREAMS = ("Science", "Commerce", "Arts")
+INTERESTS = ("Technology", "Healthcare", "Business", "Creative Arts", "Science", "Social Sciences")
+STRENGTHS = ("Mathematics", "Programming", "Biology", "Communication", "Creativity", "Analysis")
+EXAMS = ("JEE", "NEET", "CAT", "Other")
+
+INTEREST_WEIGHT = 0.4
+STRENGTH_WEIGHT = 0.3
+EXAM_WEIGHT = 0.2
+MARGIN_WEIGHT = 0.1
+MARGIN_CAP = 25.0
+
+_INTEREST_COLS = slice(0, len(INTERESTS))
+_STRENGTH_COLS = slice(len(INTERESTS), len(INTERESTS) + len(STRENGTHS))
+_EXAM_COLS = slice(len(INTERESTS) + len(STRENGTHS), len(INTERESTS) + len(STRENGTHS) + len(EXAMS))
+_FEATURES = len(INTERESTS) + len(STRENGTHS) + len(EXAMS)
+
+
+@dataclass(frozen=True)
+class Profile:
+    stream: str
+    percentage: float
+    interests: tuple = ()
+    strengths: tuple = ()
+    exam: str = "None"
+    exam_score: float = 0.0
+
+
+@dataclass(frozen=True)
+class Recommendation:
+    stream: str
+    course: str
+    score: float
+    interests: tuple  # the student's interests this program covers
+    strengths: tuple  # the student's strengths this program uses
+
+
+def _multi_hot(labels, vocabulary):
+    row = np.zeros(len(vocabulary), dtype=np.float32)
+    for label in labels:
+        if label in vocabulary:
+            row[vocabulary.index(label)] = 1.0
+    return row
+
+
+class Recommender:
+    def __init__(self, catalog):
+        self.version = catalog.version
+        self.keys = [(stream, course) for stream, courses in catalog.streams.items() for course in courses]
+        programs = [catalog.streams[stream][course] for stream, course in self.keys]
+        self.features = np.zeros((len(programs), _FEATURES), dtype=np.float32)
+        self.eligible_streams = np.zeros((len(programs), len(STUDENT_STREAMS)), dtype=bool)
+        self.min_percentage = np.zeros(len(programs), dtype=np.float32)
+        for row, details in enumerate(programs):
+            self.features[row, _INTEREST_COLS] = _multi_hot(details.get("interests", ()), INTERESTS)
+            self.features[row, _STRENGTH_COLS] = _multi_hot(details.get("strengths", ()), STRENGTHS)
+            self.features[row, _EXAM_COLS] = _multi_hot(details.get("exams", ()), EXAMS)
+            streams = details.get("student_streams", STUDENT_STREAMS)
+            self.eligible_streams[row] = _multi_hot(streams, STUDENT_STREAMS) > 0
+            self.min_percentage[row] = details.get("min_percentage", 0)
+
+    def __len__(self):
+        return len(self.keys)
+
+    @staticmethod
+    def encode(profiles):
+        """(weights, stream index, percentage) arrays for a sequence of profiles."""
+        weights = np.zeros((len(profiles), _FEATURES), dtype=np.float32)
+        streams = np.zeros(len(profiles), dtype=np.intp)
+        percentages = np.zeros(len(profiles), dtype=np.float32)
+        for row, profile in enumerate(profiles):
+            interests = _multi_hot(profile.interests, INTERESTS)
+            strengths = _multi_hot(profile.strengths, STRENGTHS)
+            weights[row, _INTEREST_COLS] = INTEREST_WEIGHT * interests / max(interests.sum(), 1)
+            weights[row, _STRENGTH_COLS] = STRENGTH_WEIGHT * strengths / max(strengths.sum(), 1)
+            weights[row, _EXAM_COLS] = EXAM_WEIGHT * _multi_hot((profile.exam,), EXAMS) * profile.exam_score / 100
+            streams[row] = STUDENT_STREAMS.index(profile.stream)
+            percentages[row] = profile.percentage
+        return weights, streams, percentages
+
+    def scores(self, profiles):
+        """(len(profiles), len(self)) matrix of scores, -inf where ineligible."""
+        weights, streams, percentages = self.encode(profiles)
+        margin = percentages[:, None] - self.min_percentage[None, :]
+        scores = weights @ self.features.T
+        scores += MARGIN_WEIGHT * np.clip(margin / MARGIN_CAP, 0, 1)
+        eligible = self.eligible_streams[:, streams].T & (margin >= 0)
+        scores[~eligible] = -np.inf
+        return scores
+
+    def top_k(self, profiles, k=3):
+        """Per profile, (program indices, scores) of the best k eligible programs, best first."""
+        scores = self.scores(profiles)
+        k = min(k, scores.shape[1])
+        if k == 0:
+            return [(np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)) for _ in profiles]
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        results = []
+        for indices, values in zip(top, top_scores):
+            keep = np.isfinite(values)
+            results.append((indices[keep], values[keep]))
+        return results
+
+    def recommend(self, profile, k=3):
+        indices, values = self.top_k([profile], k)[0]
+        results = []
+        for index, score in zip(indices, values):
+            stream, course = self.keys[index]
+            features = self.features[index]
+            results.append(Recommendation(
+                stream=stream,
+                course=course,
+                score=float(score),
+                interests=tuple(i for i in profile.interests if features[_INTEREST_COLS][INTERESTS.index(i)]),
+                strengths=tuple(s for s in profile.strengths if features[_STRENGTH_COLS][STRENGTHS.index(s)]),
+            ))
+        return results
@@ -0,0 +1,142 @@
+"""Hot reload of the data files behind the app's pages.
+
+`DataSources` holds the current value of each data source (the catalog,
+placement summary, FAQ, calendar and offer aggregates) for the whole
+process. A daemon thread polls each file's stat signature every
+RELOAD_INTERVAL seconds; a source spanning a directory, such as the offer
+files, supplies its own signature. When one changes, its source is
+reloaded and the new value swapped in, and sessions see it on their next
+rerun without a restart.
+
+Reloads are incremental. A source's `changes` function names the parts
+that differ from the previous value (for the catalog, its tables), and
+only the dependent caches that read one of those parts are cleared. The
+derived caches are keyed by those same parts, so a rerun racing the
+reload can never pair new data with a stale derived object. Each reload
+is logged with its duration and the caches it invalidated, and recorded
+in admitbot_data_reload_seconds.
+"""
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from streamlit.logger import get_logger
+
+from admitbot import metrics
+
+RELOAD_INTERVAL = float(os.environ.get("ADMITBOT_RELOAD_INTERVAL", "2"))  # seconds; 0 turns watching off
+
+log = get_logger(__name__)
+
+
+def _whole(previous, current):
+    return {"all"}
+
+
+@dataclass(frozen=True)
+class Source:
+    path: object                 # file whose changes trigger a reload
+    load: Callable               # previous value -> current value
+    changes: Callable = _whole   # (previous, current) -> names of the parts that differ
+    dependents: tuple = field(default=())  # (cached function, parts it reads, or None for all)
+    signature: Callable = None   # () -> a value that changes with the data; default: `path`'s stat
+
+
+def _stat_signature(path):
+    # Editors and the store build replace files, so the inode counts too
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _signature(source):
+    return source.signature() if source.signature else _stat_signature(source.path)
+
+
+class DataSources:
+    def __init__(self, sources, interval=RELOAD_INTERVAL):
+        self.sources = sources
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._signatures = {name: _signature(source) for name, source in sources.items()}
+        self._values = {name: source.load(None) for name, source in sources.items()}
+        self._failing = {}   # name -> error of its last failed reload
+        self._thread = None
+
+    def __getitem__(self, name):
+        return self._values[name]
+
+    def get(self, name, default=None):
+        return self._values.get(name, default)
+
+    def check(self):
+        """Reload every source whose file changed since the last check; returns their names."""
+        reloaded = []
+        for name, source in self.sources.items():
+            signature = _signature(source)
+            if signature is not None and signature != self._signatures[name]:
+                status = self.reload(name)
+                # A failed load is retried on the next check, even if the file has not changed again
+                if status != "failed":
+                    self._signatures[name] = signature
+                if status == "reloaded":
+                    reloaded.append(name)
+        return reloaded
+
+    def reload(self, name):
+        """Load `name` again and clear the caches that read a changed part.
+
+        Returns "reloaded", "unchanged" if the data's version is the same,
+        or "failed" if loading raised; the previous value is kept then.
+        """
+        source = self.sources[name]
+        start = time.perf_counter()
+        with self._lock:
+            previous = self._values[name]
+            try:
+                current = source.load(previous)
+            except Exception as error:
+                # A half-written or invalid file: keep serving the previous data, and log each new error once
+                if str(error) != self._failing.get(name):
+                    log.warning(
+                        "reloading %s from %s failed (%s); keeping %s", name, source.path, error, previous.version,
+                    )
+                self._failing[name] = str(error)
+                return "failed"
+            self._failing.pop(name, None)
+            if current.version == previous.version:
+                return "unchanged"
+            changed = source.changes(previous, current)
+            self._values[name] = current
+            invalidated = [
+                cache for cache, parts in source.dependents if parts is None or not changed.isdisjoint(parts)
+            ]
+            for cache in invalidated:
+                cache.clear()
+        elapsed = time.perf_counter() - start
+        metrics.REGISTRY.observe("admitbot_data_reload_seconds", elapsed, source=name)
+        log.info(
+            "reloaded %s %s -> %s in %.1f ms; changed: %s; invalidated: %s",
+            name, previous.version, current.version, elapsed * 1000, ", ".join(sorted(changed)),
+            ", ".join(cache.__name__ for cache in invalidated) or "none",
+        )
+        return "reloaded"
+
+    def _watch(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.check()
+            except Exception:
+                log.exception("data file watcher")
+
+    def start(self):
+        """Poll the files from a daemon thread, once; a no-op when the interval is 0."""
+        if self.interval > 0 and self._thread is None:
+            self._thread = threading.Thread(target=self._watch, name="admitbot-reload", daemon=True)
+            self._thread.start()
+        return self
@@ -0,0 +1,291 @@
+"""Process-wide shared resources.
+
+Everything here is built once per server process with `st.cache_resource`
+and handed to every session as-is, so callers must treat the results as
+read-only. The catalog, placement summary, FAQ, calendar and offer
+aggregates come from `DataSources`, which reloads them when their files
+change (see admitbot/reload.py).
+Derived resources take the data as an argument and are keyed by the
+versions of the parts they read, so new data automatically gets fresh
+copies and the reload only has to clear the caches it made stale.
+"""
+import copy
+import threading
+import zlib
+from datetime import date
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from admitbot import cards, offers, store
+from admitbot.catalog import CATALOG_PATH, Catalog, catalog_from_dict, load_catalog
+from admitbot.chat import AnswerCache, answer, normalize
+from admitbot.deadlines import DEADLINES_PATH, Calendar, CalendarIndex, calendar_from_dict, load_calendar
+from admitbot.faq import FAQ_PATH, Faq, FaqIndex, load_faq
+from admitbot.fee_index import ALL_STREAMS, FeeIndex
+from admitbot.fees import FeeMatrix
+from admitbot.gallery import load_gallery
+from admitbot.institutions import INSTITUTIONS_PATH, load_directory
+from admitbot.intent import IntentModel
+from admitbot.loans import LoanBook
+from admitbot.metrics import counted_cache, start_exporters
+from admitbot.offers import OFFERS_DIR, OfferAggregates, load_offers
+from admitbot.placements import PLACEMENTS_PATH, PlacementSummary, figure_specs, load_placements, placements_from_dict
+from admitbot.recommend import Recommender
+from admitbot.reload import DataSources, Source
+from admitbot.roi import RoiGrid
+from admitbot.simulate import SalaryModel, simulate
+
+_FEE_TABLES = ("fee_courses", "fee_structures", "default_fees", "payment_plans", "scholarships")
+
+
+def _by_tables(*tables):
+    return {Catalog: lambda catalog: catalog.versions(*tables)}
+
+
+_BY_STREAMS = _by_tables("streams")
+_BY_FEES = _by_tables(*_FEE_TABLES)
+_BY_SUMMARY = {PlacementSummary: lambda summary: summary.version}
+_BY_FAQ = {Faq: lambda faq: faq.version}
+_BY_CALENDAR = {Calendar: lambda calendar: calendar.version}
+
+
+@st.cache_resource(show_spinner=False)
+def get_store():
+    """The process's SQLite store (ADMITBOT_DB, see admitbot/store.py), or None when data comes from JSON."""
+    return store.Store() if store.DB_PATH else None
+
+
+def _from_store(build):
+    """Loader reading the process's store, moved to the rebuilt file first if it was replaced."""
+    return lambda previous: build(get_store().reopen(), previous)
+
+
+@st.cache_resource(show_spinner=False)
+def get_data_sources():
+    """The process's current catalog, placement summary, FAQ, calendar and offers, watched for changes."""
+    if store.DB_PATH:
+        catalog = Source(store.DB_PATH, _from_store(
+            lambda db, previous: catalog_from_dict(db.catalog_data(), db.catalog_version, previous)
+        ))
+        placements = Source(store.DB_PATH, _from_store(
+            lambda db, previous: placements_from_dict(db.placements_data(), db.placements_version)
+        ))
+        calendar = Source(store.DB_PATH, _from_store(
+            lambda db, previous: calendar_from_dict(db.deadlines_data(), db.deadlines_version)
+        ))
+    else:
+        catalog = Source(CATALOG_PATH, lambda previous: load_catalog(previous=previous))
+        placements = Source(PLACEMENTS_PATH, lambda previous: load_placements())
+        calendar = Source(DEADLINES_PATH, lambda previous: load_calendar())
+    sources = {
+        "catalog": Source(
+            catalog.path, catalog.load,
+            changes=lambda previous, current: current.changed_tables(previous),
+            dependents=(
+                (get_fee_index, {"streams"}),
+                (get_recommender, {"streams"}),
+                (get_roi_simulation, {"streams"}),
+                (get_fee_matrix, set(_FEE_TABLES)),
+                (get_fee_matrix_csv, set(_FEE_TABLES)),
+                (get_loan_book, {*_FEE_TABLES, "loan_banks"}),
+                (cards.fee_components, {"fee_structures", "default_fees"}),
+                (cards.payment_plans, {"payment_plans"}),
+                (cards.scholarships, {"scholarships"}),
+            ),
+        ),
+        "placements": Source(
+            placements.path, placements.load,
+            dependents=((get_figure_specs, None), (get_placement_figures, None), (get_roi_simulation, None)),
+        ),
+        "faq": Source(FAQ_PATH, lambda previous: load_faq(), dependents=((get_faq_index, None),)),
+        "calendar": Source(
+            calendar.path, calendar.load, dependents=((get_calendar_index, None), (get_calendar_day, None)),
+        ),
+        # Placement Statistics reads the aggregates directly; their distributions are memoized on them
+        "offers": Source(
+            OFFERS_DIR, lambda previous: load_offers(previous=previous),
+            dependents=((get_roi_simulation, None),), signature=offers.signature,
+        ),
+    }
+    if INSTITUTIONS_PATH:
+        sources["institutions"] = Source(INSTITUTIONS_PATH, lambda previous: load_directory())
+    return DataSources(sources).start()
+
+
+def get_catalog():
+    return get_data_sources()["catalog"]
+
+
+@counted_cache(st.cache_resource(show_spinner=False, hash_funcs=_BY_STREAMS))
+def get_fee_index(catalog):
+    return FeeIndex(catalog)
+
+
+def get_programs_in_budget(catalog, low, high, stream=ALL_STREAMS):
+    """(stream, course) pairs with low <= annual_fee <= high, cheapest first.
+
+    Served by the store's pooled connections with ADMITBOT_DB, otherwise by
+    the in-memory `FeeIndex`.
+    """
+    db = get_store()
+    if db is not None:
+        return db.programs_in_budget(low, high, stream)
+    return get_fee_index(catalog).range(low, high, stream)
+
+
+@counted_cache(st.cache_resource(show_spinner=False, hash_funcs=_BY_FEES))
+def get_fee_matrix(catalog):
+    return FeeMatrix(catalog)
+
+
+@counted_cache(st.cache_resource(show_spinner=False, hash_funcs=_BY_FEES))
+def get_fee_matrix_csv(catalog):
+    return get_fee_matrix(catalog).to_csv()
+
+
+@counted_cache(st.cache_resource(show_spinner=False, hash_funcs=_by_tables(*_FEE_TABLES, "loan_banks")))
+def get_loan_book(catalog):
+    """Bank x tenure schedules and EMIs, rebuilt with the fee matrix."""
+    return LoanBook(catalog, get_fee_matrix(catalog))
+
+
+@counted_cache(st.cache_resource(show_spinner=False, hash_funcs=_BY_STREAMS))
+def get_recommender(catalog):
+    return Recommender(catalog)
+
+
+def get_faq():
+    return get_data_sources()["faq"]
+
+
+def get_directory():
+    """Other institutions for College Search (ADMITBOT_INSTITUTIONS), or None."""
+    return get_data_sources().get("institutions")
+
+
+@counted_cache(st.cache_resource(show_spinner=False, hash_funcs=_BY_FAQ))
+def get_faq_index(faq):
+    return FaqIndex(faq)
+
+
+@counted_cache(st.cache_resource(show_spinner=False))
+def get_intent_model():
+    return IntentModel.load()
+
+
+def get_calendar():
+    return get_data_sources()["calendar"]
+
+
+@counted_cache(st.cache_resource(show_spinner=False, hash_funcs=_BY_CALENDAR))
+def get_calendar_index(calendar):
+    return CalendarIndex(calendar)
+
+
+@counted_cache(st.cache_resource(show_spinner=False, max_entries=4, hash_funcs=_BY_CALENDAR))
+def get_calendar_day(calendar, day):
+    """What is open, closing and next on `day`; computed once per day, shared by all sessions."""
+    return get_calendar_index(calendar).day(day)
+
+
+@st.cache_resource(show_spinner=False)
+def get_answer_cache():
+    return AnswerCache()
+
+
+def get_chat_answer(question):
+    """Reply to a chat question, through the answer cache shared by all sessions."""
+    model, catalog, faq, placements = get_intent_model(), get_catalog(), get_faq(), get_placements()
+    calendar, today = get_calendar(), date.today()
+    # Deadline answers count days from today, so the cache starts afresh each day
+    version = (model.version, catalog.version, faq.version, placements.version, calendar.version, today)
+    key = normalize(question)
+    return get_answer_cache().get(key, version, lambda: answer(
+        key, model, catalog, faq, get_faq_index(faq), placements, get_calendar_index(calendar), today,
+    ))
+
+
+def get_placements():
+    return get_data_sources()["placements"]
+
+
+@counted_cache(st.cache_resource(show_spinner=False, hash_funcs=_BY_SUMMARY))
+def get_figure_specs(summary):
+    return figure_specs(summary)
+
+
+@counted_cache(st.cache_resource(show_spinner=False, hash_funcs=_BY_SUMMARY))
+def get_placement_figures(summary):
+    """plotly figures hydrated once from the cached JSON specs.
+
+    st.plotly_chart only serializes the figure it is given, so sharing the
+    hydrated objects skips both figure construction and validation per rerun.
+    """
+    import plotly.io as pio
+
+    return {name: pio.from_json(spec) for name, spec in get_figure_specs(summary).items()}
+
+
+def get_offers():
+    return get_data_sources()["offers"]
+
+
+@counted_cache(st.cache_resource(show_spinner=False))
+def get_gallery():
+    """Manifest of the locally built Campus Gallery, or None (see admitbot/gallery.py)."""
+    return load_gallery()
+
+
+@counted_cache(st.cache_resource(show_spinner=False))
+def get_roi_grid():
+    return RoiGrid()
+
+
+@counted_cache(st.cache_resource(show_spinner=False))
+def get_roi_heatmap(years):
+    return get_roi_grid().heatmap(years)
+
+
+@counted_cache(st.cache_data(
+    show_spinner=False,
+    max_entries=256,
+    hash_funcs={**_BY_STREAMS, **_BY_SUMMARY, OfferAggregates: lambda offers: offers.version},
+))
+def get_roi_simulation(catalog, placements, offers, stream, course, course_cost, loan_share, loan_rate):
+    """Monte Carlo ROI for one course and cost, covering every horizon.
+
+    Keyed on the data versions plus the inputs; the least recently used
+    entries are evicted beyond 256, and the years slider never misses.
+    """
+    model = SalaryModel.from_data(catalog.courses(stream)[course]["avg_package"], placements, offers)
+    return simulate(model, course_cost, loan_share, loan_rate, seed=zlib.crc32(course.encode()))
+
+
+@st.cache_resource(show_spinner=False)
+def start_metrics():
+    """Start the metrics endpoint/file configured by the environment, once per process."""
+    return start_exporters()
+
+
+def _warm():
+    get_faq_index(get_faq())
+    get_intent_model()
+    get_offers()
+    get_placement_figures(get_placements())
+
+
+@st.cache_resource(show_spinner=False)
+def warm_up():
+    """Build the slow shared resources in a background thread, once per process.
+
+    Runs off the script thread so the first page render never waits on it.
+    The thread gets its own copy of the session's context: Streamlit marks
+    the context while a cached function computes, and a shared one would make
+    widgets created meanwhile in that session look like they are inside it.
+    """
+    thread = threading.Thread(target=_warm, name="admitbot-warmup", daemon=True)
+    ctx = get_script_run_ctx()
+    add_script_run_ctx(thread, copy.copy(ctx) if ctx else None)
+    thread.start()
+    return thread
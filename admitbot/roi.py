@@ -0,0 +1,74 @@
+"""Precomputed ROI sensitivity grid for Parent Support.
+
+ROI and break-even are evaluated once for every cost x salary x years
+combination the Parent Support sliders can reach, with NumPy broadcasting.
+Slider positions are grid points, so each rerun is an index lookup rather
+than fresh arithmetic, and the heatmap for a given horizon is a slice.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+COST_AXIS = np.arange(500_000, 2_000_001, 50_000)
+SALARY_AXIS = np.arange(300_000, 1_500_001, 25_000)
+YEARS_AXIS = np.arange(1, 11)
+
+
+@dataclass(frozen=True)
+class RoiPoint:
+    course_cost: int
+    expected_salary: int
+    years: int
+    total_earnings: int
+    roi: float         # percent
+    break_even: float  # years
+
+
+class RoiGrid:
+    def __init__(self, costs=COST_AXIS, salaries=SALARY_AXIS, years=YEARS_AXIS):
+        self.costs = costs
+        self.salaries = salaries
+        self.years = years
+        cost = costs[:, None, None].astype(float)
+        earnings = salaries[None, :, None] * years[None, None, :]
+        self.earnings = np.broadcast_to(earnings, (len(costs), len(salaries), len(years)))
+        self.roi = (earnings - cost) / cost * 100
+        self.break_even = costs[:, None] / salaries[None, :]
+
+    @staticmethod
+    def _index(axis, value):
+        return int(np.clip(np.searchsorted(axis, value), 0, len(axis) - 1))
+
+    def lookup(self, course_cost, expected_salary, years):
+        c = self._index(self.costs, course_cost)
+        s = self._index(self.salaries, expected_salary)
+        y = self._index(self.years, years)
+        return RoiPoint(
+            course_cost=int(self.costs[c]),
+            expected_salary=int(self.salaries[s]),
+            years=int(self.years[y]),
+            total_earnings=int(self.earnings[c, s, y]),
+            roi=float(self.roi[c, s, y]),
+            break_even=float(self.break_even[c, s]),
+        )
+
+    def heatmap(self, years):
+        """plotly heatmap of ROI over cost x salary for one horizon."""
+        import plotly.graph_objects as go
+
+        y = self._index(self.years, years)
+        fig = go.Figure(go.Heatmap(
+            z=self.roi[:, :, y],
+            x=self.salaries / 100_000,
+            y=self.costs / 100_000,
+            colorscale="RdYlGn",
+            zmid=0,
+            colorbar={"title": "ROI %"},
+            hovertemplate="Salary ₹%{x:.2f}L<br>Cost ₹%{y:.1f}L<br>ROI %{z:.0f}%<extra></extra>",
+        ))
+        fig.update_layout(
+            title=f"ROI after {int(self.years[y])} years (%)",
+            xaxis_title="Expected Starting Salary (₹ lakhs/year)",
+            yaxis_title="Total Course Cost (₹ lakhs)",
+        )
+        return fig
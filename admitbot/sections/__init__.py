@@ -0,0 +1,51 @@
+"""Page modules for the sidebar navigation.
+
+Each page lives in its own module exposing `render()`. Modules are imported
+the first time their page is selected, so a fresh process only pays for
+plotly and the components API once someone actually opens a page that
+needs them.
+
+Interactive parts of a page are wrapped in `fragment`, so changing one of
+their widgets reruns just that function instead of the whole app script.
+Everything else on the page keeps its last output.
+"""
+import functools
+import importlib
+
+import streamlit as st
+
+from admitbot import metrics
+
+# st.fragment from 1.37, st.experimental_fragment from 1.33; older versions rerun the whole script
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+PAGES = {
+    "Home": "home",
+    "Admissions FAQ": "faq",
+    "Fee Structure": "fees",
+    "College Search": "college_search",
+    "Student Counseling": "counseling",
+    "Parent Support": "parents",
+    "Placement Statistics": "placements",
+    "Virtual Campus Tour": "campus_tour",
+}
+
+
+def load(page):
+    return importlib.import_module(f"{__name__}.{PAGES[page]}")
+
+
+def render(page):
+    load(page).render()
+
+
+def fragment(func):
+    """Make `func` a partial-rerun fragment, timed as admitbot_fragment_seconds."""
+    name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+    @functools.wraps(func)
+    def timed(*args, **kwargs):
+        with metrics.timer("admitbot_fragment_seconds", fragment=name):
+            return func(*args, **kwargs)
+
+    return _fragment(timed) if _fragment else timed
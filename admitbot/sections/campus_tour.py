@@ -0,0 +1,170 @@
+"""Virtual Campus Tour page."""
+import streamlit as st
+import streamlit.components.v1 as components
+
+from admitbot import cards
+from admitbot.resources import get_gallery
+
+TOUR_POINTS = {
+    "Main Building": "Experience the grand entrance and administrative block with modern architecture and state-of-the-art facilities",
+    "Academic Block": "Explore our modern classrooms and lecture halls equipped with smart learning technologies",
+    "Central Library": "Visit our extensive library with digital resources, reading halls, and research sections",
+    "Research Centers": "Discover advanced research facilities and cutting-edge laboratories",
+    "Sports Complex": "Tour our world-class sports facilities including indoor and outdoor courts",
+    "Hostel Block": "View our comfortable student accommodation with modern amenities"
+}
+
+# Static content, so the cards are rendered once at import
+TOUR_POINTS_HTML = cards.tour_points(TOUR_POINTS)
+
+MAP_EMBED_URL = "https://www.google.com/maps/embed?pb=!1m18!1m12!1m3!1d3890.040704806402!2d80.21832661482169!3d12.876655390918744!2m3!1f0!2f0!3f0!3m2!1i1024!2i768!4f13.1!3m3!1m2!1s0x3a525b79de7f381b%3A0xffbb2dd48afe3f1b!2sSathyabama%20Institute%20of%20Science%20and%20Technology!5e0!3m2!1sen!2sin!4v1679940475043!5m2!1sen!2sin"
+
+# Served from static/gallery/ once `python -m admitbot.gallery` has built them,
+# hotlinked from the college site otherwise
+GALLERY = [
+    ("campus1.jpg", "Main Building"),
+    ("campus2.jpg", "Library Block"),
+    ("campus3.jpg", "Academic Block"),
+]
+REMOTE_GALLERY_URL = "https://www.sathyabama.ac.in/sites/default/files/inline-images"
+
+
+def render():
+    st.header("360° Virtual Campus Tour - Sathyabama Institute")
+    
+    # Avatar Selection
+    st.subheader("Customize Your Tour Experience")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        avatar = st.selectbox(
+            "Choose Your Avatar",
+            ["Student", "Parent", "Faculty", "Visitor"]
+        )
+        
+    with col2:
+        vehicle = st.selectbox(
+            "Choose Your Transport",
+            ["Walking", "Electric Cart", "Bicycle", "Segway"]
+        )
+
+    # Tour Starting Point Selection
+    start_point = st.selectbox(
+        "Select Your Starting Point",
+        ["Main Gate", "Academic Block", "Library", "Hostels", "Sports Complex", "Labs"]
+    )
+
+    # Embed Campus Map and Tour
+    st.markdown("### Begin Your Virtual Tour")
+    st.markdown("Navigate through the campus using mouse or touch controls:")
+    st.markdown("- **Left Click/Touch + Drag**: Look around")
+    st.markdown("- **Right Click/Touch + Drag**: Move forward/backward")
+    st.markdown("- **Scroll**: Zoom in/out")
+
+    # Updated iframe with campus map
+    components.html(
+        """
+        <div style="width:100%; height:600px; border:none; border-radius:10px; overflow:hidden;">
+            <iframe 
+                src="{src}"
+                width="100%" 
+                height="100%" 
+                style="border:0;" 
+                allowfullscreen="" 
+                loading="lazy" 
+                referrerpolicy="no-referrer-when-downgrade">
+            </iframe>
+        </div>
+        <style>
+            iframe {
+                border-radius: 10px;
+                box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+            }
+        </style>
+        """.replace("{src}", MAP_EMBED_URL),
+        height=620,
+    )
+
+    # Campus Gallery
+    st.subheader("Campus Gallery")
+    gallery = get_gallery()
+    if gallery and all(name in gallery.images for name, _ in GALLERY):
+        st.markdown(cards.gallery(gallery, GALLERY), unsafe_allow_html=True)
+    else:
+        for col, (name, caption) in zip(st.columns(3), GALLERY):
+            with col:
+                st.image(f"{REMOTE_GALLERY_URL}/{name}", caption=caption, use_column_width=True)
+
+    # Virtual Tour Points
+    st.subheader("Virtual Tour Points")
+    st.markdown(TOUR_POINTS_HTML, unsafe_allow_html=True)
+
+    # Tour Highlights
+    st.subheader("Campus Highlights")
+    
+    highlights = {
+        "Academic Facilities": [
+            "State-of-the-art classrooms",
+            "Modern laboratories",
+            "Central library with digital resources",
+            "Research centers"
+        ],
+        "Infrastructure": [
+            "Wi-Fi enabled campus",
+            "Smart classrooms",
+            "Advanced research labs",
+            "Modern auditorium"
+        ],
+        "Sports & Recreation": [
+            "Olympic-size swimming pool",
+            "Indoor sports complex",
+            "Outdoor sports fields",
+            "Fitness center"
+        ],
+        "Student Amenities": [
+            "Modern hostels",
+            "Food court",
+            "Medical center",
+            "Banking facility"
+        ]
+    }
+
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        for title in list(highlights.keys())[:2]:
+            st.markdown(f"#### {title}")
+            for item in highlights[title]:
+                st.markdown(f"- {item}")
+            st.markdown("<br>", unsafe_allow_html=True)
+    
+    with col2:
+        for title in list(highlights.keys())[2:]:
+            st.markdown(f"#### {title}")
+            for item in highlights[title]:
+                st.markdown(f"- {item}")
+            st.markdown("<br>", unsafe_allow_html=True)
+
+    # Quick Navigation
+    st.subheader("Quick Navigation")
+    quick_nav = st.multiselect(
+        "Jump to Specific Locations",
+        ["Main Building", "Library", "Hostels", "Cafeteria", "Sports Complex", 
+         "Laboratories", "Auditorium", "Medical Center", "Transport Hub"]
+    )
+
+    # Tour Guide
+    if st.checkbox("Enable Virtual Tour Guide"):
+        st.info("""
+            Your virtual guide will provide detailed information about each location 
+            as you navigate through the campus. Enable audio for the best experience.
+        """)
+
+    # Additional Information
+    st.markdown("### Additional Information")
+    st.markdown("""
+        - Tour is best viewed on a desktop/laptop
+        - Use headphones for an immersive experience
+        - Virtual tour is available 24/7
+        - For technical support, contact: support@sathyabama.ac.in
+    """)
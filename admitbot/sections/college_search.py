@@ -0,0 +1,132 @@
+"""College Search page."""
+import streamlit as st
+
+from admitbot import metrics
+from admitbot.fee_index import ALL_STREAMS
+from admitbot.resources import get_catalog, get_directory, get_programs_in_budget
+from admitbot.sections import fragment
+
+NEARBY_LIMIT = 100   # rows shown; the caption gives the full count
+HOME_CITY = "Chennai"
+
+
+def _nearby(directory, stream, min_budget, max_budget):
+    st.subheader("Other Institutions Near You")
+    centres = directory.city_centres
+    if not centres:
+        st.info("The institution directory has no cities to search from yet.")
+        return
+    col1, col2 = st.columns(2)
+    with col1:
+        cities = list(centres)
+        city = st.selectbox("Your City", cities, index=cities.index(HOME_CITY) if HOME_CITY in centres else 0)
+    with col2:
+        radius = st.slider("Within (km)", 5, 500, 50, step=5)
+
+    lat, lon = centres[city]
+    with metrics.section("institution_search"):
+        matches, programs, institutions = directory.search(
+            lat, lon, radius, min_budget * 100000, max_budget * 100000, stream, limit=NEARBY_LIMIT,
+        )
+    if not matches:
+        st.info(f"No programs within {radius} km of {city} match this stream and budget.")
+        return
+    shown = f"; nearest {len(matches)} shown" if programs > len(matches) else ""
+    st.caption(f"{programs:,} programs at {institutions:,} institutions within {radius} km of {city}{shown}")
+    st.dataframe(
+        [
+            {
+                "Institution": match.institution, "City": match.city, "Distance (km)": match.distance_km,
+                "Stream": match.stream, "Program": match.program, "Annual Fee (₹)": match.annual_fee,
+            }
+            for match in matches
+        ],
+        use_container_width=True, hide_index=True,
+    )
+
+
+@fragment
+def _search():
+    catalog = get_catalog()
+
+    # Simplified search filters
+    col1, col2 = st.columns(2)
+    with col1:
+        main_stream = st.selectbox(
+            "Select Your Stream of Interest",
+            ["Engineering", "Medical", "Business", "Arts & Science", "All Streams"]
+        )
+    
+    with col2:
+        budget = st.slider("Annual Budget (in lakhs)", 0.0, 10.0, (2.0, 5.0))
+    
+    # Filter courses based on budget
+    min_budget, max_budget = budget
+
+    # Show relevant courses based on stream and budget
+    st.subheader(f"Available Courses in {main_stream}")
+    
+    stream_filter = ALL_STREAMS if main_stream == "All Streams" else main_stream
+    with metrics.section("course_filter"):
+        eligible_courses = [
+            (course, catalog.courses(stream)[course])
+            for stream, course in get_programs_in_budget(
+                catalog, min_budget * 100000, max_budget * 100000, stream_filter,
+            )
+        ]
+    
+    if eligible_courses:
+        for course, details in eligible_courses:
+            with st.expander(f"📚 {course} - ₹{details['annual_fee']:,}/year"):
+                st.markdown(f"*{details['description']}*")
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.markdown("#### Course Details")
+                    st.write(f"**Duration:** {details['duration']}")
+                    st.write(f"**Eligibility:** {details['eligibility']}")
+                    st.write(f"**Average Package:** {details['avg_package']}")
+                
+                with col2:
+                    st.markdown("#### Specializations")
+                    for spec in details['specializations']:
+                        st.write(f"- {spec}")
+                    
+                    st.markdown("#### Career Opportunities")
+                    for role in details['job_roles']:
+                        st.write(f"- {role}")
+    else:
+        st.warning(f"No courses found in {main_stream} within the budget range of ₹{min_budget:.1f}-{max_budget:.1f} lakhs. Please adjust your budget.")
+
+    # Additional Information
+    if eligible_courses:
+        st.subheader("Additional Benefits")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("""
+                #### Scholarships Available
+                - Merit-based scholarship (up to 50% waiver)
+                - Sports quota scholarship
+                - Girl child scholarship
+                - Economic background scholarship
+            """)
+        
+        with col2:
+            st.markdown("""
+                #### Campus Facilities
+                - World-class laboratories
+                - Digital library
+                - Sports complex
+                - Industry collaboration
+                - Internship opportunities
+            """)
+
+    directory = get_directory()
+    if directory is not None:
+        _nearby(directory, stream_filter, min_budget, max_budget)
+
+
+def render():
+    st.header("College Search")
+    _search()
@@ -0,0 +1,85 @@
+"""Student Counseling page."""
+import streamlit as st
+
+from admitbot import metrics
+from admitbot.recommend import Profile
+from admitbot.resources import get_catalog, get_recommender
+from admitbot.sections import fragment
+
+
+@fragment
+def _counselor():
+    # Get student information
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        stream = st.selectbox("Select Your Stream", ["Science", "Commerce", "Arts"])
+        percentage = st.number_input("Your 12th Percentage", 0.0, 100.0, 75.0)
+        interests = st.multiselect(
+            "Select Your Interests",
+            ["Technology", "Healthcare", "Business", "Creative Arts", "Science", "Social Sciences"]
+        )
+    
+    with col2:
+        entrance_exam = st.selectbox("Entrance Exam Scores (if any)", 
+            ["None", "JEE", "NEET", "CAT", "Other"])
+        if entrance_exam != "None":
+            exam_score = st.number_input("Enter your score/percentile", 0.0, 100.0, 50.0)
+        
+        strengths = st.multiselect(
+            "Select Your Strengths",
+            ["Mathematics", "Programming", "Biology", "Communication", "Creativity", "Analysis"]
+        )
+    
+    if st.button("Get Recommendations"):
+        catalog = get_catalog()
+        profile = Profile(
+            stream=stream,
+            percentage=percentage,
+            interests=tuple(interests),
+            strengths=tuple(strengths),
+            exam=entrance_exam,
+            exam_score=exam_score if entrance_exam != "None" else 0.0,
+        )
+        with metrics.section("recommend"):
+            recommendations = get_recommender(catalog).recommend(profile, k=3)
+        
+        if recommendations:
+            st.success("Based on your profile, here are your recommended paths:")
+            for rank, rec in enumerate(recommendations, 1):
+                details = catalog.courses(rec.stream)[rec.course]
+                reasons = []
+                if rec.interests:
+                    reasons.append(f"Matches your interest in {', '.join(rec.interests)}")
+                if rec.strengths:
+                    reasons.append(f"Builds on your strengths in {', '.join(rec.strengths)}")
+                # Same defaults as the Recommender, for programs without these fields
+                if entrance_exam in details.get("exams", ()):
+                    reasons.append(f"Accepts {entrance_exam} scores")
+                minimum = details.get("min_percentage", 0)
+                if minimum:
+                    reasons.append(f"Your {percentage:.0f}% meets the {minimum}% minimum")
+                st.markdown(f"""
+### {rank}. {rec.course} ({rec.stream})
+**Match: {rec.score:.0%}** · {details['duration']} · Average package {details['avg_package']} · ₹{details['annual_fee']:,}/year
+""" + "\n".join(f"- {reason}" for reason in reasons))
+        else:
+            st.warning("None of our programs match your stream and percentage yet. Here are some alternatives:")
+            st.markdown("""
+                ### Alternative Pathways:
+                
+                1. **Diploma in Computer Applications**
+                   - 3-year program
+                   - Practical skill-based learning
+                   - Option to upgrade to B.Tech later
+                   
+                2. **Vocational Training Programs**
+                   - Web Development
+                   - Digital Marketing
+                   - Hardware Networking
+            """)
+
+
+def render():
+    st.header("Personalized Course Recommendations")
+    _counselor()
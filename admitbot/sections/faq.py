@@ -0,0 +1,114 @@
+"""Admissions FAQ page."""
+from datetime import date
+from textwrap import indent
+
+import streamlit as st
+
+from admitbot import metrics
+from admitbot.deadlines import countdown, days_left, format_day, format_days
+from admitbot.resources import (
+    get_calendar, get_calendar_day, get_calendar_index, get_catalog, get_faq, get_faq_index
+)
+from admitbot.sections import fragment
+
+
+def _snippets(entries, heading="###"):
+    return "\n\n".join(f"{heading} {title}\n{body}" for title, body in entries.items())
+
+
+@fragment
+def _search():
+    query = st.text_input(
+        "Search admissions answers",
+        placeholder="e.g. documents needed, JEE eligibility, application steps",
+    )
+    if not query.strip():
+        return
+    with metrics.section("faq_search"):
+        hits = get_faq_index(get_faq()).search(query)
+    if hits:
+        st.markdown("\n\n---\n\n".join(f"**{hit.title}** · {hit.topic}\n\n{hit.body}" for hit in hits))
+    else:
+        st.info("No matching answers. Try other words, or browse the tabs below.")
+
+
+def _schedule(calendar):
+    blocks = []
+    for round_, events in calendar.rounds().items():
+        scope = events[0].programs or events[0].streams
+        heading = f"### {round_}" + (f" ({', '.join(scope)} only)" if scope else "")
+        blocks.append(heading + "\n" + "\n".join(f"- {event.name}: {format_days(event)}" for event in events))
+    return "\n\n".join(blocks)
+
+
+def _until(event, today):
+    return f"{event.round} {event.name}: {format_day(event.end)} ({countdown(event, today)})"
+
+
+def _status(calendar, today):
+    day = get_calendar_day(calendar, today)
+    if day.open:
+        st.info("Open now: " + "; ".join(
+            f"{event.round} {event.name} until {format_day(event.end)}" for event in day.open
+        ))
+    if day.closing:
+        st.warning("⏰ Closing this week: " + "; ".join(_until(event, today) for event in day.closing))
+    elif day.next:
+        st.warning(f"⏰ {days_left(day.next, today)} days left until {day.next.round} {day.next.name}!")
+    else:
+        st.info("All deadlines of this admissions cycle have passed. Dates for the next cycle will be announced here.")
+
+
+@fragment
+def _program_deadline():
+    catalog = get_catalog()
+    stream_of = {course: stream for stream, courses in catalog.streams.items() for course in courses}
+    course = st.selectbox("Next deadline for", list(stream_of))
+    today = date.today()
+    event = get_calendar_index(get_calendar()).next_deadline(today, stream_of[course], course)
+    if event:
+        st.markdown(f"**{course}**: {_until(event, today)}")
+    else:
+        st.markdown(f"**{course}**: no upcoming deadlines this cycle.")
+
+
+@fragment
+def _eligibility():
+    course_type = st.selectbox("Select Course Type", 
+        ["Engineering", "Medical", "Business", "Arts & Science"])
+    
+    title = f"{course_type} Programs"
+    body = get_faq().topics["Eligibility"].get(title)
+    if body:
+        st.markdown(f"### {title}\n{body}")
+
+
+def render():
+    faq = get_faq()
+    st.header("Admissions Information")
+    _search()
+    
+    # Create tabs for different admission aspects
+    tab1, tab2, tab3, tab4 = st.tabs(["Deadlines", "Eligibility", "Documents", "Process"])
+    
+    with tab1:
+        st.subheader("Important Deadlines")
+        calendar = get_calendar()
+        st.markdown(_schedule(calendar))
+        _status(calendar, date.today())
+        _program_deadline()
+    
+    with tab2:
+        st.subheader("Eligibility Criteria")
+        _eligibility()
+    
+    with tab3:
+        st.subheader("Required Documents")
+        st.markdown("### Essential Documents\n" + "\n\n".join(
+            f"{number}. {title}\n{indent(body, '    ')}"
+            for number, (title, body) in enumerate(faq.topics["Documents"].items(), 1)
+        ))
+    
+    with tab4:
+        st.subheader("Application Process")
+        st.markdown("### Step-by-Step Guide\n\n" + _snippets(faq.topics["Process"], heading="####"))
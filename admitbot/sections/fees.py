@@ -0,0 +1,215 @@
+"""Fee Structure page."""
+import streamlit as st
+
+from admitbot import cards, metrics
+from admitbot.resources import get_catalog, get_fee_matrix, get_fee_matrix_csv, get_loan_book, get_store
+from admitbot.sections import fragment
+
+LIST_PLAN = "Semester-wise"  # plan the net fee is compared with, when the catalog has it
+EMI_TENURE = 7  # years, for the headline EMI in the payment breakdown, when a bank offers it
+
+
+def _preferred(options, preferred):
+    """Index of `preferred` in `options`, or 0 once a reloaded catalog drops or renames it."""
+    return options.index(preferred) if preferred in options else 0
+
+
+def _partner_banks(catalog):
+    return "\n".join(f"- {bank} ({rate:.2f}% p.a.)" for bank, rate in catalog.loan_banks.items())
+
+
+@fragment
+def _fee_planner():
+    catalog = get_catalog()
+    loan_book = get_loan_book(catalog)
+    fee_matrix = get_fee_matrix(catalog)
+    list_plan = fee_matrix.plans[_preferred(fee_matrix.plans, LIST_PLAN)]
+    emi_tenure = loan_book.tenures[_preferred(loan_book.tenures, EMI_TENURE)]
+
+    # Course Selection with smaller headers
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("#### Select Course Category")
+        course_category = st.selectbox(
+            "",  # Empty label since we're using markdown above
+            list(catalog.fee_courses)
+        )
+    
+    with col2:
+        st.markdown("#### Select Specific Course")
+        specific_course = st.selectbox(
+            "",  # Empty label
+            catalog.fee_courses[course_category]
+        )
+
+    # Fee Structure Display with enhanced visibility
+    st.markdown("""
+        <div style='background-color: #e6f3ff; padding: 15px; border-radius: 5px; margin: 10px 0;'>
+            <h4 style='color: #0066cc; margin: 0;'>Annual Fee Breakdown</h4>
+        </div>
+    """, unsafe_allow_html=True)
+
+    # Display Fee Components with improved visibility
+    col1, col2, col3 = st.columns([2, 1, 1])
+    
+    with col1:
+        st.markdown("#### Fee Components")
+        with metrics.section("fee_components"):
+            fee_cards, mandatory_total, optional_total = cards.fee_components(catalog, specific_course, get_store())
+            st.markdown(fee_cards, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("#### Fee Summary")
+        st.markdown(f"""
+            <div style='padding: 15px; border: 1px solid #dee2e6; border-radius: 5px;'>
+                <p><strong>Mandatory Fees:</strong><br>₹{mandatory_total:,}</p>
+                <p><strong>Optional Fees:</strong><br>₹{optional_total:,}</p>
+                <p style='margin-top: 10px; border-top: 1px solid #dee2e6; padding-top: 10px;'>
+                    <strong>Total Fees:</strong><br>₹{mandatory_total + optional_total:,}
+                </p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("#### Payment Breakdown")
+        semester_fee = mandatory_total / 2
+        emi_line = ""
+        if loan_book.banks:
+            # Cheapest partner-bank EMI to finance one year of mandatory fees
+            monthly_fee = loan_book.annual_emi(specific_course, list_plan)[:, loan_book.tenures.index(emi_tenure)].min()
+            emi_line = f"""
+                <p><strong>Monthly EMI*:</strong><br>₹{monthly_fee:,.0f}</p>
+                <small style='color: #666666;'>*Per year of fees financed, lowest partner rate over {emi_tenure} years</small>"""
+        st.markdown(f"""
+            <div style='padding: 15px; border: 1px solid #dee2e6; border-radius: 5px;'>
+                <p><strong>Per Semester:</strong><br>₹{semester_fee:,.0f}</p>{emi_line}
+            </div>
+        """, unsafe_allow_html=True)
+
+    # Simple Education Loan Details
+    st.markdown("#### Education Loan Information")
+    loan_col1, loan_col2 = st.columns(2)
+    
+    with loan_col1:
+        st.markdown("**Partner Banks**\n" + _partner_banks(catalog))
+    
+    with loan_col2:
+        st.markdown("""
+            **Loan Benefits**
+            - 100% financing available
+            - No collateral up to ₹7.5 lakhs
+            - Flexible repayment options
+            - Tax benefits under Section 80E
+        """)
+
+    # Payment Options with smaller headers
+    st.markdown("""
+        <div style='background-color: #e6f3ff; padding: 15px; border-radius: 5px; margin: 20px 0;'>
+            <h4 style='color: #0066cc; margin: 0;'>Payment Options</h4>
+        </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Payment Plans")
+        st.markdown(cards.payment_plans(catalog), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("#### Available Scholarships")
+        st.markdown(cards.scholarships(catalog), unsafe_allow_html=True)
+
+    # Net cost for the chosen plan and scholarships, looked up in the precomputed fee matrix
+    st.markdown("#### Net Cost Calculator")
+    calc_col1, calc_col2, calc_col3 = st.columns([1, 2, 1])
+    with calc_col1:
+        plan = st.selectbox("Payment Plan", fee_matrix.plans, index=_preferred(fee_matrix.plans, LIST_PLAN))
+        hostel = st.checkbox("Include hostel and mess")
+    with calc_col2:
+        schemes = st.multiselect("Scholarships", fee_matrix.schemes)
+    with calc_col3:
+        net_fee = fee_matrix.lookup(specific_course, plan, schemes, hostel)
+        list_fee = fee_matrix.lookup(specific_course, list_plan, (), hostel)
+        st.metric("Net Annual Fee", f"₹{net_fee:,.0f}", f"₹{net_fee - list_fee:,.0f}", delta_color="inverse")
+    st.download_button(
+        "Download full fee matrix (CSV)",
+        get_fee_matrix_csv(catalog),
+        file_name=f"fee_matrix_{catalog.version}.csv",
+        mime="text/csv",
+    )
+
+    # Side-by-side partner-bank quotes for financing the net fee above
+    st.markdown("#### Compare Education Loans")
+    if not loan_book.banks:
+        st.info("No partner-bank loans are listed at the moment.")
+        return
+    loan_col1, loan_col2 = st.columns(2)
+    with loan_col1:
+        years_financed = st.slider("Years of fees financed", 1, 5, 4)
+    with loan_col2:
+        tenure = st.selectbox("Repayment tenure (years)", loan_book.tenures, index=_preferred(loan_book.tenures, EMI_TENURE))
+    principal = net_fee * years_financed
+    with metrics.section("loan_quotes"):
+        quotes = loan_book.quotes(principal, tenure)
+    rows = "\n".join(
+        f"| {quote.bank} | {quote.rate:.2f}% | ₹{quote.emi:,.0f} | ₹{quote.total_interest:,.0f} | ₹{quote.total_repayment:,.0f} |"
+        for quote in quotes
+    )
+    st.markdown(f"""
+Loan amount: **₹{principal:,.0f}**
+
+| Bank | Rate (p.a.) | Monthly EMI | Total Interest | Total Repayment |
+|---|---|---|---|---|
+{rows}
+""")
+    with st.expander("Yearly repayment schedule"):
+        bank = st.selectbox("Bank", [quote.bank for quote in quotes])
+        schedule = "\n".join(
+            f"| {year} | ₹{paid:,.0f} | ₹{interest:,.0f} | ₹{repaid:,.0f} | ₹{balance:,.0f} |"
+            for year, paid, interest, repaid, balance in loan_book.schedule(principal, bank, tenure)
+        )
+        st.markdown(f"""
+| Year | Paid | Interest | Principal | Balance |
+|---|---|---|---|---|
+{schedule}
+""")
+
+
+def render():
+    catalog = get_catalog()
+
+    st.markdown("## Fee Structure and Financial Planning")
+    
+    _fee_planner()
+
+    # Financial Aid and Education Loan
+    st.markdown("""
+        <div style='background-color: #f0f2f6; padding: 20px; border-radius: 10px; margin: 20px 0;'>
+            <h3 style='color: #1f77b4;'>Education Loan Assistance</h3>
+        </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### Partner Banks")
+        st.markdown(_partner_banks(catalog) + "\n\n*Interest rates are indicative and subject to change")
+    
+    with col2:
+        st.markdown("### Loan Benefits")
+        st.markdown("""
+            - 100% financing available
+            - No collateral for loans up to ₹7.5 lakhs
+            - Flexible repayment options
+            - Tax benefits under Section 80E
+            - Special rates for female students
+        """)
+
+    # Additional Information
+    st.info("""
+        📝 **Note:**
+        - All fees are subject to revision
+        - Additional charges may apply for specialized programs
+        - Scholarships are subject to eligibility and availability
+        - Education loan assistance is provided through the admission office
+    """)
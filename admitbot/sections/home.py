@@ -0,0 +1,59 @@
+"""Home page."""
+import time
+
+import streamlit as st
+
+from admitbot import metrics
+from admitbot.chat import stream
+from admitbot.resources import get_chat_answer
+
+HISTORY_TURNS = 50   # question and answer pairs kept in the session
+
+
+def _first_token_timed(tokens, start):
+    """Pass `tokens` through, recording how long the first one took since `start`."""
+    tokens = iter(tokens)
+    for token in tokens:
+        metrics.REGISTRY.observe("admitbot_chat_first_token_seconds", time.perf_counter() - start)
+        yield token
+        break
+    yield from tokens
+
+
+def _chat():
+    history = st.session_state.setdefault("chat_history", [])
+    for role, text in history:
+        with st.chat_message(role):
+            st.markdown(text)
+
+    question = st.chat_input("Ask about fees, eligibility, deadlines, documents, placements or the campus")
+    if not question:
+        return
+    start = time.perf_counter()
+    history.append(("user", question))
+    with st.chat_message("user"):
+        st.markdown(question)
+    with metrics.section("chat_answer"):
+        reply = get_chat_answer(question)
+    metrics.inc("admitbot_chat_questions_total", intent=reply.intent or "unknown")
+    history.append(("assistant", reply.text))
+    del history[:-2 * HISTORY_TURNS]
+    with st.chat_message("assistant"):
+        st.write_stream(_first_token_timed(stream(reply.text), start))
+
+
+def render():
+    st.header("Welcome to Admit Bot!")
+    st.markdown("""
+        ### How can I help you today?
+        
+        1. **Admissions FAQ**: Get answers about deadlines, eligibility, and documents
+        2. **Fee Structure**: Understand costs and payment plans
+        3. **College Search**: Find colleges based on your preferences
+        4. **Student Counseling**: Get personalized course recommendations
+        5. **Parent Support**: Information for parents about ROI and facilities
+        6. **Placement Statistics**: View career opportunities and packages
+        
+        Select a section from the sidebar, or ask me a question below!
+    """)
+    _chat()
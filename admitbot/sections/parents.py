@@ -0,0 +1,117 @@
+"""Parent Support page."""
+import numpy as np
+import streamlit as st
+
+from admitbot import metrics
+from admitbot.resources import (
+    get_catalog, get_offers, get_placements, get_roi_grid, get_roi_heatmap, get_roi_simulation
+)
+from admitbot.sections import fragment
+from admitbot.simulate import PATHS
+
+
+@fragment
+def _roi_calculator():
+    st.subheader("Return on Investment")
+    
+    # ROI Calculator; every slider position is a point on the precomputed grid
+    course_cost = st.slider("Total Course Cost (₹)", 500000, 2000000, 1000000, step=50000)
+    expected_salary = st.slider("Expected Starting Salary (₹/year)", 300000, 1500000, 600000, step=25000)
+    years = st.slider("Years to Calculate ROI", 1, 10, 3)
+    
+    point = get_roi_grid().lookup(course_cost, expected_salary, years)
+    
+    st.success(f"""
+        ### ROI Analysis
+        - Total Investment: ₹{point.course_cost:,}
+        - Expected Earnings ({point.years} years): ₹{point.total_earnings:,}
+        - ROI: {point.roi:.1f}%
+        - Break-even Period: {point.break_even:.1f} years
+    """)
+    
+    if st.toggle("Show sensitivity analysis"):
+        with metrics.section("roi_heatmap"):
+            st.plotly_chart(get_roi_heatmap(years), use_container_width=True)
+        st.caption("ROI for every course cost and starting salary at the selected horizon. Green cells pay back within it.")
+    
+    if st.toggle("Simulate salary growth and loan interest"):
+        catalog = get_catalog()
+        programs = {
+            f"{course} ({stream})": (stream, course)
+            for stream, courses in catalog.streams.items() for course in courses
+        }
+        sim_col1, sim_col2, sim_col3 = st.columns(3)
+        with sim_col1:
+            stream, course = programs[st.selectbox("Course", list(programs))]
+        with sim_col2:
+            loan_share = st.slider("Financed by Education Loan (%)", 0, 100, 80, step=10)
+        with sim_col3:
+            loan_rate = st.slider("Loan Interest Rate (% p.a.)", 0.0, 15.0, 8.85, step=0.05)
+        
+        with metrics.section("roi_simulation"):
+            simulation = get_roi_simulation(
+                catalog, get_placements(), get_offers(), stream, course,
+                course_cost, loan_share / 100, round(loan_rate / 100, 4),
+            )
+        (roi_low, roi_mid, roi_high), paid_back = simulation.at(years)
+        be_low, be_mid, be_high = (
+            f"{value:.1f} years" if np.isfinite(value) else "over 10 years" for value in simulation.break_even
+        )
+        st.markdown(f"""
+| {PATHS:,} simulated careers | Pessimistic (P10) | Typical (P50) | Optimistic (P90) |
+|---|---|---|---|
+| ROI after {years} years | {roi_low:.0f}% | {roi_mid:.0f}% | {roi_high:.0f}% |
+| Break-even | {be_high} | {be_mid} | {be_low} |
+""")
+        st.info(
+            f"Total cost including loan interest: ₹{simulation.total_cost:,.0f}. "
+            f"{paid_back:.0%} of simulated graduates earn it back within {years} years."
+        )
+
+
+def render():
+    st.header("Information for Parents")
+    
+    tab1, tab2, tab3 = st.tabs(["ROI & Costs", "Campus Life", "Career Prospects"])
+    
+    with tab1:
+        _roi_calculator()
+    
+    with tab2:
+        st.subheader("Campus Facilities & Safety")
+        st.markdown("""
+            ### Safety Measures
+            - 24/7 Security Personnel
+            - CCTV Surveillance
+            - Biometric Access
+            - Emergency Response Team
+            
+            ### Hostel Facilities
+            - Separate hostels for boys and girls
+            - 24/7 warden supervision
+            - Modern amenities
+            - Regular maintenance
+            
+            ### Medical Facilities
+            - On-campus medical center
+            - 24/7 medical staff
+            - Ambulance service
+            - Regular health check-ups
+        """)
+    
+    with tab3:
+        st.subheader("Career Opportunities")
+        st.markdown("""
+            ### Top Recruiters
+            - Microsoft
+            - Google
+            - Amazon
+            - IBM
+            - TCS
+            
+            ### Industry Connections
+            - Regular industry visits
+            - Expert lectures
+            - Internship opportunities
+            - Industry projects
+        """)
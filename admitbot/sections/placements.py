@@ -0,0 +1,66 @@
+"""Placement Statistics page."""
+import streamlit as st
+
+from admitbot import metrics
+from admitbot.resources import get_offers, get_placement_figures, get_placements
+from admitbot.sections import fragment
+
+
+@fragment
+def _package_distribution():
+    offers = get_offers()
+    st.markdown("### Package Distribution")
+    filter_col1, filter_col2 = st.columns(2)
+    with filter_col1:
+        selected_year = st.selectbox("Year", offers.years()[::-1])
+    with filter_col2:
+        branch = st.selectbox("Branch", ["All Branches"] + offers.values("branch", year=selected_year))
+
+    filters = {"year": selected_year}
+    if branch != "All Branches":
+        filters["branch"] = branch
+    distribution = offers.distribution(**filters)
+    median, p90 = distribution.quantile([0.5, 0.9])
+    st.markdown(f"""
+        - Highest Package: {distribution.high:g} LPA
+        - 90th Percentile: {p90:.1f} LPA
+        - Average Package: {distribution.mean:.1f} LPA
+        - Median Package: {median:.1f} LPA
+        - Lowest Package: {distribution.low:g} LPA
+        - Offers Made: {distribution.count:,}
+    """)
+
+
+def render():
+    st.header("Placement Statistics")
+    
+    # Charts are built once per dataset version and shared by all sessions
+    with metrics.section("placement_charts"):
+        figures = get_placement_figures(get_placements())
+        col1, col2 = st.columns(2)
+        with col1:
+            # Salary trends
+            st.plotly_chart(figures["salary_trend"])
+        with col2:
+            # Placement rate
+            st.plotly_chart(figures["placement_rate"])
+    
+    # Top recruiters and packages, aggregated from the ingested offer records
+    st.subheader("Top Recruiters & Packages")
+    offers = get_offers()
+    if not offers.rows:
+        st.info("No placement offer records have been ingested yet.")
+        return
+
+    year = offers.years()[-1]
+    recruiters = offers.rollup("company", year=year)
+    top = sorted(recruiters.items(), key=lambda item: item[1].mean, reverse=True)[:5]
+    col3, col4 = st.columns(2)
+    
+    with col3:
+        st.markdown(f"### Top Recruiters {year}\n" + "\n".join(
+            f"{rank}. {company} ({cell.mean:.1f} LPA avg)" for rank, (company, cell) in enumerate(top, 1)
+        ))
+    
+    with col4:
+        _package_distribution()
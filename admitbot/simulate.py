@@ -0,0 +1,115 @@
+"""Monte Carlo salary-growth simulation for the Parent Support ROI.
+
+The flat calculator assumes the same salary every year. This draws tens of
+thousands of career paths at once instead:
+
+- starting salary: lognormal around the course's average package, with the
+  spread of the latest year's placement offers (from their t-digests)
+- yearly raises: normal around the growth of the average package across
+  placement years, with fixed volatility
+- placement: a path starts earning in year one with the latest placement
+  rate's probability, otherwise a year later
+- cost: the loan-financed share of the course cost is repaid as an
+  amortized loan, so its interest counts against the return
+
+All horizons come from the same set of paths, so one simulation answers
+every position of the years slider.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+PATHS = 20_000
+MAX_HORIZON = 10
+GROWTH_VOLATILITY = 0.05
+DEFAULT_SPREAD = 0.35        # lognormal sigma when there is no offer data
+DEFAULT_GROWTH = 0.0         # yearly raise when there are no placement years
+DEFAULT_PLACEMENT_RATE = 1.0  # when there are no placement years
+LOAN_TENURE_YEARS = 7
+PERCENTILES = (10, 50, 90)
+_Z90 = 1.2816                # standard normal 90th percentile
+
+
+@dataclass(frozen=True)
+class SalaryModel:
+    start_median: float      # ₹/year
+    start_spread: float      # lognormal sigma
+    growth_mean: float       # yearly raise, fraction
+    placement_rate: float    # probability of a job in year one
+
+    @classmethod
+    def from_data(cls, avg_package, placements, offers):
+        """Model for a course with `avg_package` (e.g. "8.5 LPA"), calibrated on placement data."""
+        spread = DEFAULT_SPREAD
+        if offers.rows:
+            median, p90 = offers.distribution(year=offers.years()[-1]).quantile([0.5, 0.9])
+            if p90 > median > 0:
+                spread = float(np.log(p90 / median) / _Z90)
+        # Without placement history, every path earns the course's average package from year one
+        growth, placement_rate = DEFAULT_GROWTH, DEFAULT_PLACEMENT_RATE
+        if placements.avg_salary and placements.avg_salary[0] > 0:
+            first, last = placements.avg_salary[0], placements.avg_salary[-1]
+            growth = (last / first) ** (1 / max(len(placements.avg_salary) - 1, 1)) - 1
+        if placements.placement_rate:
+            placement_rate = placements.placement_rate[-1] / 100
+        return cls(
+            start_median=float(avg_package.split()[0]) * 100_000,
+            start_spread=spread,
+            growth_mean=growth,
+            placement_rate=placement_rate,
+        )
+
+
+@dataclass(frozen=True)
+class Simulation:
+    total_cost: float
+    roi: np.ndarray          # (MAX_HORIZON, len(PERCENTILES)) percent, row h-1 is horizon h
+    break_even: np.ndarray   # (len(PERCENTILES),) years, inf if beyond MAX_HORIZON
+    paid_back: np.ndarray    # (MAX_HORIZON,) share of paths that broke even by each horizon
+
+    def at(self, years):
+        return self.roi[years - 1], self.paid_back[years - 1]
+
+
+def loan_repayment(principal, annual_rate, years=LOAN_TENURE_YEARS):
+    """Total repaid on an amortized loan with monthly instalments."""
+    months = years * 12
+    rate = annual_rate / 12
+    if principal <= 0:
+        return 0.0
+    if rate == 0:
+        return float(principal)
+    emi = principal * rate * (1 + rate) ** months / ((1 + rate) ** months - 1)
+    return float(emi * months)
+
+
+def simulate(model, course_cost, loan_share=0.0, loan_rate=0.0, paths=PATHS, seed=0):
+    rng = np.random.default_rng(seed)
+    loan = course_cost * loan_share
+    total_cost = course_cost - loan + loan_repayment(loan, loan_rate)
+
+    start = model.start_median * rng.lognormal(0.0, model.start_spread, size=paths)
+    raises = 1 + rng.normal(model.growth_mean, GROWTH_VOLATILITY, size=(paths, MAX_HORIZON - 1))
+    salary = start[:, None] * np.cumprod(np.hstack([np.ones((paths, 1)), raises]), axis=1)
+    # Paths without a job in year one start a year late, on the year-one salary
+    unplaced = rng.random(paths) >= model.placement_rate
+    salary[unplaced, 1:] = salary[unplaced, :-1]
+    salary[unplaced, 0] = 0.0
+
+    earnings = np.cumsum(salary, axis=1)
+    roi = np.percentile((earnings - total_cost) / total_cost * 100, PERCENTILES, axis=0).T
+
+    # Fractional year in which cumulative earnings first cover the cost
+    covered = earnings >= total_cost
+    year = np.where(covered.any(axis=1), covered.argmax(axis=1), MAX_HORIZON)
+    rows = np.arange(paths)
+    before = np.where(year > 0, earnings[rows, np.maximum(year - 1, 0)], 0.0)
+    during = salary[rows, np.minimum(year, MAX_HORIZON - 1)]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        break_even = np.where(year < MAX_HORIZON, year + (total_cost - before) / during, np.inf)
+    return Simulation(
+        total_cost=total_cost,
+        roi=roi,
+        break_even=np.percentile(break_even, PERCENTILES, method="nearest"),
+        paid_back=covered.mean(axis=0),
+    )
@@ -0,0 +1,105 @@
+"""Mergeable t-digest for approximate package quantiles.
+
+A digest summarises a distribution as at most ~`COMPRESSION / 2` weighted
+centroids, sized by the k1 scale function so centroids are small near the
+tails and larger around the median. Digests merge by concatenating
+centroids and recompressing, so per-cell digests can be rolled up for any
+filter combination without touching the raw offers.
+
+Accuracy: with the default compression of 200, the rank error of a
+quantile estimate is typically below 0.5% around the median and far
+smaller near the tails, while min and max are exact.
+benchmarks/sketch_accuracy.py checks this against exact quantiles on
+synthetic data.
+"""
+import numpy as np
+
+COMPRESSION = 200
+
+
+def _k(q, compression):
+    return compression / (2 * np.pi) * np.arcsin(2 * q - 1)
+
+
+class TDigest:
+    __slots__ = ("compression", "means", "weights", "low", "high", "_pending")
+
+    def __init__(self, compression=COMPRESSION):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.low = np.inf
+        self.high = -np.inf
+        self._pending = []
+
+    @classmethod
+    def from_sorted(cls, values, compression=COMPRESSION):
+        """Digest of an already sorted array of values."""
+        digest = cls(compression)
+        if len(values):
+            digest.means, digest.weights = _compress(values, np.ones(len(values)), compression)
+            digest.low = float(values[0])
+            digest.high = float(values[-1])
+        return digest
+
+    @classmethod
+    def from_centroids(cls, means, weights, low, high, compression=COMPRESSION):
+        digest = cls(compression)
+        digest.means = np.asarray(means, dtype=float)
+        digest.weights = np.asarray(weights, dtype=float)
+        digest.low = low
+        digest.high = high
+        return digest
+
+    @property
+    def count(self):
+        self.compress()
+        return float(self.weights.sum())
+
+    def merge(self, other):
+        """Fold `other` in; recompression is deferred until enough centroids are buffered."""
+        other.compress()
+        if not len(other.means):
+            return
+        self._pending.append((other.means, other.weights))
+        self.low = min(self.low, other.low)
+        self.high = max(self.high, other.high)
+        if sum(len(means) for means, _ in self._pending) > 5 * self.compression:
+            self.compress()
+
+    def compress(self):
+        """Merge buffered centroids now; readers of a compressed digest never mutate it."""
+        if not self._pending:
+            return
+        means = np.concatenate([self.means] + [means for means, _ in self._pending])
+        weights = np.concatenate([self.weights] + [weights for _, weights in self._pending])
+        self._pending = []
+        order = np.argsort(means, kind="stable")
+        self.means, self.weights = _compress(means[order], weights[order], self.compression)
+
+    def quantile(self, q):
+        """Estimated value at quantile `q` (scalar or array, each in [0, 1])."""
+        self.compress()
+        if not len(self.means):
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        total = self.weights.sum()
+        mids = np.cumsum(self.weights) - self.weights / 2
+        ranks = np.concatenate(([0.0], mids, [total]))
+        values = np.concatenate(([self.low], self.means, [self.high]))
+        result = np.interp(np.asarray(q) * total, ranks, values)
+        return float(result) if np.ndim(result) == 0 else result
+
+    def state(self):
+        self.compress()
+        return [self.means.round(6).tolist(), self.weights.tolist()]
+
+
+def _compress(means, weights, compression):
+    """Merge sorted centroids so each output spans at most one unit of k."""
+    cumulative = np.cumsum(weights)
+    q = (cumulative - weights / 2) / cumulative[-1]
+    buckets = np.floor(_k(q, compression)).astype(np.int64)
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    merged_weights = np.add.reduceat(weights, starts)
+    merged_means = np.add.reduceat(means * weights, starts) / merged_weights
+    return merged_means, merged_weights
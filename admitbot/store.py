@@ -0,0 +1,387 @@
+"""SQLite admissions data store.
+
+An alternative to the JSON files in data/ for deployments whose programs,
+fees, placements and deadlines live in a database. `bulk_load` builds the
+database from the same dicts the JSON files hold. `Store` reads it through
+a small per-process connection pool:
+
+- connections are read-only (`mode=ro`, `query_only`) and handed to one
+  thread at a time, so concurrent sessions never share one
+- every query is a constant parameterized SQL string, so each pooled
+  connection compiles it once and reuses the prepared statement from its
+  statement cache
+- indexes cover the two hot access patterns: College Search's budget
+  range (per stream or across all, cheapest first) and Fee Structure's
+  components for one course
+
+With ADMITBOT_DB set, the app keeps one `Store` per process. It loads the
+catalog, placement summary and calendar from the database instead of the
+JSON files, and College Search's budget query and Fee Structure's fee
+components go through the pool (see `admitbot.resources`). When
+`bulk_load` replaces the file, `reopen` moves the pool to the new one. The
+stored versions are hashes of the source files, so caches keyed by them
+behave exactly as with JSON.
+
+Usage:
+    python -m admitbot.store [DB_PATH]
+"""
+import argparse
+import hashlib
+import json
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from admitbot.catalog import CATALOG_PATH, DATA_DIR
+from admitbot.deadlines import DEADLINES_PATH
+from admitbot.placements import PLACEMENTS_PATH
+
+DB_PATH = os.environ.get("ADMITBOT_DB")
+DEFAULT_DB_PATH = DATA_DIR / "admitbot.db"
+POOL_SIZE = 4
+STATEMENT_CACHE = 64
+
+DEFAULT_FEES = ""   # fee_components.course for the catalog's default_fees
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+
+-- One row per program; details is the full catalog entry as JSON, the
+-- other columns are copies of the fields queries filter on
+CREATE TABLE programs (
+    id INTEGER PRIMARY KEY,
+    stream TEXT NOT NULL,
+    name TEXT NOT NULL,
+    annual_fee INTEGER NOT NULL,
+    min_percentage INTEGER,
+    details TEXT NOT NULL
+);
+
+-- A course name may appear under more than one stream, as in the JSON catalog
+CREATE TABLE fee_courses (
+    stream TEXT NOT NULL,
+    course TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (stream, course)
+) WITHOUT ROWID;
+
+CREATE TABLE fee_components (
+    course TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    component TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    PRIMARY KEY (course, position)
+) WITHOUT ROWID;
+
+CREATE TABLE payment_plans (name TEXT PRIMARY KEY, position INTEGER NOT NULL, entry TEXT NOT NULL);
+CREATE TABLE scholarships (name TEXT PRIMARY KEY, position INTEGER NOT NULL, entry TEXT NOT NULL);
+CREATE TABLE loan_banks (name TEXT PRIMARY KEY, position INTEGER NOT NULL, rate REAL NOT NULL);
+
+CREATE TABLE placements (
+    year INTEGER PRIMARY KEY,
+    avg_salary REAL NOT NULL,
+    placement_rate REAL NOT NULL,
+    companies INTEGER NOT NULL
+);
+
+-- streams and programs are JSON lists; empty means every one
+CREATE TABLE admission_rounds (
+    position INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    streams TEXT NOT NULL,
+    programs TEXT NOT NULL
+);
+
+CREATE TABLE deadlines (
+    round INTEGER NOT NULL REFERENCES admission_rounds (position),
+    position INTEGER NOT NULL,
+    event TEXT NOT NULL,
+    starts TEXT NOT NULL,   -- ISO dates
+    ends TEXT NOT NULL,
+    PRIMARY KEY (round, position)
+) WITHOUT ROWID;
+"""
+
+# Created after the bulk insert, which is much faster than maintaining them row by row
+INDEXES = """
+CREATE UNIQUE INDEX programs_stream_name ON programs (stream, name);
+-- College Search: covering, already in result order
+CREATE INDEX programs_fee ON programs (annual_fee, stream, name);
+CREATE INDEX programs_stream_fee ON programs (stream, annual_fee, name);
+CREATE INDEX deadlines_ends ON deadlines (ends);
+"""
+
+_BUDGET = "SELECT stream, name FROM programs WHERE annual_fee BETWEEN ? AND ? ORDER BY annual_fee, stream, name"
+_BUDGET_IN_STREAM = (
+    "SELECT stream, name FROM programs WHERE stream = ? AND annual_fee BETWEEN ? AND ? ORDER BY annual_fee, name"
+)
+_PROGRAMS = "SELECT stream, name, details FROM programs ORDER BY id"
+_FEE_COMPONENTS = "SELECT component, amount FROM fee_components WHERE course = ? ORDER BY position"
+_ALL_FEE_COMPONENTS = "SELECT course, component, amount FROM fee_components ORDER BY course, position"
+_FEE_COURSES = "SELECT stream, course FROM fee_courses ORDER BY position"
+_PAYMENT_PLANS = "SELECT name, entry FROM payment_plans ORDER BY position"
+_SCHOLARSHIPS = "SELECT name, entry FROM scholarships ORDER BY position"
+_LOAN_BANKS = "SELECT name, rate FROM loan_banks ORDER BY position"
+_PLACEMENTS = "SELECT year, avg_salary, placement_rate, companies FROM placements ORDER BY year"
+_ROUNDS = "SELECT position, name, streams, programs FROM admission_rounds ORDER BY position"
+_DEADLINES = "SELECT round, event, starts, ends FROM deadlines ORDER BY round, position"
+_META = "SELECT key, value FROM meta"
+
+
+class ReadPool:
+    """Up to `size` read-only connections, each used by one thread at a time."""
+
+    def __init__(self, path, size=POOL_SIZE):
+        self.path = Path(path)
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            f"{self.path.resolve().as_uri()}?mode=ro", uri=True,
+            check_same_thread=False, cached_statements=STATEMENT_CACHE,
+        )
+        conn.execute("PRAGMA query_only = ON")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                grow = self._closed or self._opened < self.size
+                self._opened += grow
+            if grow:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    # Give the slot back, or a failed open would shrink the pool for good
+                    with self._lock:
+                        self._opened -= 1
+                    raise
+            else:
+                # Beyond `size` borrowers wait for a connection to come back
+                conn = self._idle.get()
+        if conn is None:
+            # Closed while waiting (see `close`): wake the next waiter and use a connection of its own
+            self._idle.put(None)
+            conn = self._connect()
+        try:
+            yield conn
+        finally:
+            if self._closed:
+                conn.close()
+            else:
+                self._idle.put(conn)
+
+    def close(self):
+        """Close the idle connections now and borrowed ones as they come back."""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if conn is not None:
+                conn.close()
+        self._idle.put(None)   # wakes borrowers waiting for a connection
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_mtime_ns
+
+
+class Store:
+    def __init__(self, path=None, pool_size=POOL_SIZE):
+        self.path = Path(path or DB_PATH or DEFAULT_DB_PATH)
+        self._lock = threading.Lock()
+        self._open(pool_size)
+
+    def _open(self, pool_size):
+        self._signature = _file_signature(self.path)
+        self.pool = ReadPool(self.path, pool_size)
+        with self.pool.connection() as conn:
+            self.meta = dict(conn.execute(_META).fetchall())
+        self.catalog_version = self.meta["catalog_version"]
+        self.placements_version = self.meta["placements_version"]
+        self.deadlines_version = self.meta["deadlines_version"]
+
+    def reopen(self):
+        """Move to a new pool if `bulk_load` replaced the file since it was opened; returns self.
+
+        Open connections keep reading the file they opened, so without this
+        the process would never see a rebuilt database.
+        """
+        with self._lock:
+            if _file_signature(self.path) != self._signature:
+                previous = self.pool
+                self._open(previous.size)
+                previous.close()
+        return self
+
+    def close(self):
+        self.pool.close()
+
+    def programs_in_budget(self, low, high, stream=None):
+        """(stream, course) pairs with low <= annual_fee <= high, cheapest first (as `FeeIndex.range`)."""
+        with self.pool.connection() as conn:
+            if stream is None:
+                return conn.execute(_BUDGET, (low, high)).fetchall()
+            return conn.execute(_BUDGET_IN_STREAM, (stream, low, high)).fetchall()
+
+    def fee_components(self, course):
+        """Fee component -> amount for `course`, or the default fees if it has none of its own."""
+        with self.pool.connection() as conn:
+            rows = conn.execute(_FEE_COMPONENTS, (course,)).fetchall()
+            if not rows:
+                rows = conn.execute(_FEE_COMPONENTS, (DEFAULT_FEES,)).fetchall()
+        return dict(rows)
+
+    def deadlines_data(self):
+        """The admissions calendar as the list data/deadlines.json holds, for `calendar_from_dict`."""
+        with self.pool.connection() as conn:
+            rounds = {}
+            for position, name, streams, programs in conn.execute(_ROUNDS):
+                rounds[position] = entry = {"round": name, "events": {}}
+                for key, scope in (("streams", json.loads(streams)), ("programs", json.loads(programs))):
+                    if scope:
+                        entry[key] = scope
+            for position, event, starts, ends in conn.execute(_DEADLINES):
+                rounds[position]["events"][event] = [starts, ends]
+        return list(rounds.values())
+
+    def catalog_data(self):
+        """The catalog as the dict data/catalog.json holds, for `catalog_from_dict`."""
+        with self.pool.connection() as conn:
+            streams = {}
+            for stream, name, details in conn.execute(_PROGRAMS):
+                streams.setdefault(stream, {})[name] = json.loads(details)
+            fee_courses = {}
+            for stream, course in conn.execute(_FEE_COURSES):
+                fee_courses.setdefault(stream, []).append(course)
+            fee_structures = {}
+            for course, component, amount in conn.execute(_ALL_FEE_COMPONENTS):
+                fee_structures.setdefault(course, {})[component] = amount
+            data = {
+                "streams": streams,
+                "fee_courses": fee_courses,
+                "default_fees": fee_structures.pop(DEFAULT_FEES, {}),
+                "fee_structures": fee_structures,
+                "payment_plans": {name: json.loads(entry) for name, entry in conn.execute(_PAYMENT_PLANS)},
+                "scholarships": {name: json.loads(entry) for name, entry in conn.execute(_SCHOLARSHIPS)},
+                "loan_banks": dict(conn.execute(_LOAN_BANKS).fetchall()),
+            }
+        return data
+
+    def placements_data(self):
+        """The placement summary as the dict data/placements.json holds."""
+        with self.pool.connection() as conn:
+            rows = conn.execute(_PLACEMENTS).fetchall()
+        years, avg_salary, placement_rate, companies = (list(column) for column in zip(*rows)) if rows else ([],) * 4
+        return {"years": years, "avg_salary": avg_salary, "placement_rate": placement_rate, "companies": companies}
+
+
+def _positions(mapping):
+    return enumerate(mapping.items())
+
+
+def bulk_load(path, catalog, placements, deadlines, catalog_version, placements_version, deadlines_version):
+    """Write a fresh database to `path` from the catalog, placements and deadlines data, atomically.
+
+    Rows go in with journaling and syncing off inside one transaction, then
+    the indexes are built and the finished file replaces `path`, so readers
+    never see a half-loaded database. Returns the number of rows written.
+    """
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.unlink(missing_ok=True)
+    conn = sqlite3.connect(tmp, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.executescript(SCHEMA)
+        tables = {
+            "meta": [
+                ("catalog_version", catalog_version),
+                ("placements_version", placements_version),
+                ("deadlines_version", deadlines_version),
+            ],
+            "programs": [
+                (stream, name, details["annual_fee"], details.get("min_percentage"), json.dumps(details))
+                for stream, courses in catalog["streams"].items()
+                for name, details in courses.items()
+            ],
+            "fee_courses": [
+                (stream, course, position)
+                for position, (stream, course) in enumerate(
+                    (stream, course) for stream, courses in catalog["fee_courses"].items() for course in courses
+                )
+            ],
+            "fee_components": [
+                (course, position, component, amount)
+                for course, components in [(DEFAULT_FEES, catalog["default_fees"]), *catalog["fee_structures"].items()]
+                for position, (component, amount) in _positions(components)
+            ],
+            "payment_plans": [(name, i, json.dumps(entry)) for i, (name, entry) in _positions(catalog["payment_plans"])],
+            "scholarships": [(name, i, json.dumps(entry)) for i, (name, entry) in _positions(catalog["scholarships"])],
+            "loan_banks": [(name, i, rate) for i, (name, rate) in _positions(catalog["loan_banks"])],
+            "placements": list(zip(
+                placements["years"], placements["avg_salary"], placements["placement_rate"], placements["companies"],
+            )),
+            "admission_rounds": [
+                (i, entry["round"], json.dumps(entry.get("streams", [])), json.dumps(entry.get("programs", [])))
+                for i, entry in enumerate(deadlines)
+            ],
+            "deadlines": [
+                (i, position, event, days[0], days[-1])
+                for i, entry in enumerate(deadlines)
+                for position, (event, days) in _positions(entry["events"])
+            ],
+        }
+        columns = {"programs": "(stream, name, annual_fee, min_percentage, details)"}
+        conn.execute("BEGIN")
+        for table, rows in tables.items():
+            if rows:
+                marks = ", ".join("?" * len(rows[0]))
+                conn.executemany(f"INSERT INTO {table} {columns.get(table, '')} VALUES ({marks})", rows)
+        conn.execute("COMMIT")
+        conn.executescript(INDEXES)
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    os.replace(tmp, path)
+    return sum(len(rows) for rows in tables.values())
+
+
+def _read(path):
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    return json.loads(raw), hashlib.sha256(raw).hexdigest()[:12]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the SQLite admissions store from the JSON data files.")
+    parser.add_argument("db", nargs="?", default=str(DB_PATH or DEFAULT_DB_PATH))
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    catalog, catalog_version = _read(CATALOG_PATH)
+    placements, placements_version = _read(PLACEMENTS_PATH)
+    deadlines, deadlines_version = _read(DEADLINES_PATH)
+    rows = bulk_load(args.db, catalog, placements, deadlines, catalog_version, placements_version, deadlines_version)
+    print(f"{rows} rows written to {args.db} in {(time.perf_counter() - start) * 1000:.0f} ms", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Throughput of batch counseling (admitbot.batch) per worker count.
+
+Writes `--rows` synthetic applicants and a synthetic catalog of
+`--programs` programs to a temporary directory, then runs the batch job
+once per worker count and reports applicants per second and peak RSS.
+
+Usage:
+    python benchmarks/batch_counseling.py [--rows 100000] [--programs 2000] [--workers 1 2 4]
+"""
+import argparse
+import csv
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import synthetic
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from admitbot import batch  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--programs", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        catalog_path = Path(directory) / "catalog.json"
+        catalog_path.write_text(json.dumps(synthetic.catalog_data(args.programs)))
+        source = Path(directory) / "applicants.csv"
+        with open(source, "w", newline="") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["applicant_id", "stream", "percentage", "interests", "strengths", "exam", "exam_score"])
+            for start in range(0, args.rows, 10_000):
+                for n, p in enumerate(synthetic.profiles(min(10_000, args.rows - start), seed=start), start):
+                    writer.writerow([f"A{n:07d}", p["stream"], p["percentage"], ";".join(p["interests"]),
+                                     ";".join(p["strengths"]), p["exam"], p["exam_score"]])
+
+        print(f"{os.cpu_count()} CPU(s) available; {args.rows:,} applicants x {args.programs:,} programs")
+        print(f"{'workers':>8}{'seconds':>9}{'rows/s':>10}{'rows/s/worker':>15}{'parent RSS MiB':>16}{'worker RSS MiB':>16}")
+        for workers in args.workers:
+            start = time.perf_counter()
+            rows, _ = batch.run(source, Path(directory) / "out.csv", workers=workers, catalog_path=catalog_path)
+            elapsed = time.perf_counter() - start
+            parent = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            child = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+            print(f"{workers:>8}{elapsed:>9.1f}{rows / elapsed:>10,.0f}{rows / elapsed / workers:>15,.0f}"
+                  f"{parent:>16.0f}{child:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
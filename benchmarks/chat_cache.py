@@ -0,0 +1,100 @@
+"""Hit rate and time-to-first-token of the shared chat answer cache.
+
+Replays a season's worth of chat traffic through `AnswerCache`. Questions
+come from the intent data sets with random casing, punctuation and
+spacing. They are drawn from a Zipf distribution, so a few questions
+("last date to apply", "fee for cse") dominate, as they do in admission
+season. The report gives the hit rate and the time from question to first
+streamed chunk for cache hits, cache misses and uncached answers.
+A final pass changes the data version halfway through to show
+invalidation.
+
+Usage:
+    python benchmarks/chat_cache.py [--questions 50000] [--zipf 1.3] [--size 4096]
+"""
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from admitbot.catalog import load_catalog  # noqa: E402
+from admitbot.chat import CACHE_SIZE, AnswerCache, answer, normalize, stream  # noqa: E402
+from admitbot.deadlines import CalendarIndex, load_calendar  # noqa: E402
+from admitbot.faq import FaqIndex, load_faq  # noqa: E402
+from admitbot.intent import TEST_PATH, TRAIN_PATH, IntentModel, read_examples  # noqa: E402
+from admitbot.placements import load_placements  # noqa: E402
+
+
+def _variant(rng, question):
+    """The same question as a visitor might type it."""
+    if rng.random() < 0.5:
+        question = question.capitalize()
+    if rng.random() < 0.5:
+        question += "?"
+    if rng.random() < 0.2:
+        question = question.replace(" ", "  ", 1)
+    return question
+
+
+def replay(traffic, cache, reply, version_at):
+    """Time to first chunk per question, split into hits and misses."""
+    hits, misses = [], []
+    for i, question in enumerate(traffic):
+        computed = []
+
+        def compute(key):
+            computed.append(key)
+            return reply(key)
+
+        start = time.perf_counter()
+        key = normalize(question)
+        text = cache.get(key, version_at(i), lambda: compute(key)).text
+        next(stream(text))
+        (misses if computed else hits).append(time.perf_counter() - start)
+    return hits, misses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=50_000)
+    parser.add_argument("--zipf", type=float, default=1.3, help="Zipf exponent of question popularity")
+    parser.add_argument("--size", type=int, default=CACHE_SIZE, help="cache entries")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pool = sorted(set(read_examples(TRAIN_PATH)[1] + read_examples(TEST_PATH)[1]))
+    rng = np.random.default_rng(args.seed)
+    order = rng.permutation(len(pool))
+    ranks = np.minimum(rng.zipf(args.zipf, size=args.questions), len(pool)) - 1
+    traffic = [_variant(rng, pool[order[rank]]) for rank in ranks]
+
+    model, catalog, faq, placements = IntentModel.load(), load_catalog(), load_faq(), load_placements()
+    faq_index = FaqIndex(faq)
+    calendar, today = CalendarIndex(load_calendar()), date.today()
+
+    def reply(question):
+        return answer(question, model, catalog, faq, faq_index, placements, calendar, today)
+
+    hits, misses = replay(traffic, AnswerCache(args.size), reply, lambda i: "v1")
+    uncached = []
+    for question in traffic[:5000]:
+        start = time.perf_counter()
+        next(stream(reply(question).text))
+        uncached.append(time.perf_counter() - start)
+    _, reloaded = replay(traffic, AnswerCache(args.size), reply, lambda i: "v1" if i < len(traffic) // 2 else "v2")
+
+    print(f"{len(traffic):,} questions over {len(pool)} distinct ones, cache size {args.size}")
+    print(f"hit rate: {len(hits) / len(traffic):.1%} ({len(misses)} misses; "
+          f"{len(reloaded)} with a data reload halfway)\n")
+    print(f"{'time to first chunk':<22}{'count':>8}{'p50 ms':>9}{'p99 ms':>9}")
+    for name, timings in (("cache hit", hits), ("cache miss", misses), ("no cache", uncached)):
+        p50, p99 = np.percentile(timings, [50, 99]) * 1000
+        print(f"{name:<22}{len(timings):>8,}{p50:>9.4f}{p99:>9.4f}")
+
+
+if __name__ == "__main__":
+    main()
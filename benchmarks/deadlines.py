@@ -0,0 +1,110 @@
+"""Admissions calendar query latency, indexed against a full scan.
+
+Builds synthetic calendars with a few application rounds per program (an
+application window, an entrance exam and a counseling window each). Times
+the Deadlines tab's three questions over random days of the admissions
+year, once with `CalendarIndex` and once by scanning every event, as the
+page would without the index:
+
+- open now: events running on the day
+- closing this week: events with a deadline in the next 7 days
+- next deadline: the first deadline on or after the day for one program
+
+Also reports the one-off index build and a full `day()` summary, which is
+what the page computes once per day. Exits non-zero if an indexed answer
+differs from the scan.
+
+Usage:
+    python benchmarks/deadlines.py [--programs 1000 10000] [--rounds 3]
+"""
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import synthetic
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from admitbot.deadlines import WEEK, CalendarIndex  # noqa: E402
+
+
+def _key(event):
+    return event.end, event.start, event.round, event.name, event.streams, event.programs
+
+
+def _applies(event, course):
+    return course in event.programs if event.programs else not event.streams
+
+
+def scan_open(events, day):
+    return sorted((event for event in events if event.start <= day <= event.end), key=_key)
+
+
+def scan_closing(events, day):
+    until = day + timedelta(days=WEEK)
+    return sorted((event for event in events if day <= event.end < until), key=_key)
+
+
+def scan_next(events, day, course):
+    return min((event for event in events if event.end >= day and _applies(event, course)), key=_key, default=None)
+
+
+def _timed(func, cases):
+    timings, results = [], []
+    for case in cases:
+        start = time.perf_counter()
+        results.append(func(*case))
+        timings.append(time.perf_counter() - start)
+    return np.percentile(timings, [50, 99]) * 1000, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--programs", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--rounds", type=int, default=3, help="rounds per program")
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    mismatches = 0
+    print(f"{'programs':>9}{'events':>9}{'build ms':>10}  {'query':<14}"
+          f"{'index p50':>10}{'p99 ms':>9}{'scan p50':>10}{'p99 ms':>9}")
+    for programs in args.programs:
+        calendar = synthetic.calendar(programs, args.rounds, args.seed)
+        events = calendar.events
+        start = time.perf_counter()
+        index = CalendarIndex(calendar)
+        build = (time.perf_counter() - start) * 1000
+
+        days = [date(2024, 1, 1) + timedelta(days=int(n)) for n in rng.integers(0, 400, size=args.queries)]
+        courses = [f"Program {int(n):05d}" for n in rng.integers(0, programs, size=args.queries)]
+        queries = (
+            ("open now", index.open_on, scan_open, [(day,) for day in days]),
+            ("closing", index.closing, scan_closing, [(day,) for day in days]),
+            ("next deadline", lambda day, course: index.next_deadline(day, "", course), scan_next,
+             list(zip(days, courses))),
+            ("day summary", index.day, None, [(day,) for day in days]),
+        )
+        for n, (name, indexed, scan, cases) in enumerate(queries):
+            (p50, p99), found = _timed(indexed, cases)
+            row = f"{programs:>9,}{len(events):>9,}{build:>10.1f}" if n == 0 else " " * 28
+            row += f"  {name:<14}{p50:>10.4f}{p99:>9.4f}"
+            if scan is not None:
+                (scan_p50, scan_p99), expected = _timed(lambda *case: scan(events, *case), cases)
+                mismatches += sum(
+                    list(got) != list(want) if isinstance(got, tuple) else got != want
+                    for got, want in zip(found, expected)
+                )
+                row += f"{scan_p50:>10.3f}{scan_p99:>9.3f}"
+            print(row)
+
+    if mismatches:
+        print(f"\n{mismatches} indexed answers differ from the scan", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Admissions FAQ search latency as the FAQ grows.
+
+For each size, reports the one-off BM25 index build time and the latency
+of `FaqIndex.search` over a set of typical visitor questions. The first
+size is the shipped FAQ; larger ones are padded with synthetic snippets.
+Exits non-zero if p99 latency on the shipped FAQ reaches the budget.
+
+Usage:
+    python benchmarks/faq_search.py [--sizes 1000 10000] [--budget-ms 1.0]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import synthetic
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from admitbot.faq import FaqIndex, load_faq  # noqa: E402
+
+QUERIES = [
+    "documents needed", "JEE eligibility", "last date to apply", "neet score",
+    "what is the age limit for medical", "income certificate", "how do I pay the fees",
+    "admit card download", "early admission deadline", "transfer certificate migration",
+    "upload photo and signature", "entrance exam date", "course allocation counseling",
+    "minimum percentage in pcm", "elig", "docu", "category certificate sc st obc",
+]
+
+
+def measure(faq, repeat):
+    start = time.perf_counter()
+    index = FaqIndex(faq)
+    build = time.perf_counter() - start
+    timings = []
+    for _ in range(repeat):
+        for query in QUERIES:
+            start = time.perf_counter()
+            index.search(query)
+            timings.append(time.perf_counter() - start)
+    return len(index), build, np.percentile(timings, [50, 99]) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=200, help="passes over the query set")
+    parser.add_argument("--budget-ms", type=float, default=1.0, help="p99 budget on the shipped FAQ")
+    args = parser.parse_args()
+
+    print(f"{'snippets':>9}{'build ms':>10}{'p50 ms':>9}{'p99 ms':>9}")
+    shipped_p99 = None
+    for faq in [load_faq()] + [synthetic.faq(size) for size in args.sizes]:
+        size, build, (p50, p99) = measure(faq, args.repeat)
+        shipped_p99 = p99 if shipped_p99 is None else shipped_p99
+        print(f"{size:>9,}{build * 1000:>10.1f}{p50:>9.3f}{p99:>9.3f}")
+
+    if shipped_p99 >= args.budget_ms:
+        print(f"\np99 {shipped_p99:.3f} ms on the shipped FAQ exceeds {args.budget_ms} ms", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
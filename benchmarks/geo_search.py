@@ -0,0 +1,101 @@
+"""College Search "within N km" latency: grid index against a brute-force scan.
+
+Builds synthetic directories of institutions (clustered around Indian
+cities, 1-8 programs each) and runs searches from random city centres
+with random radii, budgets and streams. Each search runs three ways:
+
+- grid:   `Directory.search`, which uses the `GeoGrid` cell index
+- numpy:  distances to every institution at once, then the same filters
+- python: a plain loop over every program, as a first version would
+
+Reports the one-off index build, p50/p99 per search and the mean number of
+programs found. Exits non-zero if the grid and the scans disagree.
+
+Usage:
+    python benchmarks/geo_search.py [--institutions 10000 100000] [--queries 300]
+"""
+import argparse
+import sys
+import time
+from math import asin, cos, radians, sin, sqrt
+from pathlib import Path
+
+import numpy as np
+import synthetic
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from admitbot.institutions import EARTH_RADIUS_KM, Directory, haversine_km  # noqa: E402
+
+RADII_KM = (10, 25, 50, 100, 250)
+STREAMS = (None, "Engineering", "Medical", "Business", "Arts & Science")
+
+
+def numpy_scan(frame, lat, lon, radius_km, low, high, stream):
+    distances = haversine_km(lat, lon, frame["latitude"].to_numpy(), frame["longitude"].to_numpy())
+    fees = frame["annual_fee"].to_numpy()
+    keep = (distances <= radius_km) & (fees >= low) & (fees <= high)
+    if stream is not None:
+        keep &= frame["stream"].to_numpy() == stream
+    return int(keep.sum())
+
+
+def python_scan(rows, lat, lon, radius_km, low, high, stream):
+    found = 0
+    lat, lon = radians(lat), radians(lon)
+    for row_lat, row_lon, row_stream, fee in rows:
+        if not low <= fee <= high or (stream is not None and row_stream != stream):
+            continue
+        row_lat, row_lon = radians(row_lat), radians(row_lon)
+        a = sin((row_lat - lat) / 2) ** 2 + cos(lat) * cos(row_lat) * sin((row_lon - lon) / 2) ** 2
+        found += 2 * EARTH_RADIUS_KM * asin(sqrt(min(a, 1.0))) <= radius_km
+    return found
+
+
+def _timed(func, cases):
+    timings, results = [], []
+    for case in cases:
+        start = time.perf_counter()
+        results.append(func(*case))
+        timings.append(time.perf_counter() - start)
+    return np.percentile(timings, [50, 99]) * 1000, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--institutions", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    cities = list(synthetic.CITIES.values())
+    mismatches = 0
+    print(f"{'institutions':>13}{'programs':>10}{'build ms':>10}  {'search':<8}{'p50 ms':>9}{'p99 ms':>9}{'found':>8}")
+    for count in args.institutions:
+        frame = synthetic.institutions(count, args.seed)
+        start = time.perf_counter()
+        directory = Directory(frame)
+        build = (time.perf_counter() - start) * 1000
+        rows = list(frame[["latitude", "longitude", "stream", "annual_fee"]].itertuples(index=False, name=None))
+
+        cases = []
+        for _ in range(args.queries):
+            lat, lon = cities[int(rng.integers(0, len(cities)))]
+            low = int(rng.integers(0, 10)) * 100_000
+            cases.append((lat, lon, float(rng.choice(RADII_KM)), low, low + int(rng.integers(2, 8)) * 100_000,
+                          STREAMS[int(rng.integers(0, len(STREAMS)))]))
+
+        (p50, p99), grid = _timed(lambda *case: directory.search(*case, limit=100)[1], cases)
+        print(f"{count:>13,}{len(frame):>10,}{build:>10.1f}  {'grid':<8}{p50:>9.3f}{p99:>9.3f}{np.mean(grid):>8.0f}")
+        for name, scan, data in (("numpy", numpy_scan, frame), ("python", python_scan, rows)):
+            (p50, p99), found = _timed(lambda *case: scan(data, *case), cases)
+            mismatches += sum(a != b for a, b in zip(grid, found))
+            print(f"{'':>33}  {name:<8}{p50:>9.3f}{p99:>9.3f}{np.mean(found):>8.0f}")
+
+    if mismatches:
+        print(f"\n{mismatches} grid searches disagree with the scans", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
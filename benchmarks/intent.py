@@ -0,0 +1,88 @@
+"""Accuracy and speed of the chat intent classifier.
+
+Reports accuracy on the held-out questions in data/intents/test.tsv (per
+intent, with every miss listed), then the latency of one classification
+and of a full chat answer, and single-core throughput. Exits non-zero if
+accuracy or throughput falls below the thresholds.
+
+Usage:
+    python benchmarks/intent.py [--min-accuracy 0.9] [--min-qps 1000]
+"""
+import argparse
+import sys
+import time
+from collections import Counter
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from admitbot.catalog import load_catalog  # noqa: E402
+from admitbot.chat import answer  # noqa: E402
+from admitbot.deadlines import CalendarIndex, load_calendar  # noqa: E402
+from admitbot.faq import FaqIndex, load_faq  # noqa: E402
+from admitbot.intent import TEST_PATH, IntentModel, read_examples  # noqa: E402
+from admitbot.placements import load_placements  # noqa: E402
+
+
+def _latencies(func, questions, repeat):
+    timings = []
+    for _ in range(repeat):
+        for question in questions:
+            start = time.perf_counter()
+            func(question)
+            timings.append(time.perf_counter() - start)
+    return np.array(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50, help="passes over the test questions")
+    parser.add_argument("--min-accuracy", type=float, default=0.9)
+    parser.add_argument("--min-qps", type=float, default=1000, help="classifications per second on one core")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    model = IntentModel.load()
+    load_ms = (time.perf_counter() - start) * 1000
+    labels, questions = read_examples(TEST_PATH)
+    predicted = model.predict(questions)
+
+    total, correct = Counter(labels), Counter(label for label, guess in zip(labels, predicted) if label == guess)
+    accuracy = sum(correct.values()) / len(labels)
+    print(f"model: {len(model.intents)} intents, {model.dim} buckets, loaded in {load_ms:.1f} ms\n")
+    print(f"{'intent':<14}{'questions':>10}{'correct':>9}")
+    for intent in model.intents:
+        print(f"{intent:<14}{total[intent]:>10}{correct[intent]:>9}")
+    print(f"{'all':<14}{len(labels):>10}{sum(correct.values()):>9}   accuracy {accuracy:.1%}")
+    for label, guess, question in zip(labels, predicted, questions):
+        if label != guess:
+            print(f"  miss: {question!r} is {label}, predicted {guess}")
+
+    faq = load_faq()
+    catalog, faq_index, placements = load_catalog(), FaqIndex(faq), load_placements()
+    calendar, today = CalendarIndex(load_calendar()), date.today()
+    classify = _latencies(model.classify, questions, args.repeat)
+    replies = _latencies(
+        lambda q: answer(q, model, catalog, faq, faq_index, placements, calendar, today), questions, args.repeat,
+    )
+    qps = len(classify) / classify.sum()
+    print(f"\n{'':<10}{'p50 ms':>9}{'p99 ms':>9}")
+    for name, timings in (("classify", classify), ("answer", replies)):
+        p50, p99 = np.percentile(timings, [50, 99]) * 1000
+        print(f"{name:<10}{p50:>9.3f}{p99:>9.3f}")
+    print(f"\nthroughput: {qps:,.0f} classifications/s on one core")
+
+    failed = []
+    if accuracy < args.min_accuracy:
+        failed.append(f"accuracy {accuracy:.1%} < {args.min_accuracy:.0%}")
+    if qps < args.min_qps:
+        failed.append(f"throughput {qps:,.0f}/s < {args.min_qps:,.0f}/s")
+    if failed:
+        print("\n" + "; ".join(failed), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
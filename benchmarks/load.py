@@ -0,0 +1,307 @@
+"""Concurrent-session load test against a local Streamlit server.
+
+Starts `streamlit run benchmarks/offline_app.py` (app.py with the Campus
+Tour map embed stubbed out) headless on a free local port and connects N
+simulated browser sessions to it over the same websocket protocol the
+frontend uses. Each session loops until the time is up:
+
+- pick a sidebar page and open it
+- interact like a visitor would: drag the College Search budget slider,
+  move the Parent Support sliders, fill in and submit Student Counseling
+- pause between actions for an exponentially distributed think time
+
+Every interaction is one script rerun. Latency is measured from sending
+the rerun to the server's "script finished" message. The report gives
+reruns per second, p50/p95/p99 latency per page and overall, and the
+server's RSS growth per session.
+
+Sessions are asyncio tasks in this process, while the app runs in its own
+server process, so the numbers are the server's rather than the client's.
+
+Usage:
+    python benchmarks/load.py --sessions 20 --duration 60 [--think 2.0]
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.websocket import websocket_connect
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PAGES = [
+    "Home", "Admissions FAQ", "Fee Structure", "College Search",
+    "Student Counseling", "Parent Support", "Placement Statistics", "Virtual Campus Tour",
+]
+# Visitors spend most of their time on the interactive pages
+PAGE_WEIGHTS = [1, 1, 2, 3, 3, 3, 2, 1]
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _rss_kb(pid):
+    with open(f"/proc/{pid}/status") as fh:
+        for line in fh:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def start_server(port):
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", str(ROOT / "benchmarks" / "offline_app.py"),
+            "--server.headless", "true",
+            "--server.address", "127.0.0.1",
+            "--server.port", str(port),
+            "--server.fileWatcherType", "none",
+            "--browser.gatherUsageStats", "false",
+        ],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("streamlit server did not come up")
+
+
+class Session:
+    """One simulated browser tab: tracks rendered widgets and sends reruns.
+
+    Like the frontend, a change to a widget inside a fragment (Streamlit
+    1.33+) asks for a rerun of just that fragment; `full=True` always
+    reruns the whole script, as Streamlit 1.32 does.
+    """
+
+    def __init__(self, url, rng, full=False):
+        self.url = url
+        self.rng = rng
+        self.full = full
+        self.widgets = {}     # label -> [(kind, proto, fragment id)] from the rendered page
+        self.states = {}      # widget id -> WidgetState to send
+        self.fragment = None  # fragment of the widgets changed since the last rerun ("" = none)
+        self.errors = 0
+        self.last_error = None
+        self.deltas = 0       # deltas received in the last rerun
+
+    async def connect(self):
+        self.ws = await websocket_connect(self.url, max_message_size=64 * 1024 * 1024)
+
+    async def rerun(self):
+        back = BackMsg()
+        state = back.rerun_script
+        state.query_string = ""
+        state.widget_states.widgets.extend(self.states.values())
+        fragment = "" if self.full else self.fragment or ""
+        if fragment:
+            state.fragment_id = fragment
+        start = time.perf_counter()
+        await self.ws.write_message(back.SerializeToString(), binary=True)
+
+        # A fragment rerun only resends that fragment's elements
+        widgets = {
+            label: [entry for entry in entries if entry[2] != fragment]
+            for label, entries in self.widgets.items()
+        } if fragment else {}
+        self.deltas = 0
+        while True:
+            raw = await self.ws.read_message()
+            if raw is None:
+                raise ConnectionError("server closed the session")
+            msg = ForwardMsg()
+            msg.ParseFromString(raw)
+            kind = msg.WhichOneof("type")
+            self.deltas += kind == "delta"
+            if kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                element = msg.delta.new_element
+                name = element.WhichOneof("type")
+                if name == "exception":
+                    self.errors += 1
+                    self.last_error = f"{element.exception.type}: {element.exception.message}"
+                proto = getattr(element, name)
+                if hasattr(proto, "id") and hasattr(proto, "label") and proto.id:
+                    entry = (name, proto, getattr(msg.delta, "fragment_id", ""))
+                    widgets.setdefault(proto.label, []).append(entry)
+            elif kind == "script_finished":
+                break
+        elapsed = time.perf_counter() - start
+
+        # Triggers fire once; widgets that are no longer on the page drop out
+        self.widgets = {label: entries for label, entries in widgets.items() if entries}
+        self.fragment = None
+        live = {proto.id for entries in self.widgets.values() for _, proto, _ in entries}
+        self.states = {
+            wid: state for wid, state in self.states.items()
+            if wid in live and state.WhichOneof("value") != "trigger_value"
+        }
+        return elapsed
+
+    def options(self, label, nth=0):
+        return list(self.widgets[label][nth][1].options)
+
+    def set(self, label, value, nth=0):
+        """Change the `nth` widget labelled `label` (several Fee Structure selectboxes share a blank label)."""
+        kind, proto, fragment = self.widgets[label][nth]
+        # Changes in two different fragments (or outside any) need a full rerun
+        self.fragment = fragment if self.fragment in (None, fragment) else ""
+        state = self.states.setdefault(proto.id, WidgetState(id=proto.id))
+        if kind in ("radio", "selectbox"):
+            state.int_value = list(proto.options).index(value)
+        elif kind == "multiselect":
+            del state.int_array_value.data[:]
+            state.int_array_value.data.extend(list(proto.options).index(item) for item in value)
+        elif kind == "slider":
+            values = list(value) if isinstance(value, (list, tuple)) else [value]
+            if not all(proto.min <= v <= proto.max for v in values):
+                raise ValueError(f"{label!r} spans {proto.min:g}-{proto.max:g}, got {value}")
+            del state.double_array_value.data[:]
+            state.double_array_value.data.extend(values)
+        elif kind == "number_input":
+            state.double_value = value
+        elif kind == "checkbox":
+            state.bool_value = value
+        elif kind == "button":
+            state.trigger_value = True
+        else:
+            raise ValueError(f"unsupported widget {kind}")
+
+    def interactions(self, page):
+        """Widget changes a visitor might make on `page`, each followed by a rerun."""
+        rng = self.rng
+        if page == "College Search":
+            # The slider spans 0-10 lakhs
+            low = float(rng.integers(0, 10))
+            for high in sorted(rng.integers(low + 1, 11, size=3)):  # a drag lands on a few positions
+                yield "Annual Budget (in lakhs)", (low, float(high))
+            yield "Select Your Stream of Interest", str(rng.choice(
+                ["All Streams", "Engineering", "Medical", "Business", "Arts & Science"]))
+        elif page == "Parent Support":
+            yield "Total Course Cost (₹)", int(rng.integers(10, 41)) * 50_000
+            yield "Expected Starting Salary (₹/year)", int(rng.integers(12, 61)) * 25_000
+            yield "Years to Calculate ROI", int(rng.integers(1, 11))
+        elif page == "Student Counseling":
+            yield "Your 12th Percentage", float(rng.integers(50, 100))
+            interests = self.options("Select Your Interests")
+            yield "Select Your Interests", [str(item) for item in rng.choice(interests, size=2, replace=False)]
+            yield "Get Recommendations", True
+        elif page == "Fee Structure":
+            yield "Scholarships", ["Merit Scholarship"] if rng.random() < 0.5 else []
+            yield "Include hostel and mess", bool(rng.random() < 0.5)
+
+
+async def run_session(url, seed, until, think, latencies):
+    rng = np.random.default_rng(seed)
+    session = Session(url, rng)
+    await session.connect()
+    await session.rerun()
+    try:
+        while time.monotonic() < until:
+            page = str(rng.choice(PAGES, p=np.array(PAGE_WEIGHTS) / sum(PAGE_WEIGHTS)))
+            session.set("Choose a section:", page)
+            latencies[page].append(await session.rerun())
+            for label, value in session.interactions(page):
+                await asyncio.sleep(rng.exponential(think))
+                if time.monotonic() >= until:
+                    break
+                if label in session.widgets:
+                    session.set(label, value)
+                    latencies[page].append(await session.rerun())
+            await asyncio.sleep(rng.exponential(think))
+    finally:
+        session.ws.close()
+    if session.last_error:
+        print(f"session {seed}: {session.last_error}", file=sys.stderr)
+    return session.errors
+
+
+async def warm(url):
+    """Open every page once so the server's shared caches exist before measuring."""
+    session = Session(url, np.random.default_rng(0))
+    await session.connect()
+    await session.rerun()
+    for page in PAGES:
+        session.set("Choose a section:", page)
+        await session.rerun()
+    session.ws.close()
+
+
+async def run(url, sessions, duration, think, ramp):
+    latencies = defaultdict(list)
+    until = time.monotonic() + duration
+
+    async def delayed(i):
+        await asyncio.sleep(random.Random(i).uniform(0, ramp))
+        return await run_session(url, i, until, think, latencies)
+
+    errors = await asyncio.gather(*(delayed(i) for i in range(sessions)))
+    return latencies, sum(errors)
+
+
+def _row(name, values):
+    ms = np.array(values) * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return f"{name:<22}{len(ms):>8}{p50:>9.1f}{p95:>9.1f}{p99:>9.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=60, help="seconds of load")
+    parser.add_argument("--think", type=float, default=2.0, help="mean think time between actions (s)")
+    parser.add_argument("--ramp", type=float, default=5.0, help="spread session starts over this many seconds")
+    args = parser.parse_args()
+
+    port = _free_port()
+    server = start_server(port)
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    try:
+        # Shared caches are built before measuring so they don't count per session
+        asyncio.run(warm(url))
+        rss_before = _rss_kb(server.pid)
+        start = time.monotonic()
+        latencies, errors = asyncio.run(run(url, args.sessions, args.duration, args.think, args.ramp))
+        elapsed = time.monotonic() - start
+        rss_after = _rss_kb(server.pid)
+    finally:
+        server.terminate()
+        server.wait()
+
+    everything = [value for values in latencies.values() for value in values]
+    print(f"{args.sessions} sessions, {elapsed:.0f} s, mean think {args.think:.1f} s")
+    print(f"{'page':<22}{'reruns':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for page in PAGES:
+        if latencies[page]:
+            print(_row(page, latencies[page]))
+    print(_row("all", everything))
+    print(f"\nreruns/s: {len(everything) / elapsed:.1f}")
+    print(f"server RSS: {rss_before / 1024:.0f} MiB -> {rss_after / 1024:.0f} MiB "
+          f"({(rss_after - rss_before) / args.sessions:,.0f} KiB per session)")
+    if errors:
+        print(f"{errors} reruns raised exceptions", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Cost of the in-app metrics relative to rerun time, per page.
+
+Reruns each page headlessly and counts how many timers and counters one
+rerun records, from the registry itself. It then times those operations
+in isolation and reports instrumentation time as a share of the rerun.
+Exits non-zero if any page exceeds the budget (1% by default).
+
+Usage:
+    python benchmarks/metrics_overhead.py [--repeat 30] [--budget 0.01]
+"""
+import argparse
+import statistics
+import sys
+import time
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from admitbot import metrics  # noqa: E402
+from admitbot.sections import PAGES  # noqa: E402
+
+
+def _ops():
+    counters, histograms = metrics.REGISTRY.snapshot()
+    return sum(counters.values()), sum(sum(cells[:-1]) for cells in histograms.values())
+
+
+def per_call_seconds():
+    registry = metrics.Registry()
+    number = 100_000
+
+    def timed():
+        with registry.timer("bench_seconds", page="Home"):
+            pass
+
+    timer = min(timeit.repeat(timed, number=number, repeat=5)) / number
+    inc = min(timeit.repeat(lambda: registry.inc("bench_total", cache="bench"), number=number, repeat=5)) / number
+    return timer, inc
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--budget", type=float, default=0.01, help="allowed overhead as a fraction of rerun time")
+    args = parser.parse_args()
+
+    timer_cost, inc_cost = per_call_seconds()
+    print(f"timer {timer_cost * 1e6:.2f} us, counter {inc_cost * 1e6:.2f} us per call\n")
+    print(f"{'page':<22}{'rerun ms':>10}{'timers':>8}{'counters':>10}{'overhead':>10}")
+
+    over = []
+    for page in PAGES:
+        at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=60).run()
+        at.sidebar.radio[0].set_value(page).run()
+        at.run()
+        incs_before, timers_before = _ops()
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            at.run()
+            times.append(time.perf_counter() - start)
+        incs_after, timers_after = _ops()
+
+        timers = (timers_after - timers_before) / args.repeat
+        incs = (incs_after - incs_before) / args.repeat
+        rerun = statistics.median(times)
+        share = (timers * timer_cost + incs * inc_cost) / rerun
+        print(f"{page:<22}{rerun * 1000:>10.1f}{timers:>8.1f}{incs:>10.1f}{share:>10.3%}")
+        if share > args.budget:
+            over.append(page)
+
+    if over:
+        print(f"\nover the {args.budget:.1%} budget: {', '.join(over)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
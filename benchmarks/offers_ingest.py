@@ -0,0 +1,55 @@
+"""Throughput of the streaming offer ingestion.
+
+Writes `--rows` synthetic offers over five years to a temporary directory,
+ingests them, then drops in one more year's file and re-runs the refresh
+to show that only the new rows are read.
+
+Usage:
+    python benchmarks/offers_ingest.py [--rows 2000000] [--chunk 100000]
+"""
+import argparse
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic import offers
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from admitbot.offers import OfferAggregates  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--chunk", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for year in range(2019, 2024):
+            offers(args.rows // 5, years=(year,), seed=year).to_csv(Path(directory) / f"offers_{year}.csv", index=False)
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        aggregates = OfferAggregates()
+        start = time.perf_counter()
+        rows = aggregates.refresh(directory, args.chunk)
+        elapsed = time.perf_counter() - start
+        print(f"full ingest:  {rows:>10,} rows  {elapsed:6.2f} s  {rows / elapsed:>12,.0f} rows/s")
+
+        offers(args.rows // 5, years=(2024,), seed=2024).to_csv(Path(directory) / "offers_2024.csv", index=False)
+        start = time.perf_counter()
+        rows = aggregates.refresh(directory, args.chunk)
+        elapsed = time.perf_counter() - start
+        print(f"new year:     {rows:>10,} rows  {elapsed:6.2f} s  {rows / elapsed:>12,.0f} rows/s")
+
+        start = time.perf_counter()
+        rows = aggregates.refresh(directory, args.chunk)
+        print(f"no change:    {rows:>10,} rows  {(time.perf_counter() - start) * 1000:6.2f} ms")
+
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(f"cells: {len(aggregates.cells):,}  peak RSS growth during ingest: {(rss_after - rss_before) / 1024:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""app.py with Campus Tour's Google Maps embed stubbed out, for benchmarks/load.py.
+
+The load test's sessions never render HTML, so nothing they receive is
+fetched, but the page still sends a live third-party URL in every Campus
+Tour rerun. This points the embed at about:blank before running app.py
+unchanged. Photos are sent as URLs either way; the server never loads
+them.
+
+Usage (what load.py runs):
+    streamlit run benchmarks/offline_app.py
+"""
+import runpy
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from admitbot.sections import campus_tour  # noqa: E402
+
+campus_tour.MAP_EMBED_URL = "about:blank"
+runpy.run_path(str(ROOT / "app.py"), run_name="__main__")
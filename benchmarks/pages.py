@@ -0,0 +1,200 @@
+"""Per-page render benchmark for the Streamlit app, checked against a baseline.
+
+Each scenario opens one sidebar page in Streamlit's headless test harness,
+sets a representative widget state and reruns the script. For each one it
+records:
+
+- run:      median script run time over the repeats (caches warm)
+- elements: rendered elements (markdown, widgets, charts, ...)
+- deltas:   elements plus layout blocks (columns, tabs, expanders), i.e. the
+            deltas the browser receives for a rerun
+- peak:     peak Python memory allocated during a rerun (tracemalloc, median
+            of three)
+
+Results are compared with benchmarks/baselines/pages.json. The script exits
+non-zero if a run time or peak grows past its tolerance, or if element or
+delta counts change at all. After an intended change, re-record with
+--update-baseline and commit the file. Record it with the Streamlit version
+pinned in requirements.txt: element and delta counts differ between
+versions, so the baseline stores the version it was recorded with and the
+check refuses to compare against a different one.
+
+Usage:
+    python benchmarks/pages.py [--repeat 20] [--update-baseline]
+"""
+import argparse
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import streamlit  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+from streamlit.testing.v1.element_tree import Block  # noqa: E402
+
+BASELINE = Path(__file__).resolve().parent / "baselines" / "pages.json"
+TIME_FLOOR_MS = 5.0     # absolute slack so millisecond pages don't flap
+MEMORY_FLOOR_KB = 512   # likewise for peaks, which move with allocator and gc timing
+
+# (scenario, page, [(widget kind, label, value)]); a value of None clicks a button
+SCENARIOS = [
+    ("home", "Home", []),
+    ("faq", "Admissions FAQ", []),
+    ("faq/medical", "Admissions FAQ", [("selectbox", "Select Course Type", "Medical")]),
+    ("faq/search", "Admissions FAQ", [("text_input", "Search admissions answers", "documents needed")]),
+    ("faq/deadline", "Admissions FAQ", [("selectbox", "Next deadline for", "MBBS")]),
+    ("fees", "Fee Structure", []),
+    ("fees/scholarships", "Fee Structure", [
+        ("selectbox", "Payment Plan", "One-time Payment"),
+        ("multiselect", "Scholarships", ["Merit Scholarship", "Girl Child"]),
+        ("checkbox", "Include hostel and mess", True),
+        ("slider", "Years of fees financed", 5),
+    ]),
+    ("college_search", "College Search", []),
+    ("college_search/all", "College Search", [
+        ("selectbox", "Select Your Stream of Interest", "All Streams"),
+        ("slider", "Annual Budget (in lakhs)", (1.0, 10.0)),
+    ]),
+    ("counseling", "Student Counseling", []),
+    ("counseling/recommend", "Student Counseling", [
+        ("multiselect", "Select Your Interests", ["Technology"]),
+        ("number_input", "Your 12th Percentage", 88.0),
+        ("button", "Get Recommendations", None),
+    ]),
+    ("parents", "Parent Support", []),
+    ("parents/analysis", "Parent Support", [
+        ("toggle", "Show sensitivity analysis", True),
+        ("toggle", "Simulate salary growth and loan interest", True),
+    ]),
+    ("placements", "Placement Statistics", []),
+    ("placements/2023", "Placement Statistics", [("selectbox", "Year", "2023")]),
+    ("campus_tour", "Virtual Campus Tour", []),
+]
+
+
+def _widget(at, kind, label):
+    for widget in getattr(at, kind):
+        if widget.label == label:
+            return widget
+    raise LookupError(f"no {kind} labelled {label!r}")
+
+
+def apply(at, state):
+    for kind, label, value in state:
+        widget = _widget(at, kind, label)
+        if value is None:
+            widget.click()
+        else:
+            widget.set_value(value)
+
+
+def counts(at):
+    elements = deltas = 0
+    stack = list(at._tree.children.values())
+    while stack:
+        node = stack.pop()
+        deltas += 1
+        if isinstance(node, Block):
+            stack.extend(node.children.values())
+        else:
+            elements += 1
+    return elements, deltas
+
+
+def measure(page, state, repeat):
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=60).run()
+    at.sidebar.radio[0].set_value(page).run()
+    apply(at, state)
+    at.run()  # warm this state's caches
+
+    times = []
+    for _ in range(repeat):
+        apply(at, state)
+        start = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - start)
+
+    peaks = []
+    for _ in range(3):
+        apply(at, state)
+        gc.collect()
+        tracemalloc.start()
+        at.run()
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    if at.exception:
+        raise RuntimeError(f"{page}: {at.exception[0].message}")
+    elements, deltas = counts(at)
+    return {
+        "run_ms": round(statistics.median(times) * 1000, 2),
+        "elements": elements,
+        "deltas": deltas,
+        "peak_kb": round(statistics.median(peaks) / 1024, 1),
+    }
+
+
+def regressions(name, result, base, time_tolerance, memory_tolerance):
+    found = []
+    for key in ("elements", "deltas"):
+        if result[key] != base[key]:
+            found.append(f"{name}: {key} {base[key]} -> {result[key]}")
+    if result["run_ms"] > base["run_ms"] * (1 + time_tolerance) + TIME_FLOOR_MS:
+        found.append(f"{name}: run {base['run_ms']:.1f} ms -> {result['run_ms']:.1f} ms")
+    if result["peak_kb"] > base["peak_kb"] * (1 + memory_tolerance) + MEMORY_FLOOR_KB:
+        found.append(f"{name}: peak {base['peak_kb']:,.0f} KiB -> {result['peak_kb']:,.0f} KiB")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument("--update-baseline", action="store_true", help="record these results as the new baseline")
+    parser.add_argument("--time-tolerance", type=float, default=0.5, help="allowed run time growth (fraction)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25, help="allowed peak memory growth (fraction)")
+    parser.add_argument("--only", nargs="*", help="scenario names to run (default: all)")
+    args = parser.parse_args()
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    recorded = baseline.get("streamlit")
+    if baseline and recorded != streamlit.__version__ and not args.update_baseline:
+        sys.exit(f"{baseline_path} was recorded with Streamlit {recorded}, this is {streamlit.__version__}; "
+                 "run with the version pinned in requirements.txt")
+    results, failures = {"streamlit": streamlit.__version__}, []
+
+    print(f"{'scenario':<24}{'run ms':>9}{'elements':>10}{'deltas':>8}{'peak KiB':>10}{'base ms':>9}")
+    for name, page, state in SCENARIOS:
+        if args.only and name not in args.only:
+            continue
+        result = results[name] = measure(page, state, args.repeat)
+        base = baseline.get(name)
+        print(f"{name:<24}{result['run_ms']:>9.1f}{result['elements']:>10}{result['deltas']:>8}"
+              f"{result['peak_kb']:>10,.0f}{base['run_ms'] if base else float('nan'):>9.1f}")
+        if base and not args.update_baseline:
+            failures += regressions(name, result, base, args.time_tolerance, args.memory_tolerance)
+
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        # Scenarios recorded with another Streamlit version aren't comparable; drop them
+        kept = baseline if recorded == streamlit.__version__ else {}
+        baseline_path.write_text(json.dumps({**kept, **results}, indent=2) + "\n")
+        print(f"baseline written to {baseline_path}")
+    elif failures:
+        print("\nREGRESSIONS against " + str(baseline_path) + ":", file=sys.stderr)
+        for failure in failures:
+            print("  " + failure, file=sys.stderr)
+        sys.exit(1)
+    elif not baseline:
+        print(f"no baseline at {baseline_path}; record one with --update-baseline")
+
+
+if __name__ == "__main__":
+    main()
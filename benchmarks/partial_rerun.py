@@ -0,0 +1,82 @@
+"""Full vs fragment rerun cost for the interactive widgets.
+
+Starts the app like benchmarks/load.py and, for each interaction, changes
+the same widget repeatedly in two sessions: one that always asks for a
+full script rerun (what every interaction cost before fragments, and
+still costs on Streamlit < 1.33) and one that reruns only the widget's
+fragment, as the browser does. Reports median latency, server CPU time
+and deltas sent per interaction.
+
+Usage:
+    python benchmarks/partial_rerun.py [--repeat 40]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+from itertools import cycle, islice
+
+from load import ROOT, Session, _free_port, start_server, warm
+
+# (page, widget label, nth widget with that label, values to cycle through; None = its options)
+INTERACTIONS = [
+    ("Parent Support", "Years to Calculate ROI", 0, list(range(1, 11))),
+    ("College Search", "Annual Budget (in lakhs)", 0, [(1.0, 3.0), (2.0, 5.0), (2.0, 8.0), (0.0, 10.0)]),
+    ("Fee Structure", "", 1, None),   # the course selectbox
+    ("Student Counseling", "Your 12th Percentage", 0, [60.0, 75.0, 90.0]),
+    ("Placement Statistics", "Branch", 0, None),
+]
+
+
+def _cpu_seconds(pid):
+    with open(f"/proc/{pid}/stat") as fh:
+        fields = fh.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+async def measure(url, pid, page, label, nth, values, repeat, full):
+    session = Session(url, None, full=full)
+    await session.connect()
+    await session.rerun()
+    session.set("Choose a section:", page)
+    await session.rerun()
+    values = values or session.options(label, nth)
+    latencies, deltas = [], []
+    cpu = _cpu_seconds(pid)
+    for value in islice(cycle(values), repeat):
+        session.set(label, value, nth)
+        latencies.append(await session.rerun())
+        deltas.append(session.deltas)
+    cpu = _cpu_seconds(pid) - cpu
+    session.ws.close()
+    if session.errors:
+        raise RuntimeError(f"{page}: {session.errors} exceptions, last: {session.last_error}")
+    return statistics.median(latencies) * 1000, cpu / repeat * 1000, statistics.median(deltas)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=40)
+    args = parser.parse_args()
+
+    port = _free_port()
+    server = start_server(port)
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    print(f"{'interaction':<42}{'full ms':>9}{'frag ms':>9}{'full cpu':>10}{'frag cpu':>10}{'deltas':>10}")
+    try:
+        asyncio.run(warm(url))
+        for page, label, nth, values in INTERACTIONS:
+            full = asyncio.run(measure(url, server.pid, page, label, nth, values, args.repeat, True))
+            partial = asyncio.run(measure(url, server.pid, page, label, nth, values, args.repeat, False))
+            name = f"{page}: {label or 'course'}"
+            print(f"{name:<42}{full[0]:>9.1f}{partial[0]:>9.1f}{full[1]:>10.1f}{partial[1]:>10.1f}"
+                  f"{f'{full[2]:.0f}->{partial[2]:.0f}':>10}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(ROOT))
+    main()
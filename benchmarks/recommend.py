@@ -0,0 +1,45 @@
+"""Latency of the Student Counseling recommender as the catalog grows.
+
+For each catalog size, reports the one-off build time of the feature
+matrix and the per-click latency of `Recommender.recommend` over random
+profiles (one click = one profile, top 3).
+
+Usage:
+    python benchmarks/recommend.py [--sizes 1000 5000 20000] [--clicks 500]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import synthetic
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from admitbot.recommend import Profile, Recommender  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--clicks", type=int, default=500)
+    args = parser.parse_args()
+
+    profiles = [Profile(**profile) for profile in synthetic.profiles(args.clicks, seed=1)]
+    print(f"{'programs':>9}{'build ms':>10}{'p50 ms':>9}{'p99 ms':>9}")
+    for size in args.sizes:
+        catalog = synthetic.catalog(size)
+        start = time.perf_counter()
+        recommender = Recommender(catalog)
+        build = time.perf_counter() - start
+        timings = []
+        for profile in profiles:
+            start = time.perf_counter()
+            recommender.recommend(profile, k=3)
+            timings.append(time.perf_counter() - start)
+        p50, p99 = np.percentile(timings, [50, 99]) * 1000
+        print(f"{size:>9,}{build * 1000:>10.1f}{p50:>9.3f}{p99:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
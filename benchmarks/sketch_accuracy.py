@@ -0,0 +1,71 @@
+"""Accuracy and latency of the per-cell t-digests against exact quantiles.
+
+Ingests synthetic offers through OfferAggregates, then for a spread of
+filter combinations compares digest quantiles with numpy's exact ones.
+Error is reported as rank error: |F(estimate) - q| on the exact data.
+Exits non-zero if any rank error exceeds --max-rank-error.
+
+Usage:
+    python benchmarks/sketch_accuracy.py [--rows 1000000] [--max-rank-error 0.01]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from synthetic import offers
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from admitbot.offers import CHUNK_ROWS, OfferAggregates  # noqa: E402
+
+QUANTILES = np.array([0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--max-rank-error", type=float, default=0.01)
+    args = parser.parse_args()
+
+    frame = offers(args.rows, years=tuple(range(2019, 2024)), seed=7)
+    aggregates = OfferAggregates()
+    for start in range(0, len(frame), CHUNK_ROWS):
+        aggregates.ingest_frame(frame.iloc[start:start + CHUNK_ROWS])
+    for cell in aggregates.cells.values():
+        cell.digest.compress()
+
+    filters = [{}, {"year": 2023}, {"branch": "ECE"}, {"year": 2023, "branch": "CSE"},
+               {"year": 2021, "company": "Google"}, {"year": 2022, "branch": "EEE", "company": "TCS"}]
+    worst = 0.0
+    print(f"{'filter':<45}{'rows':>9}{'max rank err':>14}{'median err':>12}{'cold ms':>9}{'warm us':>9}")
+    for combo in filters:
+        mask = np.ones(len(frame), dtype=bool)
+        for name, value in combo.items():
+            mask &= frame[name].to_numpy() == value
+        exact = np.sort(frame["package_lpa"].to_numpy()[mask])
+
+        start = time.perf_counter()
+        estimates = aggregates.distribution(**combo).quantile(QUANTILES)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(100):
+            aggregates.distribution(**combo).quantile(QUANTILES)
+        warm = (time.perf_counter() - start) / 100
+
+        # Ties make the rank of a value an interval; score the nearest end of it
+        below = np.searchsorted(exact, estimates, side="left") / len(exact)
+        upto = np.searchsorted(exact, estimates, side="right") / len(exact)
+        errors = np.where(QUANTILES < below, below - QUANTILES, np.maximum(QUANTILES - upto, 0))
+        median_err = abs(estimates[4] - np.median(exact))
+        worst = max(worst, errors.max())
+        label = ", ".join(f"{k}={v}" for k, v in combo.items()) or "all offers"
+        print(f"{label:<45}{len(exact):>9,}{errors.max():>14.4%}{median_err:>9.3f} LPA"
+              f"{cold * 1000:>9.2f}{warm * 1e6:>9.1f}")
+
+    print(f"worst rank error {worst:.4%} (limit {args.max_rank_error:.2%})")
+    sys.exit(0 if worst <= args.max_rank_error else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Cold-start report for the Streamlit app.
+
+Every measurement runs in a fresh interpreter so module caches from earlier
+pages don't hide import costs. For each page it records:
+
+- import:  importing Streamlit's headless test harness
+- first:   the first full script run (the Home page)
+- visit:   the first switch to the page in that process, which is where a
+           lazily imported page pays for its dependencies
+
+Usage:
+    python benchmarks/startup.py [--app app.py] [--repeat 5]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PAGES = [
+    "Home", "Admissions FAQ", "Fee Structure", "College Search",
+    "Student Counseling", "Parent Support", "Placement Statistics", "Virtual Campus Tour",
+]
+
+PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+at = AppTest.from_file({app!r}, default_timeout=60).run()
+t2 = time.perf_counter()
+if {page!r} != "Home":
+    at.sidebar.radio[0].set_value({page!r}).run()
+t3 = time.perf_counter()
+assert not at.exception, at.exception
+print(json.dumps({{"import": t1 - t0, "first": t2 - t1, "visit": t3 - t2}}))
+"""
+
+
+def probe(app, page):
+    code = PROBE.format(root=str(ROOT), app=str(app), page=page)
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", default=str(ROOT / "app.py"))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'page':<22}{'import ms':>11}{'first ms':>11}{'visit ms':>11}")
+    for page in PAGES:
+        runs = [probe(args.app, page) for _ in range(args.repeat)]
+        med = {key: statistics.median(run[key] for run in runs) * 1000 for key in runs[0]}
+        print(f"{page:<22}{med['import']:>11.0f}{med['first']:>11.0f}{med['visit']:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Bulk load time and query latency of the SQLite data store.
+
+For each catalog size, bulk-loads a fresh database (every program with its
+own fee structure) and times the two hot queries through the read pool:
+College Search's budget range, per stream and across all streams, and Fee
+Structure's components for one course. The in-memory `FeeIndex` is timed
+on the same ranges for comparison. With --threads, the budget query also
+runs from that many threads at once to show the pool's throughput.
+
+Usage:
+    python benchmarks/store.py [--sizes 10000 50000] [--threads 4]
+"""
+import argparse
+import tempfile
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import synthetic
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from admitbot.catalog import catalog_from_dict  # noqa: E402
+from admitbot.deadlines import DEADLINES_PATH  # noqa: E402
+from admitbot.fee_index import FeeIndex  # noqa: E402
+from admitbot.placements import PLACEMENTS_PATH  # noqa: E402
+from admitbot.store import Store, _read, bulk_load  # noqa: E402
+
+
+def _with_fee_structures(data):
+    """Give every program a fee structure, as a full deployment would."""
+    for courses in data["streams"].values():
+        for name, details in courses.items():
+            data["fee_structures"].setdefault(name, {
+                "Tuition Fee": details["annual_fee"],
+                "Development Fee": details["annual_fee"] // 10,
+                "Library Fee": 10000,
+                "Examination Fee": 8000,
+                "Hostel Fee (Optional)": 100000,
+            })
+    return data
+
+
+def _percentiles(timings):
+    return np.percentile(timings, [50, 99]) * 1000
+
+
+def _timed(calls):
+    timings = []
+    for call in calls:
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return _percentiles(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000])
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    placements, placements_version = _read(PLACEMENTS_PATH)
+    deadlines, deadlines_version = _read(DEADLINES_PATH)
+    rng = np.random.default_rng(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            data = _with_fee_structures(synthetic.catalog_data(size, args.seed))
+            path = Path(tmp) / f"store-{size}.db"
+            start = time.perf_counter()
+            rows = bulk_load(
+                path, data, placements, deadlines, f"synthetic-{size}", placements_version, deadlines_version,
+            )
+            load = time.perf_counter() - start
+            print(f"{size:,} programs: {rows:,} rows in {load * 1000:.0f} ms "
+                  f"({rows / load:,.0f} rows/s), {path.stat().st_size / 2 ** 20:.1f} MiB")
+
+            db = Store(path)
+            index = FeeIndex(catalog_from_dict(data, f"synthetic-{size}"))
+            streams = list(data["streams"])
+            courses = [name for courses in data["streams"].values() for name in courses]
+            # Budget windows of 50k-200k, as the College Search sliders produce
+            lows = rng.integers(50, 900, size=args.queries) * 1000
+            highs = lows + rng.integers(50, 200, size=args.queries) * 1000
+            picks = rng.integers(0, len(streams), size=args.queries)
+            named = [courses[i] for i in rng.integers(0, len(courses), size=args.queries)]
+
+            rows = [
+                ("budget, one stream", lambda lo, hi, s: db.programs_in_budget(lo, hi, s),
+                 lambda lo, hi, s: list(index.range(lo, hi, s))),
+                ("budget, all streams", lambda lo, hi, s: db.programs_in_budget(lo, hi),
+                 lambda lo, hi, s: list(index.range(lo, hi))),
+            ]
+            print(f"  {'query':<22}{'sqlite p50':>11}{'p99 ms':>9}{'memory p50':>12}{'p99 ms':>9}")
+            for name, query, in_memory in rows:
+                windows = [(int(lo), int(hi), streams[p]) for lo, hi, p in zip(lows, highs, picks)]
+                sql = _timed(lambda w=w: query(*w) for w in windows)
+                memory = _timed(lambda w=w: in_memory(*w) for w in windows)
+                print(f"  {name:<22}{sql[0]:>11.3f}{sql[1]:>9.3f}{memory[0]:>12.3f}{memory[1]:>9.3f}")
+            p50, p99 = _timed(lambda c=c: db.fee_components(c) for c in named)
+            print(f"  {'fee components':<22}{p50:>11.3f}{p99:>9.3f}")
+
+            if args.threads > 1:
+                def work(offset):
+                    for i in range(offset, args.queries, args.threads):
+                        db.programs_in_budget(int(lows[i]), int(highs[i]), streams[picks[i]])
+
+                for threads in (1, args.threads):
+                    start = time.perf_counter()
+                    with ThreadPoolExecutor(threads) as pool:
+                        list(pool.map(work, range(args.threads)))
+                    elapsed = time.perf_counter() - start
+                    print(f"  {threads} thread(s): {args.queries / elapsed:,.0f} budget queries/s")
+            db.close()
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Deterministic synthetic data for benchmarks and accuracy checks."""
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from admitbot.catalog import CATALOG_PATH, catalog_from_dict  # noqa: E402
+from admitbot.deadlines import DEADLINES_PATH, calendar_from_dict  # noqa: E402
+from admitbot.faq import FAQ_PATH, faq_from_dict  # noqa: E402
+from admitbot.recommend import EXAMS, INTERESTS, STRENGTHS, STUDENT_STREAMS  # noqa: E402
+
+# city -> (latitude, longitude)
+CITIES = {
+    "Chennai": (13.08, 80.27), "Coimbatore": (11.02, 76.96), "Madurai": (9.93, 78.12), "Bengaluru": (12.97, 77.59),
+    "Mysuru": (12.30, 76.64), "Hyderabad": (17.39, 78.49), "Visakhapatnam": (17.69, 83.22), "Kochi": (9.93, 76.27),
+    "Thiruvananthapuram": (8.52, 76.94), "Mumbai": (19.08, 72.88), "Pune": (18.52, 73.86), "Nagpur": (21.15, 79.09),
+    "Ahmedabad": (23.02, 72.57), "Jaipur": (26.91, 75.79), "Delhi": (28.61, 77.21), "Lucknow": (26.85, 80.95),
+    "Kolkata": (22.57, 88.36), "Bhubaneswar": (20.30, 85.82), "Patna": (25.59, 85.14), "Bhopal": (23.26, 77.41),
+    "Chandigarh": (30.73, 76.78), "Guwahati": (26.14, 91.74), "Indore": (22.72, 75.86), "Vijayawada": (16.51, 80.65),
+}
+BRANCHES = ["CSE", "CSE (AI/ML)", "ECE", "EEE", "Mechanical", "BBA", "B.Com"]
+# company -> (typical package in LPA, spread)
+COMPANIES = {
+    "Microsoft": (25, 0.25), "Google": (22, 0.25), "Amazon": (20, 0.25),
+    "Goldman Sachs": (18, 0.2), "IBM": (15, 0.2), "Zoho": (9, 0.2),
+    "Accenture": (7, 0.15), "TCS": (7, 0.15), "Infosys": (6.5, 0.15), "Wipro": (6.5, 0.15),
+}
+
+
+def offers(rows, years=(2023,), seed=0):
+    """`rows` offers spread over `years`, with a long right tail of packages."""
+    rng = np.random.default_rng(seed)
+    names = list(COMPANIES)
+    weights = np.linspace(1, 6, len(names))
+    company = rng.choice(len(names), size=rows, p=weights / weights.sum())
+    centre = np.array([COMPANIES[name][0] for name in names])[company]
+    spread = np.array([COMPANIES[name][1] for name in names])[company]
+    package = np.round(np.clip(rng.lognormal(np.log(centre), spread), 6, 45), 2)
+    return pd.DataFrame({
+        "year": rng.choice(np.asarray(years), size=rows),
+        "branch": np.asarray(BRANCHES)[rng.integers(0, len(BRANCHES), size=rows)],
+        "company": np.asarray(names)[company],
+        "package_lpa": package,
+    })
+
+
+def catalog(programs, seed=0):
+    """The shipped catalog padded out to `programs` randomized programs."""
+    return catalog_from_dict(catalog_data(programs, seed), f"synthetic-{programs}-{seed}")
+
+
+def catalog_data(programs, seed=0):
+    """catalog.json contents for `catalog`."""
+    rng = np.random.default_rng(seed)
+    with open(CATALOG_PATH) as fh:
+        data = json.load(fh)
+    streams = data["streams"]
+    names = list(streams)
+    for n in range(programs - sum(len(courses) for courses in streams.values())):
+        stream = names[n % len(names)]
+        streams[stream][f"{stream} Program {n:05d}"] = {
+            "annual_fee": int(rng.integers(50, 1000)) * 1000,
+            "duration": f"{int(rng.integers(3, 6))} years",
+            "eligibility": "Synthetic",
+            "specializations": [],
+            "job_roles": [],
+            "avg_package": f"{rng.uniform(3, 15):.1f} LPA",
+            "description": "Synthetic benchmark program",
+            "student_streams": list(rng.choice(STUDENT_STREAMS, size=int(rng.integers(1, 4)), replace=False)),
+            "min_percentage": int(rng.integers(50, 90)),
+            "interests": list(rng.choice(INTERESTS, size=int(rng.integers(1, 4)), replace=False)),
+            "strengths": list(rng.choice(STRENGTHS, size=int(rng.integers(1, 4)), replace=False)),
+            "exams": list(rng.choice(EXAMS, size=int(rng.integers(1, 3)), replace=False)),
+        }
+    return data
+
+
+def profiles(count, seed=0):
+    """`count` random Student Counseling profiles as dicts."""
+    rng = np.random.default_rng(seed)
+    exams = ("None",) + EXAMS
+    return [
+        {
+            "stream": str(rng.choice(STUDENT_STREAMS)),
+            "percentage": round(float(rng.uniform(45, 99)), 1),
+            "interests": tuple(rng.choice(INTERESTS, size=int(rng.integers(0, 4)), replace=False)),
+            "strengths": tuple(rng.choice(STRENGTHS, size=int(rng.integers(0, 4)), replace=False)),
+            "exam": str(rng.choice(exams)),
+            "exam_score": round(float(rng.uniform(0, 100)), 1),
+        }
+        for _ in range(count)
+    ]
+
+
+def faq(snippets, seed=0):
+    """The shipped FAQ padded out to `snippets` snippets of 20-80 words.
+
+    Words are drawn Zipf-style from the shipped FAQ's own vocabulary plus
+    filler, so common admissions terms get long posting lists as they would
+    in a real knowledge base.
+    """
+    rng = np.random.default_rng(seed)
+    with open(FAQ_PATH) as fh:
+        data = json.load(fh)
+    words = sorted({word for entries in data.values() for title, body in entries.items()
+                    for word in f"{title} {body}".lower().split() if word.isalpha()})
+    words += [f"term{n}" for n in range(5000)]
+    weights = 1 / np.arange(1, len(words) + 1)
+    weights = weights[rng.permutation(len(words))]
+    weights /= weights.sum()
+    topics = list(data)
+    for n in range(snippets - sum(len(entries) for entries in data.values())):
+        body = " ".join(rng.choice(words, size=int(rng.integers(20, 81)), p=weights))
+        data[topics[n % len(topics)]][f"Synthetic answer {n:05d}"] = body
+    return faq_from_dict(data, f"synthetic-{snippets}-{seed}")
+
+
+def calendar(programs, rounds=3, seed=0):
+    """The shipped calendar plus `rounds` program-specific rounds for each of `programs` programs.
+
+    Each round has an application window of 2-8 weeks, an entrance exam and
+    a counseling window, spread over one admissions year.
+    """
+    rng = np.random.default_rng(seed)
+    with open(DEADLINES_PATH) as fh:
+        data = json.load(fh)
+    first = np.datetime64("2024-01-01")
+    for program in range(programs):
+        for n in range(rounds):
+            opens = first + int(rng.integers(0, 300))
+            closes = opens + int(rng.integers(14, 57))
+            exam = closes + int(rng.integers(7, 22))
+            counseling = exam + int(rng.integers(14, 29))
+            data.append({
+                "round": f"Round {n + 1}",
+                "programs": [f"Program {program:05d}"],
+                "events": {
+                    "Application": [str(opens), str(closes)],
+                    "Entrance Exam": [str(exam)],
+                    "Counseling": [str(counseling), str(counseling + int(rng.integers(3, 11)))],
+                },
+            })
+    return calendar_from_dict(data, f"synthetic-{programs}-{rounds}-{seed}")
+
+
+def institutions(count, seed=0):
+    """`count` institutions with 1-8 programs each, in the ADMITBOT_INSTITUTIONS CSV layout.
+
+    Most institutions cluster within ~20 km of a city, as colleges do; the
+    rest are spread over the whole country.
+    """
+    rng = np.random.default_rng(seed)
+    with open(CATALOG_PATH) as fh:
+        streams = {stream: list(courses) for stream, courses in json.load(fh)["streams"].items()}
+    names = list(CITIES)
+    city = rng.integers(0, len(names), size=count)
+    centre = np.array([CITIES[names[i]] for i in city])
+    spread = np.where(rng.random(count) < 0.8, 0.2, 4.0)[:, None]
+    coords = np.round(centre + rng.normal(0, 1, size=(count, 2)) * spread, 5)
+    rows = []
+    for n in range(count):
+        for _ in range(int(rng.integers(1, 9))):
+            stream = list(streams)[int(rng.integers(0, len(streams)))]
+            rows.append((
+                f"Institute {n:05d}", names[city[n]], coords[n, 0], coords[n, 1], stream,
+                streams[stream][int(rng.integers(0, len(streams[stream])))], int(rng.integers(50, 1500)) * 1000,
+            ))
+    return pd.DataFrame(rows, columns=["institution", "city", "latitude", "longitude", "stream", "program", "annual_fee"])
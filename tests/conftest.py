@@ -0,0 +1,37 @@
+"""Shared fixtures: the shipped catalog padded out with seeded random programs."""
+import json
+
+import numpy as np
+import pytest
+
+from admitbot.catalog import CATALOG_PATH, catalog_from_dict
+from admitbot.recommend import EXAMS, INTERESTS, STRENGTHS, STUDENT_STREAMS
+
+PROGRAMS = 300
+
+
+@pytest.fixture
+def catalog_data():
+    rng = np.random.default_rng(0)
+    with open(CATALOG_PATH) as fh:
+        data = json.load(fh)
+    names = list(data["streams"])
+    for n in range(PROGRAMS):
+        stream = names[n % len(names)]
+        data["streams"][stream][f"{stream} Program {n:03d}"] = {
+            # Coarse fees so budget bounds land on ties
+            "annual_fee": int(rng.integers(5, 100)) * 10_000,
+            "duration": "4 years",
+            "avg_package": f"{rng.uniform(3, 15):.1f} LPA",
+            "student_streams": list(rng.choice(STUDENT_STREAMS, size=int(rng.integers(1, 4)), replace=False)),
+            "min_percentage": int(rng.integers(50, 90)),
+            "interests": list(rng.choice(INTERESTS, size=int(rng.integers(1, 4)), replace=False)),
+            "strengths": list(rng.choice(STRENGTHS, size=int(rng.integers(1, 4)), replace=False)),
+            "exams": list(rng.choice(EXAMS, size=int(rng.integers(1, 3)), replace=False)),
+        }
+    return data
+
+
+@pytest.fixture
+def catalog(catalog_data):
+    return catalog_from_dict(catalog_data, "test")
@@ -0,0 +1,91 @@
+"""Chat answers and the shared answer cache (admitbot.chat)."""
+from datetime import date
+
+import pytest
+
+from admitbot.catalog import load_catalog
+from admitbot.chat import AnswerCache, answer, normalize, stream
+from admitbot.deadlines import CalendarIndex, load_calendar
+from admitbot.faq import FaqIndex, load_faq
+from admitbot.intent import IntentModel
+from admitbot.placements import load_placements
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Compute:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return f"reply {self.calls}"
+
+
+def test_normalize_ignores_case_punctuation_and_spacing():
+    assert normalize("What is the FEE for B.Tech  CSE?") == normalize("what is the fee for b tech cse")
+
+
+def test_stream_yields_sentences_and_lines():
+    text = "**Fees** for B.Tech CSE: ₹4.50 lakh a year. Hostel is extra!\n\n- One-time\n- Monthly\n\nSee **Fee Structure**."
+    assert list(stream(text)) == [
+        "**Fees** for B.Tech CSE: ₹4.50 lakh a year. ", "Hostel is extra!\n\n", "- One-time\n", "- Monthly\n\n",
+        "See **Fee Structure**.",
+    ]
+
+
+def test_cache_hits_until_the_ttl_expires():
+    clock, compute = _Clock(), _Compute()
+    cache = AnswerCache(size=4, ttl=10, clock=clock)
+    assert cache.get("fee", "v1", compute) == "reply 1"
+    clock.now = 9.9
+    assert cache.get("fee", "v1", compute) == "reply 1"
+    clock.now = 10.0
+    assert cache.get("fee", "v1", compute) == "reply 2"
+
+
+def test_cache_evicts_the_least_recently_used():
+    compute = _Compute()
+    cache = AnswerCache(size=2, ttl=60, clock=_Clock())
+    cache.get("a", "v1", compute)
+    cache.get("b", "v1", compute)
+    cache.get("a", "v1", compute)   # a is now the most recent
+    cache.get("c", "v1", compute)
+    assert len(cache) == 2
+    assert cache.get("a", "v1", compute) == "reply 1"
+    assert cache.get("b", "v1", compute) == "reply 4"
+
+
+def test_new_version_empties_the_cache():
+    compute = _Compute()
+    cache = AnswerCache(size=4, ttl=60, clock=_Clock())
+    cache.get("fee", "v1", compute)
+    cache.get("deadline", "v1", compute)
+    assert cache.get("fee", "v2", compute) == "reply 3"
+    assert len(cache) == 1
+
+
+@pytest.fixture(scope="module")
+def data():
+    faq = load_faq()
+    return dict(
+        model=IntentModel.load(), catalog=load_catalog(), faq=faq, faq_index=FaqIndex(faq),
+        placements=load_placements(), calendar=CalendarIndex(load_calendar()), today=date(2024, 3, 10),
+    )
+
+
+@pytest.mark.parametrize("question, intent, page", [
+    ("how much is the fee for cse", "fees", "Fee Structure"),
+    ("last date to apply", "deadlines", "Admissions FAQ"),
+    ("average salary package after placements", "placements", "Placement Statistics"),
+])
+def test_answers_route_to_their_page(data, question, intent, page):
+    reply = answer(question, **data)
+    assert reply.intent == intent
+    assert f"**{page}**" in reply.text
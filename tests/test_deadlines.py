@@ -0,0 +1,66 @@
+"""Calendar queries (admitbot.deadlines) against a scan over every event."""
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from admitbot.deadlines import WEEK, CalendarIndex, calendar_from_dict, load_calendar
+
+
+def _key(event):
+    return event.end, event.start, event.round, event.name, event.streams, event.programs
+
+
+@pytest.fixture
+def calendar(catalog):
+    rng = np.random.default_rng(2)
+    programs = [(stream, course) for stream, courses in catalog.streams.items() for course in courses]
+    rounds = []
+    for n in range(60):
+        start = date(2024, 1, 1) + timedelta(days=int(rng.integers(0, 300)))
+        entry = {"round": f"Round {n}", "events": {
+            "Application": [start.isoformat(), (start + timedelta(days=int(rng.integers(5, 60)))).isoformat()],
+            "Entrance Exam": [(start + timedelta(days=int(rng.integers(60, 90)))).isoformat()],
+        }}
+        if n % 3 == 1:
+            entry["streams"] = [programs[int(rng.integers(len(programs)))][0]]
+        elif n % 3 == 2:
+            entry["programs"] = [programs[int(i)][1] for i in rng.integers(len(programs), size=3)]
+        rounds.append(entry)
+    return calendar_from_dict(rounds, "test")
+
+
+def _days():
+    return [date(2023, 12, 1) + timedelta(days=n) for n in range(0, 450, 3)]
+
+
+def test_open_and_closing_match_a_scan(calendar):
+    index = CalendarIndex(calendar)
+    events = calendar.events
+    for day in _days():
+        assert list(index.open_on(day)) == sorted((e for e in events if e.start <= day <= e.end), key=_key)
+        until = day + timedelta(days=WEEK)
+        assert list(index.closing(day)) == sorted((e for e in events if day <= e.end < until), key=_key)
+
+
+def test_next_deadline_matches_a_scan(calendar, catalog):
+    index = CalendarIndex(calendar)
+    programs = [(stream, course) for stream, courses in catalog.streams.items() for course in courses][::7]
+    for day in _days():
+        left = [event for event in calendar.events if event.end >= day]
+        assert index.next_deadline(day) == min(left, key=_key, default=None)
+        for stream, course in programs:
+            applies = [event for event in left if event.applies_to(stream, course)]
+            assert index.next_deadline(day, stream, course) == min(applies, key=_key, default=None)
+
+
+def test_shipped_calendar():
+    index = CalendarIndex(load_calendar())
+    assert [event.name for event in index.open_on(date(2024, 3, 10))] == ["Application"]
+    assert index.next_deadline(date(2024, 7, 16), "Medical", "MBBS").round == "NEET Counseling"
+    assert index.next_deadline(date(2024, 7, 16), "Engineering", "Computer Science and Engineering") is None
+
+
+def test_event_ending_before_it_starts_is_rejected():
+    with pytest.raises(ValueError):
+        calendar_from_dict([{"round": "Bad", "events": {"Application": ["2024-05-01", "2024-04-01"]}}], "test")
@@ -0,0 +1,69 @@
+"""BM25 search over the Admissions FAQ (admitbot.faq)."""
+from math import log
+
+import pytest
+
+from admitbot.faq import B, K1, TITLE_WEIGHT, FaqIndex, faq_from_dict, load_faq, tokenize
+
+FAQ = {
+    "Documents": {
+        "Required documents": "Bring your 10th and 12th mark sheets, transfer certificate and ID proof.",
+        "Photographs": "Four passport size photographs with a white background.",
+    },
+    "Eligibility": {
+        "Engineering eligibility": "PCM in 12th with at least 60% and a valid JEE score.",
+        "Medical eligibility": "PCB in 12th with a NEET qualification.",
+    },
+    "Process": {
+        "Application steps": "Register online, fill the application form, upload documents and pay the fee.",
+    },
+}
+
+
+def _bm25(faq, query):
+    """Snippet -> BM25 score of every query term, scoring documents one at a time."""
+    docs = []
+    for topic, title, body in faq.snippets():
+        terms = tokenize(f"{topic} {body}") + tokenize(title) * TITLE_WEIGHT
+        docs.append(((topic, title), terms))
+    average = sum(len(terms) for _, terms in docs) / len(docs)
+    scores = {}
+    for key, terms in docs:
+        score = 0.0
+        for term in set(tokenize(query)):
+            df = sum(term in other for _, other in docs)
+            tf = terms.count(term)
+            if tf:
+                idf = log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+                score += idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * len(terms) / average))
+        if score:
+            scores[key] = score
+    return scores
+
+
+@pytest.mark.parametrize("query", ["documents needed", "JEE eligibility", "application fee", "passport photographs"])
+def test_scores_match_bm25(query):
+    faq = faq_from_dict(FAQ, "test")
+    expected = _bm25(faq, query)
+    hits = FaqIndex(faq).search(query, k=len(expected))
+    assert {(hit.topic, hit.title): pytest.approx(hit.score) for hit in hits} == expected
+    assert [hit.score for hit in hits] == sorted((hit.score for hit in hits), reverse=True)
+
+
+def test_last_word_matches_as_a_prefix():
+    hits = FaqIndex(faq_from_dict(FAQ, "test")).search("medical elig")
+    assert (hits[0].topic, hits[0].title) == ("Eligibility", "Medical eligibility")
+
+
+def test_topic_filter_and_empty_queries():
+    index = FaqIndex(faq_from_dict(FAQ, "test"))
+    assert {hit.topic for hit in index.search("documents", k=5, topic="Process")} == {"Process"}
+    assert index.search("what is the") == []
+    assert index.search("zzz") == []
+
+
+def test_shipped_faq_is_searchable():
+    index = FaqIndex(load_faq())
+    assert len(index) > 0
+    assert index.search("transfer certificate")[0].title == "Academic Documents"
+    assert index.search("jee")[0].topic == "Eligibility"
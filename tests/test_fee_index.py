@@ -0,0 +1,27 @@
+"""Budget range queries (admitbot.fee_index) against the linear scan they replaced."""
+import pytest
+
+from admitbot.fee_index import ALL_STREAMS, FeeIndex
+
+
+def _scan(catalog, low, high, stream):
+    streams = catalog.streams if stream is ALL_STREAMS else {stream: catalog.courses(stream)}
+    return sorted(
+        (details["annual_fee"], stream, course)
+        for stream, courses in streams.items()
+        for course, details in courses.items()
+        if low <= details["annual_fee"] <= high
+    )
+
+
+@pytest.mark.parametrize("low, high", [(0, 10**7), (100_000, 500_000), (250_000, 250_000), (900_000, 100_000)])
+def test_range_matches_a_scan(catalog, low, high):
+    index = FeeIndex(catalog)
+    assert len(index) == sum(len(courses) for courses in catalog.streams.values())
+    for stream in [ALL_STREAMS, *catalog.streams]:
+        expected = _scan(catalog, low, high, stream)
+        assert list(index.range(low, high, stream)) == [(stream, course) for _, stream, course in expected]
+
+
+def test_unknown_stream_is_empty(catalog):
+    assert FeeIndex(catalog).range(0, 10**7, "Law") == ()
@@ -0,0 +1,35 @@
+"""The net fee matrix (admitbot.fees) against the fee rules applied one selection at a time."""
+from itertools import combinations
+
+from admitbot.fees import WAIVED_COMPONENT, FeeMatrix
+
+
+def _net(catalog, course, plan, schemes, hostel):
+    waiver = min(sum(catalog.scholarships[scheme]["waiver"] for scheme in schemes), 1.0)
+    total = 0.0
+    for component, amount in catalog.fees_for(course).items():
+        if "Optional" in component:
+            total += amount if hostel else 0
+        elif component == WAIVED_COMPONENT:
+            total += amount * (1 - waiver)
+        else:
+            total += amount
+    return round(total * (1 + catalog.payment_plans[plan]["adjustment"]))
+
+
+def test_every_selection_matches_the_rules(catalog):
+    matrix = FeeMatrix(catalog)
+    schemes = tuple(catalog.scholarships)
+    selections = [combo for size in range(len(schemes) + 1) for combo in combinations(schemes, size)]
+    for course in matrix.courses:
+        for plan in catalog.payment_plans:
+            for selected in selections:
+                for hostel in (False, True):
+                    assert matrix.lookup(course, plan, selected, hostel) == _net(catalog, course, plan, selected, hostel)
+
+
+def test_csv_has_a_row_per_cell(catalog):
+    matrix = FeeMatrix(catalog)
+    lines = matrix.to_csv().splitlines()
+    assert lines[0] == "course,payment_plan,scholarships,hostel,net_annual_fee"
+    assert len(lines) - 1 == matrix.net.size
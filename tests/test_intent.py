@@ -0,0 +1,17 @@
+"""The shipped chat intent model (admitbot.intent) on the held-out questions."""
+from admitbot.intent import TEST_PATH, IntentModel, accuracy, read_examples
+
+MIN_ACCURACY = 0.9   # as benchmarks/intent.py --min-accuracy
+
+
+def test_shipped_model_accuracy_on_held_out_questions():
+    model = IntentModel.load()
+    labels, questions = read_examples(TEST_PATH)
+    assert set(labels) <= set(model.intents)
+    assert accuracy(model, labels, questions) >= MIN_ACCURACY
+
+
+def test_classify_agrees_with_predict():
+    model = IntentModel.load()
+    _, questions = read_examples(TEST_PATH)
+    assert [model.classify(question).name for question in questions] == list(model.predict(questions))
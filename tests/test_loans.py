@@ -0,0 +1,59 @@
+"""Loan quotes and schedules (admitbot.loans) against the textbook amortization formula."""
+import pytest
+
+from admitbot.catalog import catalog_from_dict
+from admitbot.fees import FeeMatrix
+from admitbot.loans import LoanBook
+
+PRINCIPAL = 450_000
+
+
+def _emi(principal, rate, years):
+    r, n = rate / 1200, years * 12
+    return principal / n if r == 0 else principal * r * (1 + r) ** n / ((1 + r) ** n - 1)
+
+
+@pytest.fixture
+def book(catalog_data):
+    catalog_data["loan_banks"]["Interest-free Trust"] = 0.0
+    catalog = catalog_from_dict(catalog_data, "test")
+    return LoanBook(catalog, FeeMatrix(catalog))
+
+
+def test_quotes_match_the_formula(book):
+    for tenure in book.tenures:
+        quotes = book.quotes(PRINCIPAL, tenure)
+        assert [quote.emi for quote in quotes] == sorted(quote.emi for quote in quotes)
+        for quote in quotes:
+            assert quote.emi == pytest.approx(_emi(PRINCIPAL, quote.rate, tenure))
+            assert quote.total_repayment == pytest.approx(quote.emi * tenure * 12)
+            assert quote.total_interest == pytest.approx(quote.total_repayment - PRINCIPAL)
+
+
+def test_schedule_repays_the_principal(book):
+    for bank, rate in zip(book.banks, book.rates):
+        for tenure in book.tenures:
+            rows = book.schedule(PRINCIPAL, bank, tenure)
+            assert [row[0] for row in rows] == list(range(1, tenure + 1))
+            assert sum(row[3] for row in rows) == pytest.approx(PRINCIPAL)
+            assert rows[-1][4] == pytest.approx(0, abs=1e-6)
+            interest = sum(row[2] for row in rows)
+            assert interest == pytest.approx(_emi(PRINCIPAL, rate, tenure) * tenure * 12 - PRINCIPAL)
+
+
+def test_annual_emi_finances_one_year_of_the_selection(book):
+    course, plan = book.fee_matrix.courses[0], "Semester-wise"
+    fee = book.fee_matrix.lookup(course, plan)
+    emi = book.annual_emi(course, plan)
+    assert emi.shape == (len(book.banks), len(book.tenures))
+    for b, rate in enumerate(book.rates):
+        for t, tenure in enumerate(book.tenures):
+            assert emi[b, t] == pytest.approx(_emi(fee, rate, tenure))
+
+
+def test_no_partner_banks(catalog_data):
+    catalog_data["loan_banks"] = {}
+    catalog = catalog_from_dict(catalog_data, "test")
+    book = LoanBook(catalog, FeeMatrix(catalog))
+    assert book.quotes(PRINCIPAL, 7) == []
+    assert book.annual_emi(book.fee_matrix.courses[0], "Semester-wise").shape == (0, len(book.tenures))
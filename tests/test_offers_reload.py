@@ -0,0 +1,90 @@
+"""Hot reload of the placement offer files (admitbot.reload with admitbot.offers)."""
+import os
+
+from admitbot.offers import load_offers, signature
+from admitbot.reload import DataSources, Source
+
+HEADER = "year,branch,company,package_lpa\n"
+
+
+class _Cache:
+    """Stands in for a cached function; counts how often the reload clears it."""
+
+    __name__ = "cache"
+
+    def __init__(self):
+        self.cleared = 0
+
+    def clear(self):
+        self.cleared += 1
+
+
+def _sources(directory, cache):
+    source = Source(
+        directory, lambda previous: load_offers(directory, previous),
+        dependents=((cache, None),), signature=lambda: signature(directory),
+    )
+    return DataSources({"offers": source}, interval=0)
+
+
+def test_new_and_appended_offer_files_reach_the_counts(tmp_path):
+    (tmp_path / "offers_2023.csv").write_text(HEADER + "2023,CSE,Acme,10\n2023,CSE,Acme,12\n")
+    cache = _Cache()
+    sources = _sources(tmp_path, cache)
+    before = sources["offers"]
+    assert {company: cell.count for company, cell in before.rollup("company", year=2023).items()} == {"Acme": 2}
+
+    (tmp_path / "offers_2024.csv").write_text(HEADER + "2024,ECE,Beta,8\n2024,ECE,Acme,9\n")
+    with open(tmp_path / "offers_2023.csv", "a") as fh:
+        fh.write("2023,ECE,Beta,7\n")
+    assert sources.check() == ["offers"]
+
+    after = sources["offers"]
+    assert after.years() == [2023, 2024]
+    assert {company: cell.count for company, cell in after.rollup("company", year=2023).items()} == {
+        "Acme": 2, "Beta": 1,
+    }
+    assert after.distribution(year=2024).count == 2
+    assert after.version != before.version
+    assert cache.cleared == 1
+    # Sessions still holding the previous aggregates see them unchanged
+    assert before.rows == 2
+
+    assert sources.check() == []
+    assert cache.cleared == 1
+
+
+def test_offer_file_edited_in_place_is_rebuilt(tmp_path):
+    path = tmp_path / "offers_2023.csv"
+    path.write_text(HEADER + "2023,CSE,Acme,10\n2023,CSE,Acme,12\n")
+    sources = _sources(tmp_path, _Cache())
+
+    path.write_text(HEADER + "2023,CSE,Acme,99\n2023,CSE,Acme,12\n")   # same size
+    assert sources.check() == ["offers"]
+    assert sources["offers"].rows == 2
+    assert sources["offers"].distribution(year=2023).high == 99
+
+
+def test_touched_offer_file_reads_nothing_new(tmp_path):
+    path = tmp_path / "offers_2023.csv"
+    path.write_text(HEADER + "2023,CSE,Acme,10\n")
+    cache = _Cache()
+    sources = _sources(tmp_path, cache)
+    before = sources["offers"]
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert before.status(path) == "unchanged"
+    assert sources.check() == []
+    assert sources["offers"] is before
+    assert cache.cleared == 0
+
+
+def test_header_only_offer_file_adds_no_rows(tmp_path):
+    (tmp_path / "offers_2023.csv").write_text(HEADER + "2023,CSE,Acme,10\n")
+    sources = _sources(tmp_path, _Cache())
+
+    (tmp_path / "offers_2024.csv").write_text(HEADER)
+    sources.check()
+    assert sources["offers"].rows == 1
+    assert sources["offers"].years() == [2023]
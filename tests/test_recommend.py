@@ -0,0 +1,73 @@
+"""Vectorized recommendation scores (admitbot.recommend) against the scoring rule applied per program."""
+import numpy as np
+import pytest
+
+from admitbot.recommend import (
+    EXAM_WEIGHT, EXAMS, INTEREST_WEIGHT, INTERESTS, MARGIN_CAP, MARGIN_WEIGHT, STRENGTH_WEIGHT, STRENGTHS,
+    STUDENT_STREAMS, Profile, Recommender,
+)
+
+
+def _score(details, profile):
+    if profile.stream not in details.get("student_streams", STUDENT_STREAMS):
+        return -np.inf
+    margin = profile.percentage - details.get("min_percentage", 0)
+    if margin < 0:
+        return -np.inf
+    score = 0.0
+    if profile.interests:
+        score += INTEREST_WEIGHT * len(set(profile.interests) & set(details["interests"])) / len(profile.interests)
+    if profile.strengths:
+        score += STRENGTH_WEIGHT * len(set(profile.strengths) & set(details["strengths"])) / len(profile.strengths)
+    if profile.exam in details["exams"]:
+        score += EXAM_WEIGHT * profile.exam_score / 100
+    return score + MARGIN_WEIGHT * min(margin / MARGIN_CAP, 1)
+
+
+def _profiles(count):
+    rng = np.random.default_rng(1)
+    return [
+        Profile(
+            stream=str(rng.choice(STUDENT_STREAMS)),
+            percentage=round(float(rng.uniform(45, 99)), 1),
+            interests=tuple(rng.choice(INTERESTS, size=int(rng.integers(0, 4)), replace=False)),
+            strengths=tuple(rng.choice(STRENGTHS, size=int(rng.integers(0, 4)), replace=False)),
+            exam=str(rng.choice(("None",) + EXAMS)),
+            exam_score=round(float(rng.uniform(0, 100)), 1),
+        )
+        for _ in range(count)
+    ]
+
+
+def test_scores_match_the_rule(catalog):
+    recommender = Recommender(catalog)
+    profiles = _profiles(50)
+    scores = recommender.scores(profiles)
+    for row, profile in enumerate(profiles):
+        expected = [_score(catalog.streams[stream][course], profile) for stream, course in recommender.keys]
+        assert scores[row] == pytest.approx(np.array(expected), rel=1e-5, abs=1e-6)
+
+
+def test_top_k_is_the_best_k_eligible(catalog):
+    recommender = Recommender(catalog)
+    profiles = _profiles(50)
+    scores = recommender.scores(profiles)
+    for profile, row, (indices, values) in zip(profiles, scores, recommender.top_k(profiles, k=5)):
+        best = np.sort(row[np.isfinite(row)])[::-1][:5]
+        assert values == pytest.approx(best)
+        assert np.all(row[indices] == values)
+
+
+def test_recommend_explains_its_matches(catalog):
+    profile = Profile("Science", 92, interests=("Technology",), strengths=("Programming",), exam="JEE", exam_score=95)
+    results = Recommender(catalog).recommend(profile, k=3)
+    assert len(results) == 3
+    assert [r.score for r in results] == sorted((r.score for r in results), reverse=True)
+    for result in results:
+        details = catalog.streams[result.stream][result.course]
+        assert set(result.interests) == set(profile.interests) & set(details["interests"])
+        assert set(result.strengths) == set(profile.strengths) & set(details["strengths"])
+
+
+def test_no_eligible_program_recommends_nothing(catalog):
+    assert Recommender(catalog).recommend(Profile("Arts", 10)) == []
@@ -0,0 +1,47 @@
+"""Change detection and retries in admitbot.reload."""
+from types import SimpleNamespace
+
+from admitbot.reload import DataSources, Source
+
+
+class _Flaky:
+    """A source whose next loads fail `failures` times before returning `version`."""
+
+    def __init__(self):
+        self.version = "v1"
+        self.failures = 0
+        self.signature = 1
+
+    def load(self, previous):
+        if self.failures:
+            self.failures -= 1
+            raise ValueError("half-written")
+        return SimpleNamespace(version=self.version)
+
+
+def _sources(flaky):
+    return DataSources({"data": Source("data.json", flaky.load, signature=lambda: flaky.signature)}, interval=0)
+
+
+def test_failed_reload_is_retried_without_another_change():
+    flaky = _Flaky()
+    sources = _sources(flaky)
+    flaky.version, flaky.failures, flaky.signature = "v2", 2, 2
+    assert sources.check() == []
+    assert sources["data"].version == "v1"
+    assert sources.check() == []
+    assert sources.check() == ["data"]
+    assert sources["data"].version == "v2"
+    assert sources.check() == []
+
+
+def test_unchanged_version_is_not_reported():
+    flaky = _Flaky()
+    sources = _sources(flaky)
+    flaky.signature = 2
+    assert sources.reload("data") == "unchanged"
+    assert sources.check() == []
+    flaky.version = "v2"
+    assert sources.check() == []   # same signature as the last successful load
+    flaky.signature = 3
+    assert sources.check() == ["data"]
@@ -0,0 +1,29 @@
+"""Salary model calibration and the Monte Carlo ROI (admitbot.simulate)."""
+import numpy as np
+import pytest
+
+from admitbot.offers import OfferAggregates
+from admitbot.placements import load_placements, placements_from_dict
+from admitbot.simulate import DEFAULT_SPREAD, MAX_HORIZON, PERCENTILES, SalaryModel, simulate
+
+EMPTY = {"years": [], "avg_salary": [], "placement_rate": [], "companies": []}
+
+
+def test_model_from_the_shipped_placements():
+    placements = load_placements()
+    model = SalaryModel.from_data("8.5 LPA", placements, OfferAggregates())
+    first, last = placements.avg_salary[0], placements.avg_salary[-1]
+    assert model.start_median == 850_000
+    assert model.start_spread == DEFAULT_SPREAD
+    assert (1 + model.growth_mean) ** (len(placements.years) - 1) * first == pytest.approx(last)
+    assert model.placement_rate == placements.placement_rate[-1] / 100
+
+
+def test_empty_placements_fall_back_to_the_average_package():
+    model = SalaryModel.from_data("6 LPA", placements_from_dict(EMPTY, "empty"), OfferAggregates())
+    assert model.start_median == 600_000
+    assert model.growth_mean == 0
+    assert model.placement_rate == 1
+    result = simulate(model, course_cost=1_200_000, paths=2000)
+    assert result.roi.shape == (MAX_HORIZON, len(PERCENTILES))
+    assert np.all(np.isfinite(result.roi))
@@ -0,0 +1,38 @@
+"""Rank error of the t-digest (admitbot.sketch) against exact quantiles."""
+import numpy as np
+import pytest
+
+from admitbot.sketch import TDigest
+
+QUANTILES = np.array([0.1, 0.5, 0.9, 0.99])
+
+
+def _rank_error(exact, estimates):
+    # Ties make the rank of a value an interval; score the nearest end of it
+    below = np.searchsorted(exact, estimates, side="left") / len(exact)
+    upto = np.searchsorted(exact, estimates, side="right") / len(exact)
+    return np.where(QUANTILES < below, below - QUANTILES, np.maximum(QUANTILES - upto, 0))
+
+
+@pytest.fixture
+def packages():
+    rng = np.random.default_rng(7)
+    return np.sort(np.round(np.clip(rng.lognormal(np.log(8), 0.5, size=200_000), 3, 60), 2))
+
+
+def test_digest_quantiles_within_one_percent_rank(packages):
+    estimates = TDigest.from_sorted(packages).quantile(QUANTILES)
+    assert _rank_error(packages, estimates).max() <= 0.01
+    assert np.allclose(estimates, np.quantile(packages, QUANTILES), rtol=0.05)
+
+
+def test_merged_digest_quantiles_within_one_percent_rank(packages):
+    # Per-cell digests rolled up, as OfferAggregates.distribution does
+    shuffled = np.random.default_rng(8).permutation(packages)
+    merged = TDigest()
+    for cell in np.array_split(shuffled, 40):
+        merged.merge(TDigest.from_sorted(np.sort(cell)))
+    estimates = merged.quantile(QUANTILES)
+    assert merged.count == len(packages)
+    assert merged.low == packages[0] and merged.high == packages[-1]
+    assert _rank_error(packages, estimates).max() <= 0.01
@@ -0,0 +1,92 @@
+"""The SQLite store (admitbot.store) against the in-memory catalog it mirrors."""
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from admitbot.catalog import catalog_from_dict
+from admitbot.deadlines import DEADLINES_PATH, calendar_from_dict
+from admitbot.fee_index import ALL_STREAMS, FeeIndex
+from admitbot.placements import PLACEMENTS_PATH
+from admitbot.store import ReadPool, Store, bulk_load
+
+
+def _load(path, catalog_data, version="test"):
+    with open(PLACEMENTS_PATH) as fh:
+        placements = json.load(fh)
+    with open(DEADLINES_PATH) as fh:
+        deadlines = json.load(fh)
+    bulk_load(path, catalog_data, placements, deadlines, version, "test", "test")
+    return placements, deadlines
+
+
+@pytest.fixture
+def db(tmp_path, catalog_data):
+    path = tmp_path / "admitbot.db"
+    placements, deadlines = _load(path, catalog_data)
+    store = Store(path)
+    yield store, placements, deadlines
+    store.close()
+
+
+def test_data_round_trips(db, catalog_data):
+    store, placements, deadlines = db
+    assert store.catalog_data() == catalog_data
+    assert store.placements_data() == placements
+    # One-day events come back as [day, day]
+    assert calendar_from_dict(store.deadlines_data(), "x") == calendar_from_dict(deadlines, "x")
+    assert store.catalog_version == "test"
+
+
+def test_queries_match_the_in_memory_indexes(db, catalog):
+    store, _, _ = db
+    index = FeeIndex(catalog)
+    for low, high in [(0, 10**7), (100_000, 500_000), (250_000, 250_000)]:
+        for stream in [ALL_STREAMS, *catalog.streams]:
+            # Equal fees are ordered by name in SQL; compare as sets within each fee
+            rows = store.programs_in_budget(low, high, stream)
+            assert sorted(map(tuple, rows)) == sorted(index.range(low, high, stream))
+            fees = [catalog.streams[s][c]["annual_fee"] for s, c in rows]
+            assert fees == sorted(fees)
+    for course in [*catalog.fee_structures, "Not a fee course"]:
+        assert store.fee_components(course) == dict(catalog.fees_for(course))
+
+
+def test_reopen_sees_a_rebuilt_database(db, catalog_data):
+    store, _, _ = db
+    _load(store.path, catalog_data, version="rebuilt")
+    assert store.catalog_version == "test"
+    assert store.reopen().catalog_version == "rebuilt"
+    assert catalog_from_dict(store.catalog_data(), "x").streams.keys() == catalog_data["streams"].keys()
+
+
+def test_pool_never_opens_more_than_its_size(db):
+    store, _, _ = db
+    pool = ReadPool(store.path, size=2)
+    borrowed, barrier = [], threading.Barrier(6)
+
+    def borrow():
+        barrier.wait()
+        for _ in range(20):
+            with pool.connection() as conn:
+                borrowed.append(id(conn))
+                conn.execute("SELECT 1").fetchone()
+
+    threads = [threading.Thread(target=borrow) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(borrowed) == 120
+    assert pool._opened <= 2
+    pool.close()
+
+
+def test_failed_connect_gives_its_slot_back(tmp_path):
+    pool = ReadPool(tmp_path / "missing.db", size=1)
+    for _ in range(2):
+        with pytest.raises(sqlite3.OperationalError):
+            with pool.connection():
+                pass
+        assert pool._opened == 0